@@ -0,0 +1,86 @@
+"""Benchmark exact vs Bloom-filter publish history membership.
+
+Fills a history database with synthetic URLs, then compares opening it the
+exact way (every URL loaded into a set) against bloom mode (memory-mapping
+``publish_history.bloom``): startup time, memory allocated, and lookup
+latency for published and unpublished URLs. Run with:
+
+    python benchmarks/history_membership.py [--urls 1000000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sqlite3
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from auto_card_news_v2.feed.history import open_history
+
+_LOOKUPS = 20000
+
+
+def _url(i: int) -> str:
+    return f"https://news{i % 50}.example.com/article/{i}"
+
+
+def fill(path: Path, count: int) -> None:
+    with open_history(history_path=path):
+        pass
+    conn = sqlite3.connect(path)
+    with conn:
+        conn.executemany(
+            "INSERT INTO published VALUES (?, ?, ?, ?, NULL)",
+            ((_url(i), _url(i), 1.7e9 + i, f"news{i % 50}.example.com") for i in range(count)),
+        )
+        conn.execute("INSERT OR REPLACE INTO meta VALUES ('generation', '1')")
+    conn.close()
+
+
+def measure(path: Path, *, bloom: bool, count: int) -> None:
+    hits = [_url(random.randrange(count)) for _ in range(_LOOKUPS)]
+    misses = [f"https://other.example.com/{i}" for i in range(_LOOKUPS)]
+    tracemalloc.start()
+    start = time.perf_counter()
+    with open_history(history_path=path, create=False, bloom=bloom) as history:
+        if not bloom:
+            "https://warm.example.com" in history  # loads the URL map
+        opened = time.perf_counter() - start
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        timings = []
+        for urls in (hits, misses):
+            start = time.perf_counter()
+            found = sum(url in history for url in urls)
+            timings.append(((time.perf_counter() - start) / len(urls) * 1e6, found))
+    (hit_us, hit_found), (miss_us, miss_found) = timings
+    print(
+        f"{'bloom' if bloom else 'exact':>6} {opened * 1000:>9.0f} {memory / 2**20:>9.1f} "
+        f"{hit_us:>8.2f} {miss_us:>8.2f} {miss_found:>6}"
+    )
+    assert hit_found == len(hits)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--urls", type=int, default=1_000_000, help="published URLs")
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "publish_history.db"
+        fill(path, args.urls)
+        start = time.perf_counter()
+        with open_history(history_path=path, bloom=True):
+            pass
+        print(f"{args.urls} URLs; filter build {time.perf_counter() - start:.1f} s, "
+              f"{path.with_suffix('.bloom').stat().st_size / 2**20:.1f} MB on disk")
+        print(f"{'mode':>6} {'open ms':>9} {'heap MB':>9} {'hit us':>8} {'miss us':>8} {'FP':>6}")
+        measure(path, bloom=False, count=args.urls)
+        measure(path, bloom=True, count=args.urls)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Benchmark the strict ElementTree fast path against feedparser.
+
+Times both engines on the test fixture feeds and on synthetic RSS 2.0 feeds
+of increasing size, and checks that they agree item for item. Run with:
+
+    python benchmarks/parse_engines.py [--repeat 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from pathlib import Path
+
+from auto_card_news_v2.feed.parser import _parse_with_feedparser, _parse_with_xml
+
+_FIXTURES = Path(__file__).resolve().parent.parent / "tests" / "feed" / "fixtures"
+_SYNTHETIC_SIZES = (20, 100, 500)
+
+
+def make_feed(items: int) -> bytes:
+    body = "".join(
+        f"<item><title>Story {i} &amp; more</title>"
+        f"<link>https://example.com/{i}</link>"
+        f"<description>&lt;p&gt;Paragraph {i} with &lt;b&gt;markup&lt;/b&gt;.&lt;/p&gt;"
+        f"</description><pubDate>Fri, 30 Jan 2026 08:{i % 60:02d}:00 +0900</pubDate></item>"
+        for i in range(items)
+    )
+    return f'<?xml version="1.0"?><rss version="2.0"><channel>{body}</channel></rss>'.encode()
+
+
+def _time(fn, data: bytes, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn(data)
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--repeat", type=int, default=20, help="parses per measurement")
+    args = ap.parse_args()
+
+    def fast(data: bytes):
+        return _parse_with_xml(data, "", strict=True)
+
+    def slow(data: bytes):
+        return _parse_with_feedparser(data, "")
+
+    cases = [(p.name, p.read_bytes()) for p in sorted(_FIXTURES.glob("*.xml"))]
+    cases += [(f"synthetic-{n}", make_feed(n)) for n in _SYNTHETIC_SIZES]
+
+    print(f"{'feed':<28} {'KB':>7} {'fast ms':>9} {'feedparser ms':>14} {'speedup':>8}  same")
+    for name, data in cases:
+        try:
+            same = "yes" if fast(data) == slow(data) else "NO"
+        except Exception:
+            # Rejected by the strict parser: production falls back to feedparser.
+            print(f"{name:<28} {len(data) / 1024:>7.1f} {'fallback':>9}")
+            continue
+        fast_ms = _time(fast, data, args.repeat)
+        slow_ms = _time(slow, data, args.repeat)
+        print(
+            f"{name:<28} {len(data) / 1024:>7.1f} {fast_ms:>9.2f} {slow_ms:>14.2f} "
+            f"{slow_ms / fast_ms:>7.1f}x  {same}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Benchmark in-process vs process-pool feed parsing.
+
+Parses a batch of synthetic RSS feeds at several body sizes, once in the
+calling process and once through ``feed.parallel.parse_pool``, and reports
+where the pool starts to pay off. Run with:
+
+    python benchmarks/parse_pool.py [--feeds 32] [--workers N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from auto_card_news_v2.feed.parallel import default_workers, parse_pool
+from auto_card_news_v2.feed.parser import ParseStats, parse_feed
+
+_ITEM_COUNTS = (2, 5, 20, 50, 100, 200, 500)
+# Below this the difference is noise, not a win.
+_MIN_SPEEDUP = 1.1
+
+
+def make_feed(items: int, seed: int = 0) -> bytes:
+    body = "".join(
+        f"<item><title>Story {seed}-{i} &amp; more</title>"
+        f"<link>https://example.com/{seed}/{i}</link>"
+        f"<description>&lt;p&gt;Paragraph {i} with some &lt;b&gt;markup&lt;/b&gt; "
+        f"and enough text to look like a real summary line.&lt;/p&gt;</description>"
+        f"<pubDate>Thu, 30 Jan 2026 08:{i % 60:02d}:00 GMT</pubDate></item>"
+        for i in range(items)
+    )
+    return (
+        '<?xml version="1.0"?><rss version="2.0"><channel><title>Bench</title>'
+        f"{body}</channel></rss>"
+    ).encode()
+
+
+def _run(parse, feeds: list[bytes], threads: int) -> float:
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(lambda d: parse(d, "https://example.com/rss", ParseStats()), feeds))
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--feeds", type=int, default=16, help="feeds per batch")
+    ap.add_argument("--workers", type=int, default=default_workers(), help="pool processes")
+    args = ap.parse_args()
+
+    def in_process(data: bytes, url: str, stats: ParseStats):
+        return parse_feed(data, feed_url=url, stats=stats)
+
+    print(f"{args.feeds} feeds per batch, {args.workers} worker processes")
+    print(f"{'items':>6} {'KB/feed':>8} {'in-proc ms':>11} {'pool ms':>9} {'speedup':>8}")
+    rows: list[tuple[float, float]] = []
+    # Keep one pool warm across sizes so the numbers are per-batch, not startup.
+    with parse_pool(args.workers, min_pool_bytes=0) as pooled:
+        _run(pooled, [make_feed(5)] * args.workers, args.workers)
+        for count in _ITEM_COUNTS:
+            feeds = [make_feed(count, seed) for seed in range(args.feeds)]
+            local = _run(in_process, feeds, args.workers)
+            remote = _run(pooled, feeds, args.workers)
+            size_kb = len(feeds[0]) / 1024
+            speedup = local / remote
+            rows.append((size_kb, speedup))
+            print(
+                f"{count:>6} {size_kb:>8.1f} {local * 1000:>11.1f} "
+                f"{remote * 1000:>9.1f} {speedup:>7.2f}x"
+            )
+
+    start = time.perf_counter()
+    with parse_pool(args.workers, min_pool_bytes=0) as pooled:
+        pooled(make_feed(1), "https://example.com/rss", ParseStats())
+    print(f"pool startup: {(time.perf_counter() - start) * 1000:.0f} ms")
+    # Crossover: smallest size from which the pool wins at every larger size.
+    crossover = None
+    for size_kb, speedup in reversed(rows):
+        if speedup < _MIN_SPEEDUP:
+            break
+        crossover = size_kb
+    if crossover is None:
+        print("pool never beat in-process parsing at these sizes")
+    else:
+        print(f"pool wins from ~{crossover:.0f} KB per feed")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,11 @@ DATA_DIR="/home/cardnews/.card-news"
 SEED_FILES="publish_history.json threads_token.json"
 
 for file in $SEED_FILES; do
+    # A legacy JSON history is imported into publish_history.db on first use;
+    # don't seed it again once the database exists.
+    if [ "$file" = "publish_history.json" ] && [ -f "$DATA_DIR/publish_history.db" ]; then
+        continue
+    fi
     if [ -f "$SEED_DIR/$file" ] && [ ! -f "$DATA_DIR/$file" ]; then
         cp "$SEED_DIR/$file" "$DATA_DIR/$file"
         echo "Seeded $file from $SEED_DIR to $DATA_DIR"
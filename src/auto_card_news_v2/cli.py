@@ -5,6 +5,7 @@ from __future__ import annotations
 import argparse
 import json
 import sys
+from dataclasses import replace
 from pathlib import Path
 
 from auto_card_news_v2.config import Settings, load_settings
@@ -48,6 +49,17 @@ def _build_parser() -> argparse.ArgumentParser:
     sched_sub.add_parser("uninstall", help="Remove cron schedule.")
     sched_sub.add_parser("status", help="Show current schedule.")
 
+    feeds = sub.add_parser("feeds", help="Inspect per-feed polling state.")
+    feeds_sub = feeds.add_subparsers(dest="feeds_action")
+    feeds_sub.add_parser("status", help="Show each feed's learned polling interval.")
+    feeds_sub.add_parser("health", help="Show failure counts, circuit breakers and slow feeds.")
+
+    hist = sub.add_parser("history", help="Maintain the publish history.")
+    hist_sub = hist.add_subparsers(dest="history_action")
+    compact = hist_sub.add_parser("compact", help="Archive or drop entries past the retention window.")
+    compact.add_argument("--days", type=int, default=None, help="Retention in days (default: NEWS_HISTORY_RETENTION_DAYS).")
+    compact.add_argument("--drop", action="store_true", help="Delete expired entries instead of archiving them.")
+
     return parser
 
 
@@ -69,6 +81,10 @@ def main(argv: list[str] | None = None) -> None:
         _cmd_run(args)
     elif args.command == "schedule":
         _cmd_schedule(args)
+    elif args.command == "feeds":
+        _cmd_feeds(args)
+    elif args.command == "history":
+        _cmd_history(args)
 
 
 def _cmd_generate(args: argparse.Namespace) -> None:
@@ -78,20 +94,7 @@ def _cmd_generate(args: argparse.Namespace) -> None:
         dry_run=args.dry_run,
     )
     if args.limit is not None:
-        settings = Settings(
-            rss_feeds=settings.rss_feeds,
-            output_dir=settings.output_dir,
-            safety_enabled=settings.safety_enabled,
-            max_items=args.limit,
-            num_cards=settings.num_cards,
-            brand_name=settings.brand_name,
-            brand_handle=settings.brand_handle,
-            dry_run=settings.dry_run,
-            threads_user_id=settings.threads_user_id,
-            cloudinary_cloud_name=settings.cloudinary_cloud_name,
-            cloudinary_api_key=settings.cloudinary_api_key,
-            cloudinary_api_secret=settings.cloudinary_api_secret,
-        )
+        settings = replace(settings, max_items=args.limit)
 
     if not settings.rss_feeds:
         print("Error: No RSS feeds configured. Set NEWS_RSS_FEEDS or use --feeds.")
@@ -206,6 +209,41 @@ def _cmd_schedule(args: argparse.Namespace) -> None:
             sys.exit(1)
 
 
+def _cmd_feeds(args: argparse.Namespace) -> None:
+    import time
+
+    from auto_card_news_v2.feed.cadence import format_cadence_status
+    from auto_card_news_v2.feed.health import format_health_report
+    from auto_card_news_v2.feed.state import load_feed_state
+
+    settings = load_settings()
+    state = load_feed_state()
+
+    if args.feeds_action in (None, "status"):
+        print(format_cadence_status(settings.rss_feeds, state, now=time.time()))
+    elif args.feeds_action == "health":
+        print(format_health_report(
+            settings.rss_feeds, state, now=time.time(), slow_ms=settings.feed_slow_ms,
+        ))
+
+
+def _cmd_history(args: argparse.Namespace) -> None:
+    from auto_card_news_v2.feed.history import compact_history
+
+    if args.history_action != "compact":
+        print("Usage: card-news history compact [--days N] [--drop]")
+        sys.exit(1)
+
+    days = args.days if args.days is not None else load_settings().history_retention_days
+    if days <= 0:
+        print("Error: Retention must be at least 1 day.")
+        sys.exit(1)
+
+    removed = compact_history(retention_days=days, archive=not args.drop)
+    action = "Dropped" if args.drop else "Archived"
+    print(f"{action} {removed} publish history entries older than {days} days.")
+
+
 def _load_post_from_dir(output_path: Path):
     """Reconstruct a ThreadsPost from an output directory."""
     from auto_card_news_v2.models import ThreadsPost
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
+from datetime import timedelta, timezone, tzinfo
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -33,6 +34,31 @@ class Settings:
     priority_domains: tuple[str, ...] = ()
     priority_ratio: int = 8
     daily_total: int = 12
+    fetch_concurrency: int = 8
+    fetch_per_host: int = 2
+    adaptive_polling: bool = True
+    feed_min_interval_minutes: int = 15
+    feed_max_interval_minutes: int = 360
+    feed_slow_ms: int = 5000
+    streaming_parse: bool = False
+    parse_processes: int = 0
+    near_dup_threshold: float = 0.5
+    near_dup_window_hours: int = 48
+    history_retention_days: int = 30
+    history_bloom: bool = False
+    history_journal: bool = False
+    work_queue_path: Path | None = None
+    work_lease_seconds: int = 600
+
+
+def local_timezone(tz_name: str) -> tzinfo:
+    """*tz_name* as a tzinfo, or UTC+9 if it cannot be resolved."""
+    try:
+        from zoneinfo import ZoneInfo
+        return ZoneInfo(tz_name)
+    except (ImportError, KeyError, ValueError):
+        # Fallback for Asia/Seoul (UTC+9)
+        return timezone(timedelta(hours=9))
 
 
 def load_settings(
@@ -73,6 +99,28 @@ def load_settings(
     priority_ratio = int(os.getenv("NEWS_PRIORITY_RATIO", "8"))
     daily_total = int(os.getenv("NEWS_DAILY_TOTAL", "12"))
 
+    fetch_concurrency = int(os.getenv("NEWS_FETCH_CONCURRENCY", "8"))
+    fetch_per_host = int(os.getenv("NEWS_FETCH_PER_HOST", "2"))
+
+    adaptive_str = os.getenv("NEWS_ADAPTIVE_POLLING", "true").lower()
+    adaptive_polling = adaptive_str not in ("false", "0", "no")
+    feed_min_interval_minutes = int(os.getenv("NEWS_FEED_MIN_INTERVAL", "15"))
+    feed_max_interval_minutes = int(os.getenv("NEWS_FEED_MAX_INTERVAL", "360"))
+    feed_slow_ms = int(os.getenv("NEWS_FEED_SLOW_MS", "5000"))
+    streaming_str = os.getenv("NEWS_FEED_STREAMING", "false").lower()
+    streaming_parse = streaming_str in ("true", "1", "yes")
+    parse_processes = int(os.getenv("NEWS_PARSE_PROCESSES", "0"))
+    near_dup_threshold = float(os.getenv("NEWS_NEAR_DUP_THRESHOLD", "0.5"))
+    near_dup_window_hours = int(os.getenv("NEWS_NEAR_DUP_WINDOW_HOURS", "48"))
+    history_retention_days = int(os.getenv("NEWS_HISTORY_RETENTION_DAYS", "30"))
+    history_bloom_str = os.getenv("NEWS_HISTORY_BLOOM", "false").lower()
+    history_bloom = history_bloom_str in ("true", "1", "yes")
+    history_journal_str = os.getenv("NEWS_HISTORY_JOURNAL", "false").lower()
+    history_journal = history_journal_str in ("true", "1", "yes")
+    work_queue_str = os.getenv("NEWS_WORK_QUEUE", "").strip()
+    work_queue_path = Path(work_queue_str).expanduser() if work_queue_str else None
+    work_lease_seconds = int(os.getenv("NEWS_WORK_LEASE_SECONDS", "600"))
+
     return Settings(
         rss_feeds=feeds,
         output_dir=output_dir,
@@ -92,4 +140,19 @@ def load_settings(
         priority_domains=priority_domains,
         priority_ratio=priority_ratio,
         daily_total=daily_total,
+        fetch_concurrency=fetch_concurrency,
+        fetch_per_host=fetch_per_host,
+        adaptive_polling=adaptive_polling,
+        feed_min_interval_minutes=feed_min_interval_minutes,
+        feed_max_interval_minutes=feed_max_interval_minutes,
+        feed_slow_ms=feed_slow_ms,
+        streaming_parse=streaming_parse,
+        parse_processes=parse_processes,
+        near_dup_threshold=near_dup_threshold,
+        near_dup_window_hours=near_dup_window_hours,
+        history_retention_days=history_retention_days,
+        history_bloom=history_bloom,
+        history_journal=history_journal,
+        work_queue_path=work_queue_path,
+        work_lease_seconds=work_lease_seconds,
     )
@@ -1,5 +1,6 @@
 """RSS feed fetching, parsing, and deduplication."""
 
+from auto_card_news_v2.feed.collector import collect_feeds
 from auto_card_news_v2.feed.dedup import deduplicate
 from auto_card_news_v2.feed.fetcher import fetch_feed
 from auto_card_news_v2.feed.history import filter_already_published
@@ -7,6 +8,7 @@ from auto_card_news_v2.feed.parser import parse_feed
 from auto_card_news_v2.feed.prioritizer import prioritize_items
 
 __all__ = [
+    "collect_feeds",
     "fetch_feed",
     "parse_feed",
     "deduplicate",
@@ -0,0 +1,135 @@
+"""Compact, memory-mapped Bloom filter for publish-history membership.
+
+A Bloom filter answers "definitely not present" exactly and "possibly
+present" with a tunable false-positive rate, in about 10 bits per key at
+1% instead of a Python ``str`` per key. The bit array is stored in a small
+binary file and memory-mapped copy-on-write, so opening it costs nothing
+up front and pages are only read when probed.
+
+File layout: a fixed header (magic, version, bit count, hash count, key
+count, generation) followed by the bit array. ``generation`` is opaque to
+this module; the history store uses it to tell whether the filter has
+seen every write.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import mmap
+import os
+import struct
+from pathlib import Path
+
+_MAGIC = b"CNBF"
+_VERSION = 1
+_HEADER = struct.Struct("<4sBxxxQIxxxxQQ")  # magic, version, bits, hashes, count, generation
+
+
+class BloomFilter:
+    """Bloom filter over strings with ``k`` double-hashed probes."""
+
+    def __init__(
+        self,
+        num_bits: int,
+        num_hashes: int,
+        *,
+        bits: bytearray | memoryview | None = None,
+        count: int = 0,
+        generation: int = 0,
+    ) -> None:
+        self.num_bits = num_bits
+        self.num_hashes = num_hashes
+        self.count = count
+        self.generation = generation
+        self._bits = bits if bits is not None else bytearray((num_bits + 7) // 8)
+
+    @classmethod
+    def for_capacity(cls, capacity: int, fp_rate: float = 0.01) -> BloomFilter:
+        """Filter sized for *capacity* keys at false-positive rate *fp_rate*."""
+        capacity = max(capacity, 1)
+        num_bits = max(64, math.ceil(-capacity * math.log(fp_rate) / math.log(2) ** 2))
+        num_hashes = max(1, round(num_bits / capacity * math.log(2)))
+        return cls(num_bits, num_hashes)
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, str):
+            return False
+        bits = self._bits
+        for pos in self._positions(key):
+            if not bits[pos >> 3] & (1 << (pos & 7)):
+                return False
+        return True
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._bits)
+
+    @property
+    def false_positive_rate(self) -> float:
+        """Expected false-positive rate at the current key count."""
+        return (1 - math.exp(-self.num_hashes * self.count / self.num_bits)) ** self.num_hashes
+
+    def add(self, key: str) -> None:
+        bits = self._bits
+        for pos in self._positions(key):
+            bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def save(self, path: Path) -> None:
+        """Write the filter to *path* atomically (see ``locking.write_atomic``)."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            f.write(_HEADER.pack(
+                _MAGIC, _VERSION, self.num_bits, self.num_hashes, self.count, self.generation,
+            ))
+            f.write(self._bits)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: Path) -> BloomFilter | None:
+        """Memory-map the filter at *path*; ``None`` if missing or unreadable.
+
+        The mapping is copy-on-write: ``add`` never touches the file until
+        ``save`` replaces it.
+        """
+        try:
+            with open(path, "rb") as f:
+                header = f.read(_HEADER.size)
+                if len(header) < _HEADER.size:
+                    return None
+                magic, version, num_bits, num_hashes, count, generation = _HEADER.unpack(header)
+                if magic != _MAGIC or version != _VERSION:
+                    return None
+                size = (num_bits + 7) // 8
+                if os.fstat(f.fileno()).st_size != _HEADER.size + size:
+                    return None
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        except (OSError, ValueError, struct.error):
+            return None
+        bits = memoryview(mapped)[_HEADER.size:]
+        return cls(num_bits, num_hashes, bits=bits, count=count, generation=generation)
+
+    def __getstate__(self) -> dict:
+        # Pickled as plain bytes so it can be shipped to parse workers.
+        state = self.__dict__.copy()
+        state["_bits"] = bytes(self._bits)
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        state["_bits"] = bytearray(state["_bits"])
+        self.__dict__.update(state)
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        m = self.num_bits
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % m
@@ -0,0 +1,124 @@
+"""Adaptive per-feed polling schedule learned from observed update cadence."""
+
+from __future__ import annotations
+
+import statistics
+
+from auto_card_news_v2.feed.parser import parse_timestamp
+from auto_card_news_v2.models import FeedFetchResult, FeedItem
+
+_DEFAULT_MIN_INTERVAL_SECONDS = 15 * 60
+_DEFAULT_MAX_INTERVAL_SECONDS = 6 * 60 * 60
+# Feeds due within this window of a tick are polled on that tick rather than
+# waiting a whole extra scheduler interval.
+_DUE_SLACK_SECONDS = 120
+_MAX_GAP_SAMPLES = 20
+_IDLE_BACKOFF = 1.5
+
+
+def due_feeds(
+    urls: tuple[str, ...] | list[str],
+    state: dict[str, dict],
+    *,
+    now: float,
+) -> list[str]:
+    """Return the feeds in *urls* whose next poll is due at *now*."""
+    due: list[str] = []
+    for url in urls:
+        next_due = state.get(url, {}).get("next_due")
+        if next_due is None or next_due <= now + _DUE_SLACK_SECONDS:
+            due.append(url)
+    return due
+
+
+def record_polls(
+    state: dict[str, dict],
+    results: list[FeedFetchResult],
+    *,
+    now: float,
+    min_interval: float = _DEFAULT_MIN_INTERVAL_SECONDS,
+    max_interval: float = _DEFAULT_MAX_INTERVAL_SECONDS,
+) -> None:
+    """Update each polled feed's learned interval and next due time in *state*.
+
+    The interval tracks the median gap between recent item timestamps. A poll
+    that brings nothing newer than the last one stretches the interval by
+    ``_IDLE_BACKOFF``, so quiet feeds drift towards *max_interval* even when
+    they carry no usable dates. Failed polls are left alone.
+    """
+    for result in results:
+        if result.error is not None:
+            continue
+        entry = state.setdefault(result.url, {})
+        previous = entry.get("interval_seconds")
+        newest_seen = entry.get("newest_item_ts")
+
+        timestamps = sorted(
+            (ts for ts in (item_timestamp(i) for i in result.items) if ts is not None),
+            reverse=True,
+        )
+        newest = timestamps[0] if timestamps else None
+        has_new = not result.not_modified and bool(result.items) and (
+            newest is None or newest_seen is None or newest > newest_seen
+        )
+
+        if has_new:
+            interval = _median_gap(timestamps) or previous or min_interval
+        else:
+            interval = (previous or min_interval) * _IDLE_BACKOFF
+
+        interval = max(min_interval, min(max_interval, interval))
+        entry["interval_seconds"] = round(interval)
+        entry["last_polled"] = now
+        entry["next_due"] = now + interval
+        if newest is not None and (newest_seen is None or newest > newest_seen):
+            entry["newest_item_ts"] = newest
+
+
+def item_timestamp(item: FeedItem) -> float | None:
+    """Return the item's publication time as a UTC epoch, if known."""
+    if item.published_ts is not None:
+        return item.published_ts
+    # Items cached before timestamps were parsed at ingest only carry the string.
+    return parse_timestamp(item.published_at)
+
+
+def format_cadence_status(
+    urls: tuple[str, ...] | list[str],
+    state: dict[str, dict],
+    *,
+    now: float,
+) -> str:
+    """Render the learned interval and next due time of each feed."""
+    if not urls:
+        return "No feeds configured."
+
+    lines = ["Feed polling schedule:"]
+    for url in urls:
+        entry = state.get(url, {})
+        interval = entry.get("interval_seconds")
+        next_due = entry.get("next_due")
+        if interval is None or next_due is None:
+            lines.append(f"  {url}\n    not polled yet (due now)")
+            continue
+        wait = next_due - now
+        due = "due now" if wait <= _DUE_SLACK_SECONDS else f"due in {_format_duration(wait)}"
+        lines.append(f"  {url}\n    every {_format_duration(interval)}, {due}")
+    return "\n".join(lines)
+
+
+def _median_gap(timestamps: list[float]) -> float | None:
+    """Median gap in seconds between consecutive newest-first timestamps."""
+    recent = timestamps[: _MAX_GAP_SAMPLES + 1]
+    gaps = [a - b for a, b in zip(recent, recent[1:]) if a > b]
+    if not gaps:
+        return None
+    return statistics.median(gaps)
+
+
+def _format_duration(seconds: float) -> str:
+    minutes = int(round(seconds / 60))
+    if minutes < 60:
+        return f"{minutes}m"
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h{minutes:02d}m" if minutes else f"{hours}h"
@@ -0,0 +1,387 @@
+"""Concurrent fetch-and-parse stage for all configured feeds."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+import xml.etree.ElementTree as ET
+from collections.abc import Callable, Container, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, nullcontext
+from pathlib import Path
+from urllib.parse import urlparse
+
+from auto_card_news_v2.feed.cursor import advance_cursor, cursor_from_state, cursor_to_state
+from auto_card_news_v2.feed.fetcher import fetch_feed_conditional, open_feed_stream
+from auto_card_news_v2.feed.fingerprint import (
+    body_fingerprint,
+    mentions_link,
+    parse_changed_entries,
+)
+from auto_card_news_v2.feed.parallel import parse_pool
+from auto_card_news_v2.feed.urls import canonicalize_url
+from auto_card_news_v2.feed.parser import ParseStats, parse_feed, stream_feed
+from auto_card_news_v2.feed.state import (
+    load_cached_entries,
+    load_cached_items,
+    save_cached_items,
+)
+from auto_card_news_v2.models import FeedCursor, FeedFetchResult, FeedItem
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_MAX_WORKERS = 8
+_DEFAULT_PER_HOST = 2
+
+
+def collect_feeds(
+    urls: tuple[str, ...] | list[str],
+    *,
+    max_workers: int = _DEFAULT_MAX_WORKERS,
+    per_host: int = _DEFAULT_PER_HOST,
+    state: dict[str, dict] | None = None,
+    cache_dir: Path | None = None,
+    streaming: bool = False,
+    item_limit: int | None = None,
+    published: Container[str] | None = None,
+    parse_processes: int = 0,
+) -> list[FeedFetchResult]:
+    """Fetch and parse feeds concurrently.
+
+    At most *max_workers* requests are in flight overall and at most
+    *per_host* against any single host. Each feed is parsed by the worker
+    that fetched it as soon as its bytes arrive. Results are returned in the
+    same order as *urls*, regardless of completion order.
+
+    When *state* (see ``feed.state.load_feed_state``) is given, requests are
+    made conditional on the stored ETag/Last-Modified validators, a 304 reuses
+    the items cached from the last full fetch without parsing, and *state* is
+    updated in place with the validators returned by each server and the
+    parse engine that worked for each feed, which later runs start with.
+    Each body is also fingerprinted: a byte-identical body is treated like a
+    304, and when only some entries changed (say, just ``lastBuildDate``
+    moved) only those entries are parsed (see ``feed.fingerprint``).
+    Otherwise a per-feed cursor (see ``feed.cursor``) stops parsing at the
+    first already-ingested entry of newest-first feeds, and the older items
+    are taken from the cache.
+
+    *published* is a set of normalized already-published URLs (see
+    ``urls.canonicalize_url``); matching entries are dropped during parsing,
+    before any FeedItem is built, and counted in ``skipped_published``.
+
+    With *streaming*, feeds are parsed incrementally as their bytes arrive,
+    and both parsing and the download stop after *item_limit* items that
+    were not already published (or at the cursor). The cursor is ignored
+    while the cached items fill *item_limit*, as the entries behind it may
+    then never have been ingested.
+
+    With *parse_processes* > 0 (full parse only), large feed bodies are
+    parsed in a pool of that many worker processes (see ``feed.parallel``)
+    while the fetch threads keep downloading.
+    """
+    if not urls:
+        return []
+
+    host_limits: dict[str, threading.BoundedSemaphore] = {}
+    for url in urls:
+        host = _host_key(url)
+        if host not in host_limits:
+            host_limits[host] = threading.BoundedSemaphore(max(1, per_host))
+
+    # Submit hosts round-robin so workers blocked on one host's cap do not
+    # starve feeds from other hosts.
+    order = _interleave_by_host(urls)
+    results: list[FeedFetchResult | None] = [None] * len(urls)
+
+    workers = max(1, min(max_workers, len(urls)))
+    use_pool = parse_processes > 0 and not streaming
+    with (
+        parse_pool(parse_processes, published=published) if use_pool else nullcontext()
+    ) as pooled_parse:
+        parse = pooled_parse or _make_parser(streaming, item_limit, published)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="feed") as pool:
+            futures = {
+                idx: pool.submit(
+                    _fetch_one,
+                    urls[idx],
+                    host_limits[_host_key(urls[idx])],
+                    validators=None if state is None else state.get(urls[idx], {}),
+                    cache_dir=cache_dir,
+                    parse=parse,
+                    incremental=not streaming,
+                    streaming=streaming,
+                    item_limit=item_limit,
+                )
+                for idx in order
+            }
+            for idx, future in futures.items():
+                results[idx] = future.result()
+
+    collected = [r for r in results if r is not None]
+    if state is not None:
+        _record_validators(state, collected)
+    return collected
+
+
+def _fetch_one(
+    url: str,
+    host_limit: threading.BoundedSemaphore,
+    *,
+    validators: dict | None = None,
+    cache_dir: Path | None = None,
+    parse: Callable[..., list[FeedItem]] | None = None,
+    incremental: bool = False,
+    streaming: bool = False,
+    item_limit: int | None = None,
+) -> FeedFetchResult:
+    """Fetch and parse a single feed, never raising.
+
+    *validators* is the feed's state entry; ``None`` disables conditional
+    requests, body fingerprinting, the ingest cursor and item caching
+    entirely. *incremental* allows parsing only the entries that changed
+    since the cached fetch. With *streaming*, *parse* is handed the body as
+    it downloads instead of the whole of it, and the body is not
+    fingerprinted; *item_limit* is the limit that parser applies.
+    """
+    use_cache = validators is not None
+    validators = validators or {}
+    start = time.perf_counter()
+    num_bytes = 0
+    stats = ParseStats(engine=validators.get("parse_engine"))
+    cursor = cursor_from_state(validators)
+    previous = None
+    items = None
+    try:
+        with host_limit, ExitStack() as stack:
+            start = time.perf_counter()
+            def fetch(url: str, **kwargs):
+                if streaming:
+                    # Left open so the parser reads the body as it arrives.
+                    return stack.enter_context(open_feed_stream(url, **kwargs))
+                return fetch_feed_conditional(url, **kwargs)
+
+            resp = fetch(
+                url,
+                etag=validators.get("etag"),
+                last_modified=validators.get("last_modified"),
+            )
+            if resp.not_modified:
+                cached = load_cached_items(url, cache_dir=cache_dir)
+                if cached is not None:
+                    latency_ms = (time.perf_counter() - start) * 1000
+                    logger.info("Feed not modified, reusing %d cached items: %s", len(cached), url)
+                    return FeedFetchResult(
+                        url=url,
+                        items=tuple(cached),
+                        latency_ms=latency_ms,
+                        not_modified=True,
+                        etag=resp.etag,
+                        last_modified=resp.last_modified,
+                    )
+                # Validators survived but the item cache did not; refetch in full.
+                resp = fetch(url)
+            if streaming:
+                parse = parse or _make_parser(True, None, None)
+                previous = load_cached_entries(url, cache_dir=cache_dir) if use_cache else None
+                # A cache cut short at item_limit does not hold every entry
+                # behind the cursor, so parse from the top until it refills.
+                use_cursor = previous is not None and (
+                    item_limit is None or len(previous[0]) < item_limit
+                )
+                items = parse(resp, url, stats, cursor=cursor if use_cursor else None)
+                num_bytes = resp.num_bytes
+            else:
+                data = resp.body
+                num_bytes = len(data)
+            wire_bytes = resp.wire_bytes
+        latency_ms = (time.perf_counter() - start) * 1000
+        parse = parse or _make_parser(False, None, None)
+        fingerprint = None
+        delta = None
+        if use_cache and items is None:
+            fingerprint = body_fingerprint(data)
+            previous = load_cached_entries(url, cache_dir=cache_dir)
+            if previous is not None and fingerprint == validators.get("body_sha256"):
+                logger.info(
+                    "Feed body unchanged, reusing %d cached items: %s", len(previous[0]), url,
+                )
+                return FeedFetchResult(
+                    url=url,
+                    items=tuple(previous[0]),
+                    latency_ms=latency_ms,
+                    num_bytes=num_bytes,
+                    wire_bytes=wire_bytes,
+                    not_modified=True,
+                    etag=resp.etag,
+                    last_modified=resp.last_modified,
+                    body_sha256=fingerprint,
+                )
+            if incremental:
+                delta = parse_changed_entries(data, url, parse, stats, previous)
+        entry_map = None
+        if delta is not None:
+            items, entry_map = delta
+        elif items is not None:
+            if stats.stopped_at_cursor:
+                items = _merge_with_cached(items, previous[0])
+        else:
+            # The cursor is only usable with cached items to stand in for
+            # the part of the feed it lets us skip.
+            items = parse(data, url, stats, cursor=cursor if previous else None)
+            if stats.stopped_at_cursor:
+                items = _merge_with_cached(items, previous[0], listed=data)
+        new_cursor = advance_cursor(items, cursor) if use_cache else None
+        if use_cache:
+            save_cached_items(url, items, entries=entry_map, cache_dir=cache_dir)
+    except Exception as exc:
+        latency_ms = (time.perf_counter() - start) * 1000
+        return FeedFetchResult(
+            url=url,
+            latency_ms=latency_ms,
+            num_bytes=num_bytes,
+            error=str(exc) or exc.__class__.__name__,
+        )
+
+    logger.info(
+        "Fetched %s: %d bytes (%d on the wire) in %.0f ms, %d items "
+        "(%d already published, %d entries unchanged%s)",
+        url, num_bytes, wire_bytes, latency_ms, len(items),
+        stats.skipped_published, stats.reused_entries,
+        ", stopped at cursor" if stats.stopped_at_cursor else "",
+    )
+    return FeedFetchResult(
+        url=url,
+        items=tuple(items),
+        latency_ms=latency_ms,
+        num_bytes=num_bytes,
+        wire_bytes=wire_bytes,
+        skipped_published=stats.skipped_published,
+        parse_engine=stats.engine,
+        etag=resp.etag,
+        last_modified=resp.last_modified,
+        body_sha256=fingerprint,
+        cursor=new_cursor,
+    )
+
+
+def _merge_with_cached(
+    new: list[FeedItem], cached: list[FeedItem], *, listed: bytes | None = None,
+) -> list[FeedItem]:
+    """Prepend freshly parsed items to the cached tail the cursor skipped.
+
+    The cache holds only unpublished items, so its length says nothing about
+    the feed's window. With *listed* (the whole body), cached items whose
+    link the body no longer contains have dropped out of the feed and are
+    let go; the rest stay candidates. A streamed body is never whole, so
+    its cache is kept as is and refilled from the top at the item limit.
+    """
+    seen = {canonicalize_url(i.url) for i in new}
+    return new + [
+        i for i in cached
+        if canonicalize_url(i.url) not in seen
+        and (listed is None or mentions_link(listed, i.url))
+    ]
+
+
+def _make_parser(
+    streaming: bool,
+    item_limit: int | None,
+    published: Container[str] | None,
+) -> Callable[..., list[FeedItem]]:
+    """Return the per-feed ``parse(data, url, stats, cursor=None)`` for the chosen mode."""
+
+    def parse_full(
+        data: bytes, url: str, stats: ParseStats, cursor: FeedCursor | None = None,
+    ) -> list[FeedItem]:
+        return parse_feed(data, feed_url=url, published=published, stats=stats, cursor=cursor)
+
+    if not streaming:
+        return parse_full
+
+    def parse(
+        data: bytes | Iterable[bytes],
+        url: str,
+        stats: ParseStats,
+        cursor: FeedCursor | None = None,
+    ) -> list[FeedItem]:
+        chunks = _RecordedChunks(data)
+        try:
+            return list(stream_feed(
+                chunks,
+                feed_url=url,
+                limit=item_limit,
+                published=published,
+                stats=stats,
+                cursor=cursor,
+            ))
+        except ET.ParseError:
+            # Malformed XML: let the lenient full parser have a go instead.
+            logger.info("Streaming parse failed, falling back to full parse: %s", url)
+            stats.entries = stats.skipped_published = 0
+            stats.stopped_at_cursor = False
+            items = parse_full(chunks.read_all(), url, stats, cursor)
+            return items[:item_limit] if item_limit is not None else items
+
+    return parse
+
+
+class _RecordedChunks:
+    """Iterates body chunks, keeping those already read for a fallback parse."""
+
+    def __init__(self, data: bytes | Iterable[bytes]) -> None:
+        self._source = iter([bytes(data)] if isinstance(data, (bytes, bytearray, memoryview)) else data)
+        self._seen: list[bytes] = []
+
+    def __iter__(self) -> Iterator[bytes]:
+        for chunk in self._source:
+            self._seen.append(chunk)
+            yield chunk
+
+    def read_all(self) -> bytes:
+        """Everything read so far plus the rest of the body."""
+        return b"".join(self._seen) + b"".join(self._source)
+
+
+def _record_validators(state: dict[str, dict], results: list[FeedFetchResult]) -> None:
+    """Store each successful response's cache validators and parse engine in *state*."""
+    for result in results:
+        if result.error is not None:
+            continue
+        entry = state.setdefault(result.url, {})
+        if result.parse_engine is not None:
+            entry["parse_engine"] = result.parse_engine
+        if result.body_sha256 is not None:
+            entry["body_sha256"] = result.body_sha256
+        if result.cursor is not None:
+            entry["cursor"] = cursor_to_state(result.cursor)
+        for key in ("etag", "last_modified"):
+            value = getattr(result, key)
+            if value:
+                entry[key] = value
+            else:
+                entry.pop(key, None)
+
+
+def _host_key(url: str) -> str:
+    try:
+        return (urlparse(url).hostname or "").lower()
+    except ValueError:
+        return ""
+
+
+def _interleave_by_host(urls: tuple[str, ...] | list[str]) -> list[int]:
+    """Return indices of *urls* ordered round-robin across hosts."""
+    buckets: dict[str, list[int]] = {}
+    for idx, url in enumerate(urls):
+        buckets.setdefault(_host_key(url), []).append(idx)
+
+    order: list[int] = []
+    queues = list(buckets.values())
+    depth = 0
+    while len(order) < len(urls):
+        for queue in queues:
+            if depth < len(queue):
+                order.append(queue[depth])
+        depth += 1
+    return order
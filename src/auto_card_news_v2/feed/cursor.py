@@ -0,0 +1,64 @@
+"""Per-feed ingest cursor so each run only parses entries newer than the last.
+
+For a feed that lists entries newest-first, everything from the entry the
+cursor points at (or anything older than its timestamp) onwards was already
+ingested, so parsing can stop there. Whether a feed is newest-first is
+learned from its timestamps, and the cursor is only trusted while that holds;
+out-of-order feeds are always parsed in full.
+"""
+
+from __future__ import annotations
+
+from auto_card_news_v2.feed.urls import canonicalize_url
+from auto_card_news_v2.models import FeedCursor, FeedItem
+
+
+def cursor_from_state(entry: dict) -> FeedCursor | None:
+    """Read the cursor stored in a feed's state entry, if any."""
+    raw = entry.get("cursor")
+    if not isinstance(raw, dict) or not raw.get("newest_url"):
+        return None
+    ts = raw.get("newest_ts")
+    return FeedCursor(
+        # Re-canonicalized: cursors saved by older versions used a looser key.
+        newest_url=canonicalize_url(raw["newest_url"]),
+        newest_ts=float(ts) if isinstance(ts, (int, float)) else None,
+        ordered=bool(raw.get("ordered")),
+    )
+
+
+def cursor_to_state(cursor: FeedCursor) -> dict:
+    return {
+        "newest_url": cursor.newest_url,
+        "newest_ts": cursor.newest_ts,
+        "ordered": cursor.ordered,
+    }
+
+
+def reached_cursor(cursor: FeedCursor | None, link: str, ts: float | None) -> bool:
+    """True if an entry is at or behind *cursor* in a newest-first feed."""
+    if cursor is None or not cursor.ordered:
+        return False
+    if link and canonicalize_url(link) == cursor.newest_url:
+        return True
+    return ts is not None and cursor.newest_ts is not None and ts < cursor.newest_ts
+
+
+def advance_cursor(items: list[FeedItem], previous: FeedCursor | None = None) -> FeedCursor | None:
+    """Return the cursor for a feed whose current items (document order) are *items*."""
+    if not items:
+        return previous
+    stamps = [i.published_ts for i in items if i.published_ts is not None]
+    ordered = len(stamps) >= 2 and all(a >= b for a, b in zip(stamps, stamps[1:]))
+    if ordered or not stamps:
+        newest = items[0]
+    else:
+        newest = max(
+            (i for i in items if i.published_ts is not None),
+            key=lambda i: i.published_ts,
+        )
+    return FeedCursor(
+        newest_url=canonicalize_url(newest.url),
+        newest_ts=max(stamps) if stamps else None,
+        ordered=ordered,
+    )
@@ -2,16 +2,28 @@
 
 from __future__ import annotations
 
+from auto_card_news_v2.feed.urls import CanonicalStats, canonicalize_url, legacy_url_key
 from auto_card_news_v2.models import FeedItem
 
 
-def deduplicate(items: list[FeedItem]) -> list[FeedItem]:
-    """Remove duplicate feed items by URL, preserving order."""
+def deduplicate(
+    items: list[FeedItem],
+    *,
+    stats: CanonicalStats | None = None,
+) -> list[FeedItem]:
+    """Remove duplicate feed items by canonical URL, preserving order."""
     seen: set[str] = set()
+    seen_legacy: set[str] = set()
     result: list[FeedItem] = []
     for item in items:
-        normalized = item.url.rstrip("/").lower()
-        if normalized not in seen:
-            seen.add(normalized)
+        key = canonicalize_url(item.url)
+        legacy = legacy_url_key(item.url)
+        if key not in seen:
+            seen.add(key)
             result.append(item)
+        elif stats is not None:
+            stats.duplicates += 1
+            if legacy in seen_legacy:
+                stats.legacy_duplicates += 1
+        seen_legacy.add(legacy)
     return result
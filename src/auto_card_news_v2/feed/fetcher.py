@@ -2,22 +2,213 @@
 
 from __future__ import annotations
 
-import ssl
-import urllib.request
+import zlib
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
 
-try:
-    import certifi
+from auto_card_news_v2 import transport
 
-    _SSL_CONTEXT = ssl.create_default_context(cafile=certifi.where())
-except ImportError:
-    _SSL_CONTEXT = ssl.create_default_context()
-
-_TIMEOUT_SECONDS = 15
+_TIMEOUT_SECONDS = transport.DEFAULT_TIMEOUT_SECONDS
 _USER_AGENT = "auto-card-news-v2/0.1 (+https://github.com/auto-card-news)"
+_ACCEPT_ENCODING = "gzip, deflate"
+_CHUNK_SIZE = 64 * 1024
+_MAX_BODY_BYTES = 16 * 1024 * 1024
+
+
+class FeedTooLargeError(ValueError):
+    """Decoded feed body exceeded the configured size limit."""
+
+
+@dataclass(frozen=True)
+class FetchResponse:
+    """Raw feed response plus the cache validators the server returned.
+
+    ``body`` is always the decoded payload; ``wire_bytes`` is what actually
+    crossed the network (smaller than ``len(body)`` when compressed).
+    """
+
+    status: int
+    body: bytes = b""
+    etag: str | None = None
+    last_modified: str | None = None
+    wire_bytes: int = 0
+
+    @property
+    def not_modified(self) -> bool:
+        return self.status == 304
 
 
 def fetch_feed(url: str, *, timeout: int = _TIMEOUT_SECONDS) -> bytes:
-    """Fetch raw bytes from a feed URL with SSL and timeout."""
-    req = urllib.request.Request(url, headers={"User-Agent": _USER_AGENT})
-    with urllib.request.urlopen(req, timeout=timeout, context=_SSL_CONTEXT) as resp:
-        return resp.read()  # type: ignore[no-any-return]
+    """Fetch raw bytes from a feed URL over the shared pooled transport."""
+    return fetch_feed_conditional(url, timeout=timeout).body
+
+
+def fetch_feed_conditional(
+    url: str,
+    *,
+    etag: str | None = None,
+    last_modified: str | None = None,
+    timeout: int = _TIMEOUT_SECONDS,
+    max_bytes: int = _MAX_BODY_BYTES,
+) -> FetchResponse:
+    """Fetch a feed, sending ``If-None-Match``/``If-Modified-Since`` when known.
+
+    gzip/deflate transfer encoding is negotiated and decoded incrementally;
+    a body that decodes to more than *max_bytes* raises ``FeedTooLargeError``.
+    A ``304 Not Modified`` answer is returned as a response with an empty
+    body; other 4xx/5xx answers raise ``transport.HTTPStatusError``.
+    """
+    with open_feed_stream(
+        url, etag=etag, last_modified=last_modified, timeout=timeout, max_bytes=max_bytes,
+    ) as stream:
+        body = stream.read()
+        return FetchResponse(
+            status=stream.status,
+            body=body,
+            etag=stream.etag,
+            last_modified=stream.last_modified,
+            wire_bytes=stream.wire_bytes,
+        )
+
+
+@contextmanager
+def open_feed_stream(
+    url: str,
+    *,
+    etag: str | None = None,
+    last_modified: str | None = None,
+    timeout: int = _TIMEOUT_SECONDS,
+    max_bytes: int = _MAX_BODY_BYTES,
+) -> Iterator[FeedStream]:
+    """Like ``fetch_feed_conditional``, but yield the body unread.
+
+    Iterating the ``FeedStream`` reads and decodes the body chunk by chunk;
+    leaving the ``with`` block before the end closes the connection, so a
+    consumer that stops early does not download the rest.
+    """
+    headers = {"User-Agent": _USER_AGENT, "Accept-Encoding": _ACCEPT_ENCODING}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+
+    with transport.stream("GET", url, headers=headers, timeout=timeout) as resp:
+        if resp.status == 304:
+            yield FeedStream(
+                304,
+                etag=resp.headers.get("ETag") or etag,
+                last_modified=resp.headers.get("Last-Modified") or last_modified,
+            )
+            return
+        if resp.status >= 400:
+            raise transport.HTTPStatusError(resp.status, resp.read(), resp.headers, url)
+
+        encoding = (resp.headers.get("Content-Encoding") or "").strip().lower()
+        if encoding not in ("", "identity", "gzip", "x-gzip", "deflate"):
+            raise ValueError(f"Unsupported Content-Encoding: {encoding}")
+        yield FeedStream(
+            resp.status,
+            etag=resp.headers.get("ETag"),
+            last_modified=resp.headers.get("Last-Modified"),
+            resp=resp,
+            encoding=encoding,
+            max_bytes=max_bytes,
+        )
+
+
+class FeedStream:
+    """Feed response whose decoded body is consumed by iterating it.
+
+    ``num_bytes`` and ``wire_bytes`` count the decoded and on-the-wire bytes
+    read so far.
+    """
+
+    def __init__(
+        self,
+        status: int,
+        *,
+        etag: str | None = None,
+        last_modified: str | None = None,
+        resp=None,
+        encoding: str = "",
+        max_bytes: int = _MAX_BODY_BYTES,
+    ) -> None:
+        self.status = status
+        self.etag = etag
+        self.last_modified = last_modified
+        self.num_bytes = 0
+        self.wire_bytes = 0
+        self._resp = resp
+        self._max_bytes = max_bytes
+        self._decoder = (
+            _Decoder(encoding, max_bytes=max_bytes)
+            if encoding in ("gzip", "x-gzip", "deflate") else None
+        )
+
+    @property
+    def not_modified(self) -> bool:
+        return self.status == 304
+
+    def __iter__(self) -> Iterator[bytes]:
+        if self._resp is None:
+            return
+        while True:
+            chunk = self._resp.read(_CHUNK_SIZE)
+            if not chunk:
+                break
+            self.wire_bytes += len(chunk)
+            if self._decoder is not None:
+                chunk = self._decoder.feed(chunk)
+            yield self._count(chunk)
+        if self._decoder is not None:
+            yield self._count(self._decoder.flush())
+
+    def read(self) -> bytes:
+        """The rest of the decoded body."""
+        return b"".join(self)
+
+    def _count(self, chunk: bytes) -> bytes:
+        self.num_bytes += len(chunk)
+        if self.num_bytes > self._max_bytes:
+            raise FeedTooLargeError(f"Feed body exceeds {self._max_bytes} bytes")
+        return chunk
+
+
+class _Decoder:
+    """Incremental gzip/deflate decoder that never inflates past a limit."""
+
+    def __init__(self, encoding: str, *, max_bytes: int) -> None:
+        self._max_bytes = max_bytes
+        self._produced = 0
+        self._obj: zlib._Decompress | None = None
+        if encoding != "deflate":
+            self._obj = zlib.decompressobj(16 + zlib.MAX_WBITS)
+
+    def feed(self, chunk: bytes) -> bytes:
+        if self._obj is None:
+            # "deflate" is meant to be zlib-wrapped, but some servers send a
+            # raw deflate stream; sniff the zlib header to tell them apart.
+            is_zlib = len(chunk) >= 2 and (chunk[0] & 0x0F) == 8 and (
+                (chunk[0] << 8) | chunk[1]
+            ) % 31 == 0
+            self._obj = zlib.decompressobj(zlib.MAX_WBITS if is_zlib else -zlib.MAX_WBITS)
+
+        out: list[bytes] = []
+        data = chunk
+        while data:
+            # Bound each step so a decompression bomb is caught as soon as it
+            # crosses the limit rather than after inflating the whole chunk.
+            budget = self._max_bytes - self._produced + 1
+            piece = self._obj.decompress(data, max(budget, 1))
+            self._produced += len(piece)
+            out.append(piece)
+            if self._produced > self._max_bytes:
+                break
+            data = self._obj.unconsumed_tail
+        return b"".join(out)
+
+    def flush(self) -> bytes:
+        if self._obj is None:
+            return b""
+        return self._obj.flush()
@@ -0,0 +1,130 @@
+"""Raw feed body fingerprints, used to skip re-parsing unchanged content.
+
+Plenty of servers ignore conditional requests yet serve the same XML poll
+after poll, or the same entries under a new ``lastBuildDate``. A whole-body
+fingerprint catches the first case; per-entry fingerprints over the raw
+``<item>``/``<entry>`` bytes catch the second, so only entries that actually
+changed are parsed, all in one go.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from collections.abc import Callable
+from xml.sax.saxutils import escape
+
+from auto_card_news_v2.feed.parser import ParseStats
+from auto_card_news_v2.models import FeedItem
+
+_ENTRY_RE = re.compile(rb"<(item|entry)[\s>].*?</\1\s*>", re.DOTALL)
+
+EntryMap = dict[str, int | None]
+
+
+def body_fingerprint(data: bytes) -> str:
+    """Hex digest identifying a raw feed body."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def split_entries(data: bytes) -> tuple[bytes, list[bytes], bytes] | None:
+    """Split *data* into (head, raw entries, tail).
+
+    Returns ``None`` unless the entries form one contiguous run separated
+    only by whitespace, which is the case for ordinary RSS 2.0 and Atom;
+    anything odder (prefixed tags, markup between entries, ``</item>`` inside
+    CDATA) is left to a full parse.
+    """
+    matches = list(_ENTRY_RE.finditer(data))
+    if not matches:
+        return None
+    for prev, nxt in zip(matches, matches[1:]):
+        if data[prev.end():nxt.start()].strip():
+            return None
+    head = data[:matches[0].start()]
+    tail = data[matches[-1].end():]
+    return head, [m.group(0) for m in matches], tail
+
+
+def entry_fingerprint(raw: bytes) -> str:
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+def parse_changed_entries(
+    data: bytes,
+    url: str,
+    parse: Callable[[bytes, str, ParseStats], list[FeedItem]],
+    stats: ParseStats,
+    previous: tuple[list[FeedItem], EntryMap] | None,
+) -> tuple[list[FeedItem], EntryMap] | None:
+    """Parse only the entries of *data* not seen in *previous*.
+
+    *previous* is the cached (items, entry map) from the last fetch. Known
+    entries reuse their cached item; the new ones are parsed together in a
+    single document wrapped in the original head and tail, so namespaces
+    still resolve and a pooled *parse* sees one body. Without a previous map,
+    or when most entries changed, every entry is parsed that way, which also
+    builds the map for the next fetch. Returns the items in document order
+    plus the new entry map, or ``None`` when *data* cannot be split (the
+    caller should parse it whole).
+    """
+    split = split_entries(data)
+    if split is None:
+        return None
+    head, raw_entries, tail = split
+    old_items, old_map = previous if previous is not None else ([], {})
+
+    entries: dict[str, bytes] = {}
+    for raw in raw_entries:
+        entries.setdefault(entry_fingerprint(raw), raw)  # drops in-body duplicates
+    changed = [fp for fp in entries if fp not in old_map]
+    if 2 * len(changed) > len(entries):
+        changed = list(entries)
+
+    parsed = parse(head + b"".join(entries[fp] for fp in changed) + tail, url, stats)
+    found = _attribute(parsed, [entries[fp] for fp in changed])
+    if found is None:
+        if len(changed) < len(entries):
+            return None
+        # Nothing to reuse anyway: keep the parse, just without a map.
+        return parsed, {}
+    by_fp = dict(zip(changed, found))
+
+    items: list[FeedItem] = []
+    entry_map: EntryMap = {}
+    for fp in entries:
+        if fp in by_fp:
+            item = by_fp[fp]
+        else:
+            idx = old_map[fp]
+            item = None if idx is None else old_items[idx]
+        entry_map[fp] = None if item is None else len(items)
+        if item is not None:
+            items.append(item)
+
+    stats.reused_entries += len(entries) - len(changed)
+    return items, entry_map
+
+
+def _attribute(items: list[FeedItem], raw_entries: list[bytes]) -> list[FeedItem | None] | None:
+    """Pair each raw entry with the item parsed from it, or ``None``.
+
+    Items come back in document order and each entry yields at most one, so
+    an item belongs to the next entry that contains its link. Returns
+    ``None`` if some item cannot be placed (say, a link the parser resolved).
+    """
+    found: list[FeedItem | None] = []
+    pending = iter(items)
+    item = next(pending, None)
+    for raw in raw_entries:
+        if item is not None and mentions_link(raw, item.url):
+            found.append(item)
+            item = next(pending, None)
+        else:
+            found.append(None)
+    return found if item is None else None
+
+
+def mentions_link(raw: bytes, link: str) -> bool:
+    """True if *link* appears in *raw* feed bytes, plain or XML-escaped."""
+    return link.encode() in raw or escape(link).encode() in raw
@@ -0,0 +1,118 @@
+"""Per-feed health tracking and exponential-backoff circuit breaker."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from auto_card_news_v2.models import FeedFetchResult
+
+_BASE_BACKOFF_SECONDS = 5 * 60
+_MAX_BACKOFF_SECONDS = 24 * 60 * 60
+_LATENCY_ALPHA = 0.3
+_DEFAULT_SLOW_MS = 5000.0
+# Need a few samples before calling a feed consistently slow.
+_MIN_LATENCY_SAMPLES = 3
+
+
+def record_health(
+    state: dict[str, dict],
+    results: list[FeedFetchResult],
+    *,
+    now: float,
+) -> None:
+    """Update failure counters, latency average and breaker state in *state*.
+
+    A failed fetch opens the feed's circuit for ``5m * 2**(failures - 1)``,
+    capped at 24h. Any success closes it and resets the failure count.
+    """
+    for result in results:
+        entry = state.setdefault(result.url, {})
+        if result.error is None:
+            samples = entry.get("latency_samples", 0)
+            avg = entry.get("avg_latency_ms")
+            if avg is None:
+                avg = result.latency_ms
+            else:
+                avg = _LATENCY_ALPHA * result.latency_ms + (1 - _LATENCY_ALPHA) * avg
+            entry["avg_latency_ms"] = round(avg, 1)
+            entry["latency_samples"] = samples + 1
+            entry["consecutive_failures"] = 0
+            entry["last_success"] = now
+            entry.pop("open_until", None)
+            entry.pop("last_error", None)
+            continue
+
+        failures = entry.get("consecutive_failures", 0) + 1
+        backoff = min(_MAX_BACKOFF_SECONDS, _BASE_BACKOFF_SECONDS * 2 ** (failures - 1))
+        entry["consecutive_failures"] = failures
+        entry["last_failure"] = now
+        entry["last_error"] = result.error
+        entry["open_until"] = now + backoff
+
+
+def is_circuit_open(entry: dict, *, now: float) -> bool:
+    """True while a failing feed is still cooling down."""
+    open_until = entry.get("open_until")
+    return open_until is not None and now < open_until
+
+
+def split_open_circuits(
+    urls: tuple[str, ...] | list[str],
+    state: dict[str, dict],
+    *,
+    now: float,
+) -> tuple[list[str], list[str]]:
+    """Partition *urls* into (fetchable, cooling_down)."""
+    allowed: list[str] = []
+    skipped: list[str] = []
+    for url in urls:
+        if is_circuit_open(state.get(url, {}), now=now):
+            skipped.append(url)
+        else:
+            allowed.append(url)
+    return allowed, skipped
+
+
+def format_health_report(
+    urls: tuple[str, ...] | list[str],
+    state: dict[str, dict],
+    *,
+    now: float,
+    slow_ms: float = _DEFAULT_SLOW_MS,
+) -> str:
+    """Render per-feed health, flagging open circuits and slow feeds."""
+    if not urls:
+        return "No feeds configured."
+
+    lines = ["Feed health:"]
+    for url in urls:
+        entry = state.get(url, {})
+        flags: list[str] = []
+        if is_circuit_open(entry, now=now):
+            flags.append(f"CIRCUIT OPEN until {_format_ts(entry['open_until'])}")
+        avg = entry.get("avg_latency_ms")
+        if (
+            avg is not None
+            and avg >= slow_ms
+            and entry.get("latency_samples", 0) >= _MIN_LATENCY_SAMPLES
+        ):
+            flags.append("SLOW")
+
+        lines.append(f"  {url}" + (f"  [{', '.join(flags)}]" if flags else ""))
+        if not entry.get("last_success") and not entry.get("last_failure"):
+            lines.append("    no fetches recorded")
+            continue
+
+        last_success = entry.get("last_success")
+        lines.append(
+            f"    failures in a row: {entry.get('consecutive_failures', 0)}, "
+            f"last success: {_format_ts(last_success) if last_success else 'never'}, "
+            f"avg latency: {f'{avg:.0f} ms' if avg is not None else 'n/a'}"
+        )
+        if entry.get("last_error") and entry.get("consecutive_failures"):
+            lines.append(f"    last error: {entry['last_error']}")
+    return "\n".join(lines)
+
+
+def _format_ts(ts: float) -> str:
+    return datetime.fromtimestamp(ts, tz=timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
@@ -1,79 +1,717 @@
-"""Persistent publish history to prevent cross-run duplicate publishing."""
+"""Persistent publish history to prevent cross-run duplicate publishing.
+
+Stored in SQLite (WAL journal) so recording a URL is a single indexed
+insert rather than a rewrite of the whole history, and a crash mid-run
+cannot truncate it. A ``publish_history.json`` left by older versions next
+to the database is imported once, on first open. A run opens the history
+once as a ``HistoryIndex`` and answers its lookups from memory.
+
+For very large histories, bloom mode keeps only a memory-mapped Bloom
+filter of the published URLs (``publish_history.bloom``) instead: a miss is
+answered without touching the database, a possible hit is confirmed with
+one indexed lookup.
+
+A run commits its URLs once, when it ends. With the optional journal each
+URL is also appended (and fsynced) to a per-run
+``publish_history.<host>-<pid>-<token>.journal`` as it is recorded, so a run killed before that commit loses nothing. A run
+keeps its journal locked while alive; journals nobody holds were left by a
+run that died and are replayed into the database by the next open.
+
+Several instances may share one history. SQLite serializes their writes,
+and the end-of-run flush (commit plus filter save) runs under the history's
+advisory file lock.
+"""
 
 from __future__ import annotations
 
 import json
 import logging
-from datetime import datetime, timezone
+import os
+import secrets
+import socket
+import sqlite3
+import threading
+from collections.abc import Container, Iterable, Iterator
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
+from auto_card_news_v2.config import local_timezone
+from auto_card_news_v2.feed.bloom import BloomFilter
+from auto_card_news_v2.feed.urls import (
+    CanonicalStats,
+    canonical_host,
+    canonicalize_url,
+    legacy_url_key,
+)
+from auto_card_news_v2.locking import file_lock, try_lock
 from auto_card_news_v2.models import FeedItem
 
 logger = logging.getLogger(__name__)
 
 _HISTORY_DIR = Path.home() / ".card-news"
-_HISTORY_FILE = _HISTORY_DIR / "publish_history.json"
+_HISTORY_FILE = _HISTORY_DIR / "publish_history.db"
+
+# The filter is sized for twice the current history and rebuilt once it
+# has filled up enough to exceed twice its target false-positive rate.
+_BLOOM_FP_RATE = 0.01
+_BLOOM_MIN_CAPACITY = 1024
+
+# url: canonical URL. stored_url: the key as first recorded (older JSON
+# histories used a looser normalization). host: canonical host, for the
+# prioritizer's per-domain counts. fingerprint: JSON token list of the
+# published item, see neardup.story_fingerprint. Entries past the
+# retention window move to ``archived``, which runs never read. The meta
+# ``generation`` counter is bumped by every write that adds URLs, so a Bloom
+# filter stamped with an older generation is known to be missing some.
+# daily_counts holds published-URL counts per local day and host for each
+# timezone in counter_zones, kept current by every flush from ``since`` on,
+# so the prioritizer's "today" is a primary-key lookup.
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS published (
+    url TEXT PRIMARY KEY,
+    stored_url TEXT NOT NULL,
+    published_at REAL NOT NULL,
+    host TEXT NOT NULL DEFAULT '',
+    fingerprint TEXT
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS published_at_idx ON published (published_at);
+CREATE TABLE IF NOT EXISTS archived (
+    url TEXT PRIMARY KEY,
+    stored_url TEXT NOT NULL,
+    published_at REAL NOT NULL,
+    host TEXT NOT NULL DEFAULT '',
+    fingerprint TEXT
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS counter_zones (tz TEXT PRIMARY KEY, since REAL NOT NULL);
+CREATE TABLE IF NOT EXISTS daily_counts (
+    tz TEXT NOT NULL,
+    day TEXT NOT NULL,
+    host TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (tz, day, host)
+) WITHOUT ROWID;
+"""
 
 
 def _history_path() -> Path:
-    """Return the history file path (test-friendly seam)."""
+    """Return the history database path (test-friendly seam)."""
     return _HISTORY_FILE
 
 
-def load_history(*, history_path: Path | None = None) -> set[str]:
-    """Load published URL set from disk."""
-    path = history_path or _history_path()
-    if not path.exists():
-        return set()
+def _legacy_json_path(path: Path) -> Path:
+    return path.with_suffix(".json")
 
-    try:
-        data = json.loads(path.read_text(encoding="utf-8"))
-    except (json.JSONDecodeError, OSError):
-        logger.warning("Corrupted history file, starting fresh")
-        return set()
 
-    urls = data.get("urls", {})
-    return set(urls.keys())
+def _bloom_path(path: Path) -> Path:
+    return path.with_suffix(".bloom")
+
 
+def _journal_path(path: Path) -> Path:
+    # Containers sharing ~/.card-news all run as PID 1, and may share a
+    # hostname too; the random token keeps their journals apart.
+    run_id = f"{socket.gethostname()}-{os.getpid()}-{secrets.token_hex(4)}"
+    return path.with_name(f"{path.stem}.{run_id}.journal")
 
-def save_url(url: str, *, history_path: Path | None = None) -> None:
-    """Append a single published URL to the history file."""
+
+@contextmanager
+def _open(history_path: Path | None, *, create: bool = True) -> Iterator[sqlite3.Connection | None]:
+    """Connection to the history database, migrating a legacy JSON file first.
+
+    Yields ``None`` when there is no history yet and *create* is false. A
+    file that is not a usable database is moved aside and replaced.
+    """
     path = history_path or _history_path()
+    if not create and not path.exists() and not _legacy_json_path(path).exists():
+        yield None
+        return
     path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        conn = _connect(path)
+    except sqlite3.DatabaseError:
+        corrupt = path.with_name(path.name + ".corrupt")
+        logger.warning("Corrupted history database, moved to %s and starting fresh", corrupt)
+        path.replace(corrupt)
+        conn = _connect(path)
+    try:
+        with conn:
+            yield conn
+    finally:
+        conn.close()
+
+
+def _connect(path: Path) -> sqlite3.Connection:
+    conn = sqlite3.connect(path, check_same_thread=False)
+    try:
+        conn.execute("PRAGMA journal_mode=WAL")
+        # A run commits once, so making that commit durable costs one fsync.
+        conn.execute("PRAGMA synchronous=FULL")
+        conn.executescript(_SCHEMA)
+        with conn:
+            _migrate_json(conn, _legacy_json_path(path))
+    except sqlite3.DatabaseError:
+        conn.close()
+        raise
+    return conn
+
 
-    urls: dict[str, str] = {}
-    if path.exists():
+def _migrate_json(conn: sqlite3.Connection, json_path: Path) -> None:
+    """Import a pre-SQLite ``publish_history.json`` once."""
+    if conn.execute("SELECT 1 FROM meta WHERE key = 'json_migrated'").fetchone():
+        return
+    rows: dict[str, tuple] = {}
+    if json_path.exists():
         try:
-            data = json.loads(path.read_text(encoding="utf-8"))
-            urls = data.get("urls", {})
+            data = json.loads(json_path.read_text(encoding="utf-8"))
         except (json.JSONDecodeError, OSError):
-            logger.warning("Corrupted history file, overwriting")
+            logger.warning("Corrupted legacy history file %s, not migrated", json_path)
+            data = {}
+        stories = data.get("stories", {})
+        for stored, timestamp in data.get("urls", {}).items():
+            ts = _parse_iso(timestamp)
+            if ts is None:
+                continue
+            url = canonicalize_url(stored)
+            tokens = stories.get(stored)
+            # Keys that now canonicalize alike merge into the earliest entry.
+            if url not in rows or ts < rows[url][2]:
+                rows[url] = (
+                    url, stored, ts, canonical_host(url),
+                    json.dumps(tokens) if tokens else None,
+                )
+        conn.executemany(
+            "INSERT OR IGNORE INTO published VALUES (?, ?, ?, ?, ?)", rows.values(),
+        )
+        _bump_generation(conn)
+        logger.info("Migrated %d publish history entries from %s", len(rows), json_path)
+    conn.execute("INSERT INTO meta VALUES ('json_migrated', ?)", (str(len(rows)),))
+
 
-    normalized = url.rstrip("/").lower()
-    urls[normalized] = datetime.now(timezone.utc).isoformat()
+def _generation(conn: sqlite3.Connection) -> int:
+    row = conn.execute("SELECT value FROM meta WHERE key = 'generation'").fetchone()
+    return int(row[0]) if row else 0
 
-    path.write_text(
-        json.dumps({"urls": urls}, indent=2),
-        encoding="utf-8",
+
+def _bump_generation(conn: sqlite3.Connection) -> int:
+    conn.execute(
+        "INSERT INTO meta VALUES ('generation', '1') "
+        "ON CONFLICT (key) DO UPDATE SET value = CAST(value AS INTEGER) + 1",
     )
-    logger.info("Saved URL to publish history: %s", normalized)
+    return _generation(conn)
+
+
+def _local_day(ts: float, tz_name: str) -> str:
+    return datetime.fromtimestamp(ts, local_timezone(tz_name)).date().isoformat()
+
+
+def _update_daily_counts(conn: sqlite3.Connection, rows: Iterable[tuple]) -> None:
+    """Count staged *rows* (before they are written) in every tracked timezone.
+
+    A URL counts once, on the local day of its latest ``published_at``.
+    """
+    zones = conn.execute("SELECT tz, since FROM counter_zones").fetchall()
+    if not zones:
+        return
+    deltas: dict[tuple[str, str, str], int] = {}
+    for url, _, published_at, host, _ in rows:
+        row = conn.execute("SELECT published_at FROM published WHERE url = ?", (url,)).fetchone()
+        for tz_name, since in zones:
+            if row is not None and row[0] >= since:
+                key = (tz_name, _local_day(row[0], tz_name), host)
+                deltas[key] = deltas.get(key, 0) - 1
+            if published_at >= since:
+                key = (tz_name, _local_day(published_at, tz_name), host)
+                deltas[key] = deltas.get(key, 0) + 1
+    conn.executemany(
+        "INSERT INTO daily_counts VALUES (?, ?, ?, ?) "
+        "ON CONFLICT (tz, day, host) DO UPDATE SET count = count + excluded.count",
+        [(*key, delta) for key, delta in deltas.items() if delta],
+    )
+
+
+def _parse_iso(timestamp: object) -> float | None:
+    try:
+        dt = datetime.fromisoformat(str(timestamp))
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+class HistoryIndex:
+    """Publish history for one run: read once, then answered from memory.
+
+    Membership and per-host counts come from an in-memory map that is
+    loaded on first use; ``add`` updates it in place and stages the row,
+    and ``flush`` writes all staged rows in one transaction. ``reads`` and
+    ``writes`` count the database queries and rows written.
+
+    With *bloom* the map is never loaded: membership goes through a Bloom
+    filter stored next to the database (rebuilt from it if missing or
+    stale), and only possible hits are looked up in the database.
+
+    With *journal* every ``add`` is appended to this run's journal before
+    it returns and the journal is emptied by ``flush``; entries left in the
+    journals of runs that never flushed are committed when the index is
+    opened.
+    """
+
+    def __init__(
+        self,
+        conn: sqlite3.Connection | None,
+        *,
+        bloom: bool = False,
+        journal: bool = False,
+    ) -> None:
+        self._conn = conn
+        self._path = self._database_path() if conn is not None else None
+        # canonical URL -> (stored key, published_at epoch, host)
+        self._entries: dict[str, tuple[str, float, str]] | None = None
+        self._pending: dict[str, tuple] = {}
+        self._lock = threading.Lock()
+        self.reads = 0
+        self.writes = 0
+        self._bloom = self._load_bloom() if bloom and conn is not None else None
+        self._journal = None
+        if journal and conn is not None:
+            self._recover_journals()
+            journal_path = _journal_path(self._path)
+            self._journal = try_lock(journal_path)
+            if self._journal is None:
+                logger.warning(
+                    "Publish history journal %s is locked by another run; "
+                    "continuing without a journal", journal_path,
+                )
+
+    def __contains__(self, url: object) -> bool:
+        return isinstance(url, str) and self._lookup(canonicalize_url(url)) is not None
+
+    def __len__(self) -> int:
+        if self._bloom is None:
+            return len(self._map())
+        stored = self._query("SELECT COUNT(*) FROM published")[0][0]
+        return stored + sum(1 for url in self._pending if self._stored(url) is None)
+
+    def urls(self) -> set[str]:
+        """All published URLs, canonical (loads every URL, even in bloom mode)."""
+        return set(self._map())
+
+    def membership(self) -> Container[str]:
+        """Container answering "was this URL published?" for the parsers.
+
+        The exact URL set, or in bloom mode a filter-backed container that
+        can be pickled to parse worker processes.
+        """
+        if self._bloom is None:
+            return self.urls()
+        return BloomMembership(self._bloom, self._path)
+
+    def is_committed(self, url: str) -> bool:
+        """Whether *url* is in the database now.
+
+        Unlike ``in``, this also sees URLs other instances committed after
+        this index was loaded.
+        """
+        return bool(self._query("SELECT 1 FROM published WHERE url = ?", (canonicalize_url(url),)))
+
+    def stored_url(self, url: str) -> str | None:
+        """Key *url*'s entry was first recorded under, if published."""
+        entry = self._lookup(canonicalize_url(url))
+        return entry[0] if entry else None
+
+    def count_today_by_host(self, tz_name: str) -> dict[str, int]:
+        """Number of URLs published so far today, local to *tz_name*, per host.
+
+        Read from the maintained daily counters; the first call for a
+        timezone seeds them from today's entries. Staged entries count as
+        newly published.
+        """
+        tz = local_timezone(tz_name)
+        now = datetime.now(tz)
+        day = now.date().isoformat()
+        counts: dict[str, int] = {}
+        if self._conn is not None:
+            start = now.replace(hour=0, minute=0, second=0, microsecond=0).timestamp()
+            zone = self._query("SELECT since FROM counter_zones WHERE tz = ?", (tz_name,))
+            if not zone or zone[0][0] > start:
+                # Under the history lock so no flush commits between the
+                # count and the zone becoming visible to flushes.
+                with file_lock(self._path), self._lock, self._conn:
+                    self._seed_daily_counts(tz_name, day, start)
+            counts = dict(self._query(
+                "SELECT host, count FROM daily_counts WHERE tz = ? AND day = ?",
+                (tz_name, day),
+            ))
+        for _, _, published_at, host, _ in self._pending.values():
+            if _local_day(published_at, tz_name) == day:
+                counts[host] = counts.get(host, 0) + 1
+        return {host: count for host, count in counts.items() if count > 0}
+
+    def story_fingerprints(self, *, since: datetime) -> list[tuple[str, frozenset[str]]]:
+        """(URL, token set) of stories published at or after *since*.
+
+        Only stories inside the window are read, so the caller's similarity
+        index stays small however long the history grows.
+        """
+        if self._conn is None:
+            return []
+        self.reads += 1
+        rows = self._conn.execute(
+            "SELECT url, fingerprint FROM published "
+            "WHERE published_at >= ? AND fingerprint IS NOT NULL",
+            (since.timestamp(),),
+        )
+        return [(url, frozenset(json.loads(tokens))) for url, tokens in rows]
+
+    def add(self, url: str, *, fingerprint: Iterable[str] | None = None) -> None:
+        """Record *url* as published now (written on the next ``flush``).
+
+        *fingerprint* is the published item's token set (see
+        ``neardup.story_fingerprint``); later runs use it to recognise other
+        outlets' coverage of the same story.
+        """
+        normalized = canonicalize_url(url)
+        now = datetime.now(timezone.utc).timestamp()
+        tokens = sorted(fingerprint) if fingerprint is not None else None
+        if self._journal is not None:
+            self._journal.write(json.dumps([normalized, now, tokens]) + "\n")
+            self._journal.flush()
+            os.fsync(self._journal.fileno())
+        self._stage(normalized, now, tokens)
+        logger.info("Saved URL to publish history: %s", normalized)
+
+    def flush(self) -> None:
+        """Write staged entries in a single transaction."""
+        if not self._pending:
+            return
+        if self._conn is None:
+            raise RuntimeError("publish history opened read-only")
+        with file_lock(self._path):
+            with self._lock, self._conn:
+                previous = _generation(self._conn)
+                _update_daily_counts(self._conn, self._pending.values())
+                self._conn.executemany(
+                    "INSERT INTO published VALUES (?, ?, ?, ?, ?) "
+                    "ON CONFLICT (url) DO UPDATE SET published_at = excluded.published_at, "
+                    "fingerprint = COALESCE(excluded.fingerprint, fingerprint)",
+                    self._pending.values(),
+                )
+                generation = _bump_generation(self._conn)
+            self.writes += len(self._pending)
+            self._pending.clear()
+            if self._journal is not None:
+                # Replaying entries that were committed just before a crash
+                # here is harmless: they are written again unchanged.
+                self._journal.truncate(0)
+            if self._bloom is not None:
+                # Saved after the commit: a crash in between leaves a filter
+                # with an older generation, which the next open rebuilds.
+                if self._bloom.generation != previous:
+                    # Another instance committed since our filter was built.
+                    self._bloom = self._build_bloom(generation)
+                else:
+                    self._bloom.generation = generation
+                    self._bloom.save(_bloom_path(self._path))
+
+    def close(self) -> None:
+        """Flush staged entries and release the journal."""
+        if self._conn is not None:
+            self.flush()
+        if self._journal is not None:
+            Path(self._journal.name).unlink(missing_ok=True)
+            self._journal.close()
+            self._journal = None
+
+    def compact(self, *, before: datetime, archive: bool = True) -> int:
+        """Remove entries published before *before*; returns how many.
+
+        With *archive* they are moved to the ``archived`` table, otherwise
+        dropped. Either way runs stop loading and scanning them.
+        """
+        if self._conn is None:
+            return 0
+        self.flush()
+        cutoff = before.timestamp()
+        with self._conn:
+            if archive:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO archived SELECT * FROM published WHERE published_at < ?",
+                    (cutoff,),
+                )
+            removed = self._conn.execute(
+                "DELETE FROM published WHERE published_at < ?", (cutoff,),
+            ).rowcount
+            # The counters stay valid: entries are removed, not unpublished.
+            # Only days over before the cutoff in every timezone are dropped.
+            last_day = (before - timedelta(days=1)).astimezone(timezone.utc).date()
+            self._conn.execute("DELETE FROM daily_counts WHERE day < ?", (last_day.isoformat(),))
+        self.writes += removed
+        if self._entries is not None:
+            self._entries = {
+                url: entry for url, entry in self._entries.items() if entry[1] >= cutoff
+            }
+        return removed
+
+    def _seed_daily_counts(self, tz_name: str, day: str, start: float) -> None:
+        self._conn.execute("DELETE FROM daily_counts WHERE tz = ?", (tz_name,))
+        self._conn.execute(
+            "INSERT INTO daily_counts SELECT ?, ?, host, COUNT(*) FROM published "
+            "WHERE published_at >= ? GROUP BY host",
+            (tz_name, day, start),
+        )
+        self._conn.execute("INSERT OR REPLACE INTO counter_zones VALUES (?, ?)", (tz_name, start))
+
+    def _stage(self, url: str, published_at: float, tokens: list[str] | None) -> None:
+        host = canonical_host(url)
+        if self._bloom is None or self._entries is not None:
+            self._map()[url] = (url, published_at, host)
+        if self._bloom is not None:
+            self._bloom.add(url)
+        fingerprint = json.dumps(tokens) if tokens is not None else None
+        self._pending[url] = (url, url, published_at, host, fingerprint)
+
+    def _recover_journals(self) -> None:
+        """Commit entries from journals whose runs died before flushing."""
+        for path in sorted(self._path.parent.glob(f"{self._path.stem}.*.journal")):
+            try:
+                handle = try_lock(path, "r+")
+            except FileNotFoundError:
+                continue  # recovered by another instance meanwhile
+            if handle is None:
+                continue  # its run is still going
+            with handle:
+                for line in handle.read().splitlines():
+                    try:
+                        url, published_at, tokens = json.loads(line)
+                    except (json.JSONDecodeError, ValueError, TypeError):
+                        continue  # torn final line from a crash mid-append
+                    self._stage(url, published_at, tokens)
+                if self._pending:
+                    logger.warning(
+                        "Recovered %d publish history entries from an unfinished run",
+                        len(self._pending),
+                    )
+                    self.flush()
+                path.unlink(missing_ok=True)
+
+    def _lookup(self, url: str) -> tuple[str, float, str] | None:
+        if self._bloom is None:
+            return self._map().get(url)
+        if url in self._pending:
+            return self._pending[url][1:4]
+        if url not in self._bloom:
+            return None
+        return self._stored(url)
+
+    def _stored(self, url: str) -> tuple[str, float, str] | None:
+        rows = self._query(
+            "SELECT stored_url, published_at, host FROM published WHERE url = ?", (url,),
+        )
+        return rows[0] if rows else None
+
+    def _query(self, sql: str, params: tuple = ()) -> list[tuple]:
+        if self._conn is None:
+            return []
+        with self._lock:
+            self.reads += 1
+            return self._conn.execute(sql, params).fetchall()
+
+    def _database_path(self) -> Path:
+        row = self._conn.execute("PRAGMA database_list").fetchone()
+        return Path(row[2])
+
+    def _load_bloom(self) -> BloomFilter:
+        bloom = self._current_bloom()
+        if bloom is not None:
+            return bloom
+        # Rebuilt under the history lock so no commit lands between reading
+        # the generation and the URLs, and concurrent opens rebuild it once.
+        with file_lock(self._path):
+            bloom = self._current_bloom()
+            if bloom is not None:
+                return bloom
+            return self._build_bloom(_generation(self._conn))
+
+    def _current_bloom(self) -> BloomFilter | None:
+        """The saved filter, if it is up to date with the database."""
+        bloom = BloomFilter.load(_bloom_path(self._path))
+        if (
+            bloom is not None
+            and bloom.generation == _generation(self._conn)
+            and bloom.false_positive_rate <= 2 * _BLOOM_FP_RATE
+        ):
+            return bloom
+        return None
+
+    def _build_bloom(self, generation: int) -> BloomFilter:
+        """Build and save the filter; the caller holds ``file_lock(self._path)``."""
+        total = self._query("SELECT COUNT(*) FROM published")[0][0]
+        bloom = BloomFilter.for_capacity(max(2 * total, _BLOOM_MIN_CAPACITY), _BLOOM_FP_RATE)
+        self.reads += 1
+        for (url,) in self._conn.execute("SELECT url FROM published"):
+            bloom.add(url)
+        bloom.generation = generation
+        bloom.save(_bloom_path(self._path))
+        logger.info(
+            "Rebuilt publish history filter: %d URLs, %d KB", total, bloom.nbytes // 1024,
+        )
+        return bloom
+
+    def _map(self) -> dict[str, tuple[str, float, str]]:
+        if self._entries is None:
+            self._entries = {}
+            if self._conn is not None:
+                self.reads += 1
+                rows = self._conn.execute(
+                    "SELECT url, stored_url, published_at, host FROM published",
+                )
+                self._entries = {url: (stored, ts, host) for url, stored, ts, host in rows}
+        return self._entries
+
+
+class BloomMembership:
+    """Published-URL container backed by a Bloom filter (see ``membership``).
+
+    Possible hits are confirmed on a read-only connection opened on first
+    use, so instances can be pickled to other processes.
+    """
+
+    def __init__(self, bloom: BloomFilter, db_path: Path) -> None:
+        self._bloom = bloom
+        self._db_path = db_path
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def __contains__(self, url: object) -> bool:
+        if not isinstance(url, str):
+            return False
+        url = canonicalize_url(url)
+        if url not in self._bloom:
+            return False
+        with self._lock:
+            if self._conn is None:
+                self._conn = sqlite3.connect(
+                    self._db_path.as_uri() + "?mode=ro", uri=True, check_same_thread=False,
+                )
+            row = self._conn.execute("SELECT 1 FROM published WHERE url = ?", (url,)).fetchone()
+        return row is not None
+
+    def __getstate__(self) -> dict:
+        return {"bloom": self._bloom, "db_path": self._db_path}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(state["bloom"], state["db_path"])
+
+
+@contextmanager
+def open_history(
+    *,
+    history_path: Path | None = None,
+    create: bool = True,
+    bloom: bool = False,
+    journal: bool = False,
+) -> Iterator[HistoryIndex]:
+    """Open the publish history for a run; staged writes are flushed on exit.
+
+    With *create* false and no history on disk, the index is empty and
+    read-only. *bloom* selects bloom mode and *journal* journals each
+    recorded URL until the commit (see ``HistoryIndex``).
+    """
+    path = history_path or _history_path()
+    with _open(path, create=create) as conn:
+        history = HistoryIndex(conn, bloom=bloom, journal=journal)
+        try:
+            yield history
+        finally:
+            history.close()
+
+
+def load_history(*, history_path: Path | None = None) -> set[str]:
+    """Load the set of published URLs, as canonical URLs."""
+    with open_history(history_path=history_path, create=False) as history:
+        return history.urls()
+
+
+def save_url(
+    url: str,
+    *,
+    fingerprint: Iterable[str] | None = None,
+    history_path: Path | None = None,
+) -> None:
+    """Record a single published URL (see ``HistoryIndex.add``)."""
+    with open_history(history_path=history_path) as history:
+        history.add(url, fingerprint=fingerprint)
+
+
+def load_story_fingerprints(
+    *,
+    since: datetime,
+    history_path: Path | None = None,
+) -> list[tuple[str, frozenset[str]]]:
+    """(URL, token set) of stories published at or after *since*."""
+    with open_history(history_path=history_path, create=False) as history:
+        return history.story_fingerprints(since=since)
+
+
+def compact_history(
+    *,
+    retention_days: int,
+    archive: bool = True,
+    history_path: Path | None = None,
+) -> int:
+    """Archive (or drop) entries older than *retention_days*; returns how many."""
+    before = datetime.now(timezone.utc) - timedelta(days=retention_days)
+    with open_history(history_path=history_path, create=False) as history:
+        removed = history.compact(before=before, archive=archive)
+    if removed:
+        logger.info(
+            "%s %d publish history entries older than %d days",
+            "Archived" if archive else "Dropped", removed, retention_days,
+        )
+    return removed
 
 
 def filter_already_published(
     items: list[FeedItem],
     *,
     history_path: Path | None = None,
+    history: HistoryIndex | None = None,
+    stats: CanonicalStats | None = None,
 ) -> list[FeedItem]:
-    """Remove items whose URLs already appear in the publish history."""
-    published = load_history(history_path=history_path)
-    if not published:
-        return items
+    """Remove items whose URLs already appear in the publish history.
+
+    Pass *history* to reuse an index already open for the run.
+    """
+    if history is None:
+        with open_history(history_path=history_path, create=False) as history:
+            return filter_already_published(items, history=history, stats=stats)
 
     result: list[FeedItem] = []
     for item in items:
-        normalized = item.url.rstrip("/").lower()
-        if normalized in published:
-            logger.info("Skipping already-published: %s", item.url)
-        else:
+        stored = history.stored_url(item.url)
+        if stored is None:
             result.append(item)
+            continue
+        logger.info("Skipping already-published: %s", item.url)
+        if stats is not None:
+            stats.duplicates += 1
+            if legacy_url_key(item.url) == stored:
+                stats.legacy_duplicates += 1
+    return result
+
+
+def filter_expired(items: list[FeedItem], *, before: datetime) -> list[FeedItem]:
+    """Remove items published before *before*, the history retention cutoff.
+
+    Compaction stops runs from seeing URLs published before the cutoff, so
+    an article from before it could be one of them; a feed still listing it
+    (say, one skipped for weeks by adaptive polling) must not bring it back.
+    Items without a parseable date are kept.
+    """
+    cutoff = before.timestamp()
+    result = [i for i in items if i.published_ts is None or i.published_ts >= cutoff]
+    if len(result) < len(items):
+        logger.info("Skipping %d items older than the history retention", len(items) - len(result))
     return result
@@ -0,0 +1,239 @@
+"""Near-duplicate story clustering across sources.
+
+The same wire story is often republished by several outlets under
+different URLs and slightly reworded headlines. Each item is reduced to the
+token set of its title and the start of its summary; two items are the same
+story when the Jaccard similarity of those sets reaches a threshold.
+
+Candidate pairs come from MinHash LSH: a signature of ``NUM_HASHES`` minima
+is cut into bands, and only items agreeing on a whole band share a bucket
+and get compared, so clustering stays close to linear in the number of
+items. Candidates are then confirmed on the exact token sets.
+
+The same index, built from the fingerprints of recently published stories,
+rejects candidates that other outlets' coverage already made redundant.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import random
+import re
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+
+from auto_card_news_v2.models import FeedItem
+
+logger = logging.getLogger(__name__)
+
+# 20 bands of 3 rows: pairs at Jaccard 0.5 share a bucket 93% of the time,
+# reworded wire copies (0.7 and up) all but always, unrelated stories
+# (around 0.1) about 2% of the time.
+_BANDS = 20
+_ROWS = 3
+NUM_HASHES = _BANDS * _ROWS
+DEFAULT_THRESHOLD = 0.5
+
+# Universal hashing (a * x + b) mod p over a 61-bit Mersenne prime; the
+# coefficients are fixed so signatures are comparable across runs.
+_PRIME = (1 << 61) - 1
+_rng = random.Random(0x5EED)
+_COEFFS = tuple((_rng.randrange(1, _PRIME), _rng.randrange(_PRIME)) for _ in range(NUM_HASHES))
+
+# Wire-service tags such as "(LEAD)", "(2nd LD)", "(URGENT)", "(Yonhap)".
+_TAG_RE = re.compile(r"\([^)]{0,20}\)")
+_TOKEN_RE = re.compile(r"[a-z0-9가-힣]+")
+_STOPWORDS = frozenset(
+    "a an and are as at be been by for from has have he her his in into is it its "
+    "of on or said says she than that the their this to was were will with".split()
+)
+# A long lede would drown out a one-line description of the same story.
+_MAX_SUMMARY_TOKENS = 40
+
+
+@dataclass
+class NearDupStats:
+    """Counters filled in by ``collapse_near_duplicates`` (mutable, caller-owned)."""
+
+    clusters: int = 0  # clusters with more than one member
+    collapsed: int = 0  # items dropped in favour of their cluster's representative
+    comparisons: int = 0  # candidate pairs checked on their token sets
+    already_published: int = 0  # items matching a recently published story
+
+
+class StoryIndex:
+    """MinHash LSH index over token sets, queried for similar entries."""
+
+    def __init__(self, entries: Iterable[tuple[str, frozenset[str]]] = ()) -> None:
+        self._keys: list[str] = []
+        self._tokens: list[frozenset[str]] = []
+        self._buckets: dict[tuple[int, tuple[int, ...]], list[int]] = defaultdict(list)
+        for key, tokens in entries:
+            self.add(key, tokens)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def add(self, key: str, tokens: frozenset[str]) -> int:
+        """Index *tokens* under *key*; returns its position."""
+        pos = len(self._keys)
+        self._keys.append(key)
+        self._tokens.append(tokens)
+        if tokens:
+            for band in band_keys(minhash(tokens)):
+                self._buckets[band].append(pos)
+        return pos
+
+    def candidates(self, tokens: frozenset[str]) -> Iterator[int]:
+        """Positions sharing at least one LSH bucket with *tokens*, each once."""
+        if not tokens:
+            return
+        seen: set[int] = set()
+        for band in band_keys(minhash(tokens)):
+            for pos in self._buckets.get(band, ()):
+                if pos not in seen:
+                    seen.add(pos)
+                    yield pos
+
+    def match(
+        self,
+        tokens: frozenset[str],
+        *,
+        threshold: float = DEFAULT_THRESHOLD,
+        stats: NearDupStats | None = None,
+    ) -> str | None:
+        """Key of an indexed entry at least *threshold* similar to *tokens*."""
+        for pos in self.candidates(tokens):
+            if stats is not None:
+                stats.comparisons += 1
+            if jaccard(tokens, self._tokens[pos]) >= threshold:
+                return self._keys[pos]
+        return None
+
+
+def story_tokens(title: str, summary: str | None = None) -> frozenset[str]:
+    """Token set describing a story: its title plus the start of its summary."""
+    return frozenset(_tokens(title)) | frozenset(_tokens(summary or "")[:_MAX_SUMMARY_TOKENS])
+
+
+def story_fingerprint(item: FeedItem) -> frozenset[str]:
+    """Token set persisted for a published item.
+
+    Built from the feed title and summary, exactly as candidates are scored
+    in ``filter_similar_to_published``: the generated story's headline and
+    key details come from the scraped body and share too few tokens with
+    another outlet's feed entry to ever reach the threshold.
+    """
+    return story_tokens(item.title, item.summary)
+
+
+def minhash(tokens: Iterable[str]) -> tuple[int, ...]:
+    """MinHash signature of a token set (all ``_PRIME`` if it is empty)."""
+    hashed = [
+        int.from_bytes(hashlib.blake2b(t.encode(), digest_size=8).digest(), "big")
+        for t in tokens
+    ]
+    if not hashed:
+        return (_PRIME,) * NUM_HASHES
+    return tuple(min((a * h + b) % _PRIME for h in hashed) for a, b in _COEFFS)
+
+
+def band_keys(signature: tuple[int, ...]) -> list[tuple[int, tuple[int, ...]]]:
+    """(band index, band values) LSH bucket keys for a signature."""
+    return [
+        (band, signature[band * _ROWS:(band + 1) * _ROWS])
+        for band in range(_BANDS)
+    ]
+
+
+def jaccard(a: frozenset[str], b: frozenset[str]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def collapse_near_duplicates(
+    items: list[FeedItem],
+    *,
+    priority_domains: tuple[str, ...] = (),
+    threshold: float = DEFAULT_THRESHOLD,
+    stats: NearDupStats | None = None,
+) -> list[FeedItem]:
+    """Keep one item per near-duplicate cluster, preserving order.
+
+    The representative is a priority-domain item if the cluster has one,
+    then one that already carries full text (no scraping needed), then the
+    earliest in *items*. ``threshold <= 0`` disables clustering.
+    """
+    stats = stats if stats is not None else NearDupStats()
+    if threshold <= 0 or len(items) < 2:
+        return items
+
+    token_sets = [story_tokens(i.title, i.summary) for i in items]
+    parent = list(range(len(items)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    index = StoryIndex()
+    for idx, tokens in enumerate(token_sets):
+        for other in index.candidates(tokens):
+            stats.comparisons += 1
+            if jaccard(tokens, token_sets[other]) >= threshold:
+                parent[find(idx)] = find(other)
+        index.add(items[idx].url, tokens)
+
+    clusters: dict[int, list[int]] = defaultdict(list)
+    for idx in range(len(items)):
+        clusters[find(idx)].append(idx)
+
+    keep: set[int] = set()
+    for members in clusters.values():
+        keep.add(min(members, key=lambda i: _rank(items[i], i, priority_domains)))
+        if len(members) > 1:
+            stats.clusters += 1
+            stats.collapsed += len(members) - 1
+    return [item for idx, item in enumerate(items) if idx in keep]
+
+
+def filter_similar_to_published(
+    items: list[FeedItem],
+    published: StoryIndex,
+    *,
+    threshold: float = DEFAULT_THRESHOLD,
+    stats: NearDupStats | None = None,
+) -> list[FeedItem]:
+    """Drop items covering a story already in *published*.
+
+    ``threshold <= 0`` disables the check.
+    """
+    if threshold <= 0 or not len(published):
+        return items
+    result: list[FeedItem] = []
+    for item in items:
+        match = published.match(
+            story_tokens(item.title, item.summary), threshold=threshold, stats=stats,
+        )
+        if match is None:
+            result.append(item)
+            continue
+        logger.info("Skipping story already published as %s: %s", match, item.url)
+        if stats is not None:
+            stats.already_published += 1
+    return result
+
+
+def _rank(item: FeedItem, index: int, priority_domains: tuple[str, ...]) -> tuple:
+    domain = (item.source_domain or "").lower()
+    priority = any(pd.lower() in domain for pd in priority_domains)
+    return (not priority, item.full_text is None, index)
+
+
+def _tokens(text: str) -> list[str]:
+    text = _TAG_RE.sub(" ", text.lower())
+    return [t for t in _TOKEN_RE.findall(text) if len(t) > 1 and t not in _STOPWORDS]
@@ -2,11 +2,19 @@
 
 from __future__ import annotations
 
+import calendar
 import re
 import xml.etree.ElementTree as ET
+from collections.abc import Callable, Container, Iterable, Iterator
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from urllib.parse import urlparse
 
-from auto_card_news_v2.models import FeedItem
+from auto_card_news_v2.feed.cursor import reached_cursor
+from auto_card_news_v2.feed.urls import canonicalize_url
+from auto_card_news_v2.feed.text import clean_article_text, html_to_text
+from auto_card_news_v2.models import FeedCursor, FeedItem
 
 try:
     import feedparser  # type: ignore[import-untyped]
@@ -15,22 +23,134 @@ try:
 except ImportError:
     _HAS_FEEDPARSER = False
 
+ENGINE_FAST = "fast"
+ENGINE_FEEDPARSER = "feedparser"
 
-def parse_feed(data: bytes, *, feed_url: str = "") -> list[FeedItem]:
-    """Parse raw feed bytes into a list of FeedItem objects."""
-    if _HAS_FEEDPARSER:
-        return _parse_with_feedparser(data, feed_url)
-    return _parse_with_xml(data, feed_url)
+_ATOM_NS = "http://www.w3.org/2005/Atom"
+_ATOM_FEED = f"{{{_ATOM_NS}}}feed"
+_ATOM_ENTRY = f"{{{_ATOM_NS}}}entry"
+_ATOM = {"atom": _ATOM_NS}
+_RSS_EXT = {
+    "content": "http://purl.org/rss/1.0/modules/content/",
+    "dc": "http://purl.org/dc/elements/1.1/",
+}
+_STREAM_CHUNK_SIZE = 64 * 1024
+# Feed content shorter than this is a teaser, not the article; such items
+# are still scraped from the page.
+_MIN_FULL_TEXT_LENGTH = 400
 
 
-def _parse_with_feedparser(data: bytes, feed_url: str) -> list[FeedItem]:
+class _FastPathMiss(Exception):
+    """The strict parser cannot read this document exactly as feedparser would."""
+
+
+@dataclass
+class ParseStats:
+    """Counters filled in by a parse call (mutable, caller-owned).
+
+    ``engine`` is set to the engine that produced the items. Callers that
+    remember it per feed can pass it back in: a feed known to need
+    ``ENGINE_FEEDPARSER`` then skips the fast attempt. ``stopped_at_cursor``
+    says parsing ended at an already-ingested entry, so the items returned
+    are only the new head of the feed.
+    """
+
+    entries: int = 0
+    skipped_published: int = 0
+    reused_entries: int = 0
+    engine: str | None = None
+    stopped_at_cursor: bool = False
+
+
+def parse_feed(
+    data: bytes,
+    *,
+    feed_url: str = "",
+    published: Container[str] | None = None,
+    stats: ParseStats | None = None,
+    cursor: FeedCursor | None = None,
+) -> list[FeedItem]:
+    """Parse raw feed bytes into a list of FeedItem objects.
+
+    A strict ElementTree parser runs first. feedparser takes over when the
+    document is not well-formed XML, is neither RSS 2.0 nor Atom, or has an
+    entry the strict parser cannot read completely (missing title or link,
+    markup inside text fields, a date it cannot parse). Whenever the strict
+    parser succeeds, its items are identical to feedparser's.
+
+    *published* is a membership index of normalized URLs (see
+    ``urls.canonicalize_url``). Entries whose link is in it are dropped
+    before any HTML cleaning or FeedItem construction, and counted in
+    ``stats.skipped_published``.
+
+    With a *cursor* (see ``feed.cursor``) for a feed known to list entries
+    newest-first, parsing stops at the first entry the cursor shows was
+    already ingested and ``stats.stopped_at_cursor`` is set.
+    """
+    stats = stats if stats is not None else ParseStats()
+    if not _HAS_FEEDPARSER:
+        stats.engine = ENGINE_FAST
+        return _parse_with_xml(data, feed_url, published, stats, cursor=cursor)
+
+    if stats.engine != ENGINE_FEEDPARSER:
+        attempt = ParseStats()
+        try:
+            items = _parse_with_xml(
+                data, feed_url, published, attempt, strict=True, cursor=cursor,
+            )
+        except (ET.ParseError, _FastPathMiss):
+            pass
+        else:
+            stats.entries += attempt.entries
+            stats.skipped_published += attempt.skipped_published
+            stats.stopped_at_cursor = attempt.stopped_at_cursor
+            stats.engine = ENGINE_FAST
+            return items
+
+    stats.engine = ENGINE_FEEDPARSER
+    return _parse_with_feedparser(data, feed_url, published, stats, cursor=cursor)
+
+
+def _is_known(link: str, published: Container[str] | None, stats: ParseStats) -> bool:
+    stats.entries += 1
+    if published is not None and link and canonicalize_url(link) in published:
+        stats.skipped_published += 1
+        return True
+    return False
+
+
+def _parse_with_feedparser(
+    data: bytes,
+    feed_url: str,
+    published: Container[str] | None = None,
+    stats: ParseStats | None = None,
+    *,
+    cursor: FeedCursor | None = None,
+) -> list[FeedItem]:
+    stats = stats if stats is not None else ParseStats()
     parsed = feedparser.parse(data)
     items: list[FeedItem] = []
     for entry in parsed.entries:
-        title = getattr(entry, "title", "") or ""
         link = getattr(entry, "link", "") or ""
+        # Same precedence as the strict parser: publication date, else update.
+        if getattr(entry, "published", None):
+            published_at = entry.published
+            parsed_date = getattr(entry, "published_parsed", None)
+        else:
+            published_at = getattr(entry, "updated", None)
+            parsed_date = getattr(entry, "updated_parsed", None)
+        published_ts = (
+            float(calendar.timegm(parsed_date)) if parsed_date
+            else parse_timestamp(published_at)
+        )
+        if reached_cursor(cursor, link, published_ts):
+            stats.stopped_at_cursor = True
+            break
+        if _is_known(link, published, stats):
+            continue
+        title = getattr(entry, "title", "") or ""
         summary = getattr(entry, "summary", None)
-        published = getattr(entry, "published", None)
+        content = entry.get("content")
         domain = _extract_domain(link) or _extract_domain(feed_url)
 
         if title and link:
@@ -38,54 +158,263 @@ def _parse_with_feedparser(data: bytes, feed_url: str) -> list[FeedItem]:
                 title=_clean_html(title),
                 url=link,
                 summary=_clean_html(summary) if summary else None,
-                published_at=published,
+                published_at=published_at,
                 source_domain=domain,
+                full_text=_full_text(content[0].get("value")) if content else None,
+                published_ts=published_ts,
             ))
     return items
 
 
-def _parse_with_xml(data: bytes, feed_url: str) -> list[FeedItem]:
-    """Fallback XML parser for RSS and Atom feeds."""
+def _parse_with_xml(
+    data: bytes,
+    feed_url: str,
+    published: Container[str] | None = None,
+    stats: ParseStats | None = None,
+    *,
+    strict: bool = False,
+    cursor: FeedCursor | None = None,
+) -> list[FeedItem]:
+    """ElementTree parser for RSS 2.0 and Atom feeds.
+
+    Lenient by default (entries it cannot read are skipped). With *strict*,
+    anything it might read differently from feedparser raises
+    ``_FastPathMiss`` instead.
+    """
+    stats = stats if stats is not None else ParseStats()
     root = ET.fromstring(data)
+    if strict and root.tag not in ("rss", _ATOM_FEED):
+        raise _FastPathMiss(root.tag)
     items: list[FeedItem] = []
 
     # RSS 2.0
     for item_el in root.iter("item"):
-        title = _text(item_el, "title")
-        link = _text(item_el, "link")
-        summary = _text(item_el, "description")
-        pub_date = _text(item_el, "pubDate")
-        if title and link:
-            items.append(FeedItem(
-                title=_clean_html(title),
-                url=link,
-                summary=_clean_html(summary) if summary else None,
-                published_at=pub_date,
-                source_domain=_extract_domain(link) or _extract_domain(feed_url),
-            ))
+        link = _rss_link(item_el)
+        if strict and not link:
+            raise _FastPathMiss("item without link")
+        if reached_cursor(cursor, link, _entry_ts(cursor, item_el, _rss_date)):
+            stats.stopped_at_cursor = True
+            break
+        if _is_known(link, published, stats):
+            continue
+        item = _rss_item(item_el, link, feed_url, strict=strict)
+        if item is not None:
+            items.append(item)
 
     # Atom
-    ns = {"atom": "http://www.w3.org/2005/Atom"}
-    for entry_el in root.iter("{http://www.w3.org/2005/Atom}entry"):
-        title = _text(entry_el, "atom:title", ns)
-        link_el = entry_el.find("atom:link[@rel='alternate']", ns)
-        if link_el is None:
-            link_el = entry_el.find("atom:link", ns)
-        link = link_el.get("href", "") if link_el is not None else ""
-        summary = _text(entry_el, "atom:summary", ns)
-        updated = _text(entry_el, "atom:updated", ns)
-        if title and link:
-            items.append(FeedItem(
-                title=_clean_html(title),
-                url=link,
-                summary=_clean_html(summary) if summary else None,
-                published_at=updated,
-                source_domain=_extract_domain(link) or _extract_domain(feed_url),
-            ))
+    for entry_el in root.iter(_ATOM_ENTRY):
+        link = _atom_link(entry_el)
+        if strict and not link:
+            raise _FastPathMiss("entry without link")
+        if reached_cursor(cursor, link, _entry_ts(cursor, entry_el, _atom_date)):
+            stats.stopped_at_cursor = True
+            break
+        if _is_known(link, published, stats):
+            continue
+        item = _atom_entry(entry_el, link, feed_url, strict=strict)
+        if item is not None:
+            items.append(item)
 
     return items
 
 
+def stream_feed(
+    data: bytes | Iterable[bytes],
+    *,
+    feed_url: str = "",
+    limit: int | None = None,
+    published: Container[str] | None = None,
+    stats: ParseStats | None = None,
+    cursor: FeedCursor | None = None,
+) -> Iterator[FeedItem]:
+    """Lazily yield FeedItems from RSS/Atom bytes using incremental parsing.
+
+    *data* may be a whole document or an iterable of chunks (e.g. straight
+    off a response). Each ``<item>``/``<entry>`` is dropped from the tree as
+    soon as it has been converted, so memory stays flat however long the
+    feed is. Entries whose link is in *published* are skipped before any
+    conversion (as in ``parse_feed``), and reading stops once *limit* items
+    have been yielded or *cursor* is reached, so the rest of the document is
+    never parsed.
+
+    Raises ``xml.etree.ElementTree.ParseError`` on malformed input.
+    """
+    if limit is not None and limit <= 0:
+        return
+
+    stats = stats if stats is not None else ParseStats()
+    chunks = _chunked(data) if isinstance(data, (bytes, bytearray, memoryview)) else data
+    parser = ET.XMLPullParser(events=("start", "end"))
+    stack: list[ET.Element] = []
+    produced = 0
+
+    for chunk in chunks:
+        parser.feed(chunk)
+        for event, elem in parser.read_events():
+            if event == "start":
+                stack.append(elem)
+                continue
+
+            stack.pop()
+            item: FeedItem | None = None
+            if elem.tag == "item":
+                link = _rss_link(elem)
+                if reached_cursor(cursor, link, _entry_ts(cursor, elem, _rss_date)):
+                    stats.stopped_at_cursor = True
+                    return
+                if not _is_known(link, published, stats):
+                    item = _rss_item(elem, link, feed_url)
+            elif elem.tag == _ATOM_ENTRY:
+                link = _atom_link(elem)
+                if reached_cursor(cursor, link, _entry_ts(cursor, elem, _atom_date)):
+                    stats.stopped_at_cursor = True
+                    return
+                if not _is_known(link, published, stats):
+                    item = _atom_entry(elem, link, feed_url)
+            else:
+                continue
+
+            # Release the subtree before handing the item to the caller.
+            elem.clear()
+            if stack:
+                stack[-1].remove(elem)
+
+            if item is None:
+                continue
+            yield item
+            produced += 1
+            if limit is not None and produced >= limit:
+                return
+
+    parser.close()
+
+
+def _chunked(data: bytes | bytearray | memoryview) -> Iterator[bytes]:
+    view = memoryview(data)
+    for start in range(0, len(view), _STREAM_CHUNK_SIZE):
+        yield bytes(view[start:start + _STREAM_CHUNK_SIZE])
+
+
+def _rss_link(item_el: ET.Element) -> str:
+    return _text(item_el, "link") or ""
+
+
+def _atom_link(entry_el: ET.Element) -> str:
+    link_el = entry_el.find("atom:link[@rel='alternate']", _ATOM)
+    if link_el is None:
+        link_el = entry_el.find("atom:link", _ATOM)
+    return link_el.get("href", "") if link_el is not None else ""
+
+
+def _rss_item(
+    item_el: ET.Element, link: str, feed_url: str, *, strict: bool = False,
+) -> FeedItem | None:
+    if strict:
+        _check_plain_text(item_el, ("title", "description", "content:encoded"), _RSS_EXT)
+    title = _text(item_el, "title")
+    content = _text(item_el, "content:encoded", _RSS_EXT)
+    summary = _text(item_el, "description") or content
+    return _build_item(
+        title, link, summary, _rss_date(item_el), feed_url, content=content, strict=strict,
+    )
+
+
+def _atom_entry(
+    entry_el: ET.Element, link: str, feed_url: str, *, strict: bool = False,
+) -> FeedItem | None:
+    if strict:
+        _check_plain_text(entry_el, ("atom:title", "atom:summary", "atom:content"), _ATOM)
+    title = _text(entry_el, "atom:title", _ATOM)
+    content = _text(entry_el, "atom:content", _ATOM)
+    summary = _text(entry_el, "atom:summary", _ATOM) or content
+    return _build_item(
+        title, link, summary, _atom_date(entry_el), feed_url, content=content, strict=strict,
+    )
+
+
+def _rss_date(item_el: ET.Element) -> str | None:
+    return _text(item_el, "pubDate") or _text(item_el, "dc:date", _RSS_EXT)
+
+
+def _atom_date(entry_el: ET.Element) -> str | None:
+    return _text(entry_el, "atom:published", _ATOM) or _text(entry_el, "atom:updated", _ATOM)
+
+
+def _entry_ts(
+    cursor: FeedCursor | None,
+    el: ET.Element,
+    get_date: Callable[[ET.Element], str | None],
+) -> float | None:
+    # Only worth parsing the date when there is a cursor to compare it with.
+    if cursor is None or not cursor.ordered:
+        return None
+    return parse_timestamp(get_date(el))
+
+
+def _build_item(
+    title: str | None,
+    link: str,
+    summary: str | None,
+    date: str | None,
+    feed_url: str,
+    *,
+    content: str | None = None,
+    strict: bool,
+) -> FeedItem | None:
+    if not (title and link):
+        if strict:
+            raise _FastPathMiss("entry without title")
+        return None
+    published_ts = parse_timestamp(date)
+    if strict and date and published_ts is None:
+        # feedparser knows many more date formats; let it have this one.
+        raise _FastPathMiss(f"unrecognised date {date!r}")
+    return FeedItem(
+        title=_clean_html(title),
+        url=link,
+        summary=_clean_html(summary) if summary else None,
+        published_at=date,
+        source_domain=_extract_domain(link) or _extract_domain(feed_url),
+        full_text=_full_text(content),
+        published_ts=published_ts,
+    )
+
+
+def _full_text(content: str | None) -> str | None:
+    """Article text from an entry's full content, or None if it is a teaser."""
+    if not content:
+        return None
+    text = clean_article_text(html_to_text(content))
+    return text if len(text) >= _MIN_FULL_TEXT_LENGTH else None
+
+
+def _check_plain_text(el: ET.Element, tags: tuple[str, ...], ns: dict[str, str]) -> None:
+    """Raise if a text field holds child elements (unescaped HTML, XHTML)."""
+    for tag in tags:
+        child = el.find(tag, ns)
+        if child is not None and len(child):
+            raise _FastPathMiss(f"markup inside <{tag}>")
+
+
+def parse_timestamp(raw: str | None) -> float | None:
+    """Parse an RFC 822 (RSS) or ISO 8601 (Atom) date into a UTC epoch.
+
+    Dates without a zone are taken as UTC. Returns ``None`` if unparseable.
+    """
+    if not raw:
+        return None
+    try:
+        dt = parsedate_to_datetime(raw)
+    except (TypeError, ValueError):
+        try:
+            dt = datetime.fromisoformat(raw.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
 def _text(
     el: ET.Element, tag: str, ns: dict[str, str] | None = None,
 ) -> str | None:
@@ -96,10 +425,12 @@ def _text(
 
 
 _HTML_TAG_RE = re.compile(r"<[^>]+>")
+# Dropped with their contents, as feedparser's sanitizer does.
+_HTML_SCRIPT_RE = re.compile(r"<(script|style)\b[^>]*>.*?</\1\s*>", re.IGNORECASE | re.DOTALL)
 
 
 def _clean_html(text: str) -> str:
-    return _HTML_TAG_RE.sub("", text).strip()
+    return _HTML_TAG_RE.sub("", _HTML_SCRIPT_RE.sub("", text)).strip()
 
 
 def _extract_domain(url: str) -> str | None:
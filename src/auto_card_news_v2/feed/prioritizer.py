@@ -2,12 +2,10 @@
 
 from __future__ import annotations
 
-import json
 import logging
-from datetime import datetime, timezone
 from pathlib import Path
-from urllib.parse import urlparse
 
+from auto_card_news_v2.feed.history import HistoryIndex, open_history
 from auto_card_news_v2.models import FeedItem
 
 logger = logging.getLogger(__name__)
@@ -25,60 +23,29 @@ def _count_today_by_category(
     *,
     history_path: Path | None = None,
     tz_name: str = "Asia/Seoul",
+    history: HistoryIndex | None = None,
 ) -> tuple[int, int]:
     """Count today's published items split by priority vs normal.
 
+    Only today's per-host counters are read, not the whole history.
     Returns (priority_count, normal_count).
     """
-    try:
-        from zoneinfo import ZoneInfo
-        local_tz = ZoneInfo(tz_name)
-    except (ImportError, KeyError):
-        from datetime import timedelta
-        # Fallback for Asia/Seoul (UTC+9)
-        local_tz = timezone(timedelta(hours=9))
+    if history is None:
+        with open_history(history_path=history_path, create=False) as history:
+            return _count_today_by_category(
+                priority_domains, tz_name=tz_name, history=history,
+            )
 
-    from auto_card_news_v2.feed.history import _history_path as default_path
-    path = history_path or default_path()
-
-    if not path.exists():
-        return 0, 0
-
-    try:
-        data = json.loads(path.read_text(encoding="utf-8"))
-    except (json.JSONDecodeError, OSError):
-        return 0, 0
-
-    urls: dict[str, str] = data.get("urls", {})
-    now = datetime.now(local_tz)
-    today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    by_host = history.count_today_by_host(tz_name)
 
     priority_count = 0
     normal_count = 0
-
-    for url, timestamp_str in urls.items():
-        try:
-            ts = datetime.fromisoformat(timestamp_str)
-            if ts.tzinfo is None:
-                ts = ts.replace(tzinfo=timezone.utc)
-            ts_local = ts.astimezone(local_tz)
-        except (ValueError, TypeError):
-            continue
-
-        if ts_local < today_start:
-            continue
-
-        # Check if this URL belongs to a priority domain
-        try:
-            host = urlparse(url).hostname or ""
-        except Exception:
-            host = ""
-        host = host.lower().removeprefix("www.")
-
+    for host, count in by_host.items():
+        # Check if this host belongs to a priority domain
         if any(pd.lower() in host for pd in priority_domains):
-            priority_count += 1
+            priority_count += count
         else:
-            normal_count += 1
+            normal_count += count
 
     return priority_count, normal_count
 
@@ -91,6 +58,7 @@ def prioritize_items(
     daily_total: int = 12,
     history_path: Path | None = None,
     tz_name: str = "Asia/Seoul",
+    history: HistoryIndex | None = None,
 ) -> list[FeedItem]:
     """Reorder items so the appropriate category comes first based on daily quota.
 
@@ -104,6 +72,7 @@ def prioritize_items(
         daily_total: Total expected items per day.
         history_path: Override for testing.
         tz_name: Timezone for "today" calculation.
+        history: Publish history already open for the run (read from disk if omitted).
 
     Returns:
         Reordered items with the appropriate category first.
@@ -124,7 +93,7 @@ def prioritize_items(
         return priority_items
 
     p_count, n_count = _count_today_by_category(
-        priority_domains, history_path=history_path, tz_name=tz_name,
+        priority_domains, history_path=history_path, tz_name=tz_name, history=history,
     )
 
     logger.info(
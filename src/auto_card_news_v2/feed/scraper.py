@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from playwright.sync_api import Browser, Page
 
+from auto_card_news_v2.feed.text import clean_article_text
+
 # Selectors ordered by specificity - try most specific first
 _ARTICLE_SELECTORS = [
     ".story-news",        # Yonhap English
@@ -36,7 +38,7 @@ def scrape_article(url: str, *, browser: Browser) -> str | None:
                 continue
             text = " ".join(el.inner_text() for el in elements).strip()
             if len(text) >= _MIN_BODY_LENGTH:
-                return _clean_article_text(text)
+                return clean_article_text(text)
 
         return None
     except Exception:
@@ -44,33 +46,3 @@ def scrape_article(url: str, *, browser: Browser) -> str | None:
     finally:
         if page:
             page.close()
-
-
-def _clean_article_text(text: str) -> str:
-    """Remove common noise from scraped article text."""
-    lines = text.split("\n")
-    cleaned: list[str] = []
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-        # Skip common noise patterns
-        lower = line.lower()
-        if any(noise in lower for noise in (
-            "copyright", "all rights reserved", "©",
-            "subscribe", "sign up", "newsletter",
-            "advertisement", "promoted content",
-            "share this", "related articles",
-            "photo not for sale", "not for sale",
-            "getty images", "(yonhap)", "(reuters)",
-            "click here", "read more", "send us",
-        )):
-            continue
-        # Skip bylines like "By Kim Eun-jung"
-        if line.startswith("By ") and len(line) < 40:
-            continue
-        # Skip very short lines (likely captions/bylines)
-        if len(line) < 15 and not line.endswith("."):
-            continue
-        cleaned.append(line)
-    return "\n".join(cleaned)
@@ -0,0 +1,122 @@
+"""Persistent per-feed state (HTTP validators, cached items) across runs."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from dataclasses import asdict, fields
+from pathlib import Path
+
+from auto_card_news_v2.locking import write_atomic
+from auto_card_news_v2.models import FeedItem
+
+logger = logging.getLogger(__name__)
+
+_STATE_DIR = Path.home() / ".card-news"
+_STATE_FILE = _STATE_DIR / "feed_state.json"
+_CACHE_DIR = _STATE_DIR / "feed_cache"
+
+_FEED_ITEM_FIELDS = frozenset(f.name for f in fields(FeedItem))
+
+
+def _state_path() -> Path:
+    """Return the feed state file path (test-friendly seam)."""
+    return _STATE_FILE
+
+
+def _cache_dir() -> Path:
+    """Return the parsed-item cache directory (test-friendly seam)."""
+    return _CACHE_DIR
+
+
+def load_feed_state(*, state_path: Path | None = None) -> dict[str, dict]:
+    """Load the per-feed state mapping ``{feed_url: {...}}`` from disk."""
+    path = state_path or _state_path()
+    if not path.exists():
+        return {}
+
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (json.JSONDecodeError, OSError):
+        logger.warning("Corrupted feed state file, starting fresh")
+        return {}
+
+    feeds = data.get("feeds", {})
+    return feeds if isinstance(feeds, dict) else {}
+
+
+def save_feed_state(state: dict[str, dict], *, state_path: Path | None = None) -> None:
+    """Persist the per-feed state mapping to disk."""
+    path = state_path or _state_path()
+    # Atomic so a concurrent run never reads a half-written file.
+    write_atomic(path, json.dumps({"feeds": state}, indent=2))
+
+
+def load_cached_items(
+    feed_url: str, *, cache_dir: Path | None = None,
+) -> list[FeedItem] | None:
+    """Return the items parsed from *feed_url* on the last full fetch, if any."""
+    cached = load_cached_entries(feed_url, cache_dir=cache_dir)
+    return None if cached is None else cached[0]
+
+
+def load_cached_entries(
+    feed_url: str, *, cache_dir: Path | None = None,
+) -> tuple[list[FeedItem], dict[str, int | None]] | None:
+    """Return the cached items plus their raw-entry fingerprint map.
+
+    The map goes from an entry fingerprint (see ``feed.fingerprint``) to the
+    index of the item it produced, or ``None`` for entries that yielded no
+    item. It is empty for caches written without one.
+    """
+    path = _cache_file(feed_url, cache_dir)
+    if not path.exists():
+        return None
+
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (json.JSONDecodeError, OSError):
+        logger.warning("Corrupted item cache for %s, ignoring", feed_url)
+        return None
+
+    items: list[FeedItem] = []
+    for raw in data.get("items", []):
+        try:
+            items.append(FeedItem(**{
+                k: v for k, v in raw.items() if k in _FEED_ITEM_FIELDS
+            }))
+        except TypeError:
+            return None
+
+    entries = data.get("entries") or {}
+    if not isinstance(entries, dict) or any(
+        idx is not None and not (isinstance(idx, int) and 0 <= idx < len(items))
+        for idx in entries.values()
+    ):
+        entries = {}
+    return items, entries
+
+
+def save_cached_items(
+    feed_url: str,
+    items: list[FeedItem],
+    *,
+    entries: dict[str, int | None] | None = None,
+    cache_dir: Path | None = None,
+) -> None:
+    """Store parsed items for *feed_url* so a 304 response can reuse them.
+
+    *entries* is the optional fingerprint map described in
+    ``load_cached_entries``.
+    """
+    path = _cache_file(feed_url, cache_dir)
+    payload: dict = {"url": feed_url, "items": [asdict(i) for i in items]}
+    if entries:
+        payload["entries"] = entries
+    write_atomic(path, json.dumps(payload))
+
+
+def _cache_file(feed_url: str, cache_dir: Path | None) -> Path:
+    digest = hashlib.sha1(feed_url.encode("utf-8")).hexdigest()
+    return (cache_dir or _cache_dir()) / f"{digest}.json"
@@ -0,0 +1,57 @@
+"""Plain-text extraction shared by the scraper and the feed parser.
+
+Kept free of Playwright so parse workers can import it cheaply.
+"""
+
+from __future__ import annotations
+
+import html
+import re
+
+# Block-level tags that end a paragraph when flattening HTML to text.
+_BLOCK_BREAK_RE = re.compile(
+    r"<\s*(?:br\s*/?|/\s*(?:p|div|li|h[1-6]|blockquote|tr|section|article))\s*>",
+    re.IGNORECASE,
+)
+_SCRIPT_RE = re.compile(r"<(script|style)\b[^>]*>.*?</\1\s*>", re.IGNORECASE | re.DOTALL)
+_TAG_RE = re.compile(r"<[^>]+>")
+_SPACES_RE = re.compile(r"[ \t\r\f\v\xa0]+")
+
+
+def html_to_text(markup: str) -> str:
+    """Flatten article HTML to plain text with one paragraph per line."""
+    text = _SCRIPT_RE.sub("", markup)
+    text = _BLOCK_BREAK_RE.sub("\n", text)
+    text = html.unescape(_TAG_RE.sub("", text))
+    lines = (_SPACES_RE.sub(" ", line).strip() for line in text.split("\n"))
+    return "\n".join(line for line in lines if line)
+
+
+def clean_article_text(text: str) -> str:
+    """Remove common noise lines from article text (one paragraph per line)."""
+    lines = text.split("\n")
+    cleaned: list[str] = []
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        # Skip common noise patterns
+        lower = line.lower()
+        if any(noise in lower for noise in (
+            "copyright", "all rights reserved", "©",
+            "subscribe", "sign up", "newsletter",
+            "advertisement", "promoted content",
+            "share this", "related articles",
+            "photo not for sale", "not for sale",
+            "getty images", "(yonhap)", "(reuters)",
+            "click here", "read more", "send us",
+        )):
+            continue
+        # Skip bylines like "By Kim Eun-jung"
+        if line.startswith("By ") and len(line) < 40:
+            continue
+        # Skip very short lines (likely captions/bylines)
+        if len(line) < 15 and not line.endswith("."):
+            continue
+        cleaned.append(line)
+    return "\n".join(cleaned)
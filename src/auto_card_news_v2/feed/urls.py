@@ -0,0 +1,99 @@
+"""Canonical article URLs shared by dedup, publish history and prioritization.
+
+The same story turns up under many URLs: with ``utm_*`` tracking
+parameters, a ``#fragment``, on a mobile (``m.``) or AMP host, over plain
+HTTP or with its query parameters in another order. All of these map to a
+single canonical key. Canonicalization is memoized because the same URLs
+are looked up many times per run (every feed entry at parse time, every
+history key on load).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+from urllib.parse import urlsplit
+
+# Host prefixes that serve the same article as the desktop site.
+_MIRROR_HOST_PREFIXES = ("www.", "m.", "mobile.", "amp.")
+# Query parameters that only identify where the click came from.
+_TRACKING_PARAMS = frozenset({
+    "fbclid", "gclid", "dclid", "msclkid", "igshid", "mc_cid", "mc_eid",
+    "amp", "outputtype",
+})
+_DEFAULT_PORTS = (":80", ":443")
+_CACHE_SIZE = 16384
+
+
+@dataclass
+class CanonicalStats:
+    """Duplicate counters filled in by the canonical-URL callers (mutable).
+
+    ``duplicates`` counts items dropped as duplicates; ``legacy_duplicates``
+    counts how many of those the old ``url.rstrip("/").lower()`` keys would
+    have caught too.
+    """
+
+    duplicates: int = 0
+    legacy_duplicates: int = 0
+
+    @property
+    def extra_duplicates(self) -> int:
+        """Duplicates only the canonical form catches."""
+        return self.duplicates - self.legacy_duplicates
+
+
+def legacy_url_key(url: str) -> str:
+    """The key URLs were compared by before canonicalization."""
+    return url.rstrip("/").lower()
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def canonicalize_url(url: str) -> str:
+    """Return the canonical key for an article URL.
+
+    Case-insensitive like the old keys, so canonicalizing an old history
+    key gives the same result as canonicalizing the URL it came from.
+    """
+    raw = url.strip().lower()
+    try:
+        parts = urlsplit(raw)
+    except ValueError:
+        return legacy_url_key(raw)
+    if not parts.netloc:
+        return legacy_url_key(raw)
+
+    host = parts.netloc.rpartition("@")[2]
+    for port in _DEFAULT_PORTS:
+        host = host.removesuffix(port)
+    for prefix in _MIRROR_HOST_PREFIXES:
+        if host.startswith(prefix) and host.count(".") > 1:
+            host = host[len(prefix):]
+            break
+
+    path = parts.path.rstrip("/")
+    if path.endswith("/amp"):
+        path = path[: -len("/amp")].rstrip("/")
+
+    params = sorted(
+        p for p in parts.query.split("&")
+        if p and not _is_tracking(p.partition("=")[0])
+    )
+    scheme = "https" if parts.scheme in ("http", "https") else parts.scheme
+    canonical = f"{scheme}://{host}{path}"
+    if params:
+        canonical += "?" + "&".join(params)
+    return canonical.rstrip("/")
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def canonical_host(url: str) -> str:
+    """Host of the canonical URL (no ``www.``/mobile/AMP prefix, no port)."""
+    try:
+        return urlsplit(canonicalize_url(url)).hostname or ""
+    except ValueError:
+        return ""
+
+
+def _is_tracking(name: str) -> bool:
+    return name.startswith("utm_") or name in _TRACKING_PARAMS
@@ -0,0 +1,186 @@
+"""Lease-based work queue so several workers can split one candidate list.
+
+Workers on different hosts build the same prioritized candidate list and
+share a small SQLite database (``NEWS_WORK_QUEUE``) on a common volume.
+Before scraping an item a worker claims a lease on its canonical URL; other
+workers skip it while the lease is live, and once the worker completes it
+the URL stays marked done, so no other worker processes it again. A worker
+that dies stops renewing, its lease expires, and the item is claimable
+again.
+
+Completion is fenced on lease ownership rather than time: a worker whose
+lease was taken over after expiring cannot complete the item, and discards
+its result instead of publishing a second copy.
+
+Without ``NEWS_WORK_QUEUE`` the queue lives in ``~/.card-news`` instead, so
+overlapping runs on one host (cron, Docker, manual) still claim each item
+before scraping it rather than only finding out at the history commit.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import socket
+import sqlite3
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+from auto_card_news_v2.feed.urls import canonicalize_url
+
+logger = logging.getLogger(__name__)
+
+_QUEUE_DIR = Path.home() / ".card-news"
+_QUEUE_FILE = _QUEUE_DIR / "work_queue.db"
+
+DEFAULT_LEASE_SECONDS = 600
+_BUSY_TIMEOUT_SECONDS = 30
+
+# done_at is NULL while the lease is held and set once the item is done.
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS leases (
+    url TEXT PRIMARY KEY,
+    worker TEXT NOT NULL,
+    expires_at REAL NOT NULL,
+    done_at REAL
+) WITHOUT ROWID;
+"""
+
+
+@dataclass
+class QueueStats:
+    """Counters filled in by ``WorkQueue`` (mutable, caller-owned)."""
+
+    claimed: int = 0
+    completed: int = 0
+    already_done: int = 0  # finished by some worker earlier
+    leased_elsewhere: int = 0  # another worker holds a live lease
+    lost: int = 0  # our lease was taken over before we completed
+
+
+def _queue_path() -> Path:
+    """Return the host-local queue database path (test-friendly seam)."""
+    return _QUEUE_FILE
+
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class WorkQueue:
+    """Leases on canonical URLs in a shared database."""
+
+    def __init__(
+        self,
+        conn: sqlite3.Connection,
+        *,
+        worker: str | None = None,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+        stats: QueueStats | None = None,
+    ) -> None:
+        self._conn = conn
+        self.worker = worker or default_worker_id()
+        self.lease_seconds = lease_seconds
+        self.stats = stats if stats is not None else QueueStats()
+
+    def claim(self, url: str) -> bool:
+        """Take the lease on *url*; False if it is done or leased elsewhere."""
+        url = canonicalize_url(url)
+        now = time.time()
+        with self._transaction():
+            row = self._conn.execute(
+                "SELECT worker, expires_at, done_at FROM leases WHERE url = ?", (url,),
+            ).fetchone()
+            if row is not None:
+                worker, expires_at, done_at = row
+                if done_at is not None:
+                    self.stats.already_done += 1
+                    return False
+                if worker != self.worker and expires_at > now:
+                    self.stats.leased_elsewhere += 1
+                    return False
+            self._conn.execute(
+                "INSERT OR REPLACE INTO leases VALUES (?, ?, ?, NULL)",
+                (url, self.worker, now + self.lease_seconds),
+            )
+        self.stats.claimed += 1
+        return True
+
+    def renew(self, url: str) -> bool:
+        """Extend our lease on *url*; False if it was taken over."""
+        return self._update(
+            url, "UPDATE leases SET expires_at = ?", time.time() + self.lease_seconds,
+        )
+
+    def complete(self, url: str) -> bool:
+        """Mark *url* done; False if our lease was taken over meanwhile."""
+        if self._update(url, "UPDATE leases SET done_at = ?", time.time()):
+            self.stats.completed += 1
+            return True
+        self.stats.lost += 1
+        logger.warning("Lease on %s was taken over by another worker", url)
+        return False
+
+    def release(self, url: str) -> None:
+        """Give up our lease on *url* so another worker can retry it."""
+        with self._transaction():
+            self._conn.execute(
+                "DELETE FROM leases WHERE url = ? AND worker = ? AND done_at IS NULL",
+                (canonicalize_url(url), self.worker),
+            )
+
+    def prune(self, *, before: datetime) -> int:
+        """Forget items done before *before* and leases expired by then."""
+        cutoff = before.timestamp()
+        with self._transaction():
+            return self._conn.execute(
+                "DELETE FROM leases WHERE done_at < ? OR (done_at IS NULL AND expires_at < ?)",
+                (cutoff, cutoff),
+            ).rowcount
+
+    def _update(self, url: str, assignment: str, value: float) -> bool:
+        with self._transaction():
+            cursor = self._conn.execute(
+                f"{assignment} WHERE url = ? AND worker = ? AND done_at IS NULL",
+                (value, canonicalize_url(url), self.worker),
+            )
+        return cursor.rowcount == 1
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        # IMMEDIATE takes the write lock up front, so the read and write in
+        # ``claim`` cannot interleave with another worker's.
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
+
+@contextmanager
+def open_work_queue(
+    path: Path | None = None,
+    *,
+    worker: str | None = None,
+    lease_seconds: float = DEFAULT_LEASE_SECONDS,
+    stats: QueueStats | None = None,
+) -> Iterator[WorkQueue]:
+    """Open (creating if needed) the work queue at *path*, else the host-local one."""
+    path = path or _queue_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path, timeout=_BUSY_TIMEOUT_SECONDS, isolation_level=None)
+    try:
+        # Rollback journal rather than WAL: WAL needs shared memory, which
+        # a volume shared between hosts does not provide.
+        conn.execute("PRAGMA journal_mode=DELETE")
+        conn.execute("PRAGMA synchronous=FULL")
+        conn.executescript(_SCHEMA)
+        yield WorkQueue(conn, worker=worker, lease_seconds=lease_seconds, stats=stats)
+    finally:
+        conn.close()
@@ -0,0 +1,100 @@
+"""Cross-process coordination for the shared state under ``~/.card-news``.
+
+The Docker runner, cron entries and manual ``card-news generate`` runs can
+all work against the same history, token and feed-state files at once.
+``file_lock`` serializes the short read-modify-write sections on them with
+an advisory ``flock`` on a ``.lock`` file next to the target, and
+``write_atomic`` replaces a file so readers never see it half-written.
+
+Advisory locks are a no-op where ``fcntl`` is unavailable (Windows).
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LOCK_TIMEOUT_SECONDS = 30.0
+_POLL_SECONDS = 0.05
+
+
+def lock_path(path: Path) -> Path:
+    """The lock file guarding *path*."""
+    return path.with_name(path.name + ".lock")
+
+
+@contextmanager
+def file_lock(path: Path, *, timeout: float = DEFAULT_LOCK_TIMEOUT_SECONDS) -> Iterator[None]:
+    """Hold the exclusive advisory lock for *path* for the ``with`` body.
+
+    Raises ``TimeoutError`` if another process holds it for longer than
+    *timeout* seconds.
+    """
+    target = lock_path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    with open(target, "a") as handle:
+        deadline = time.monotonic() + timeout
+        while not _try_flock(handle):
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"Timed out waiting for lock {target}")
+            time.sleep(_POLL_SECONDS)
+        try:
+            yield
+        finally:
+            _unlock(handle)
+
+
+def try_lock(path: Path, mode: str = "a") -> IO[str] | None:
+    """Open *path* and lock it without waiting; ``None`` if another process holds it.
+
+    The lock is held until the returned file is closed, so it marks the file
+    as in use for as long as its owner is alive.
+    """
+    handle = open(path, mode, encoding="utf-8")
+    if _try_flock(handle):
+        return handle
+    handle.close()
+    return None
+
+
+def write_atomic(path: Path, data: str, *, mode: int | None = None) -> None:
+    """Replace *path* with *data* via a temporary file and ``os.replace``.
+
+    *mode* sets the permissions before the file becomes visible.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    if mode is not None:
+        tmp.chmod(mode)
+    os.replace(tmp, path)
+
+
+def _try_flock(handle: IO) -> bool:
+    if fcntl is None:
+        return True
+    try:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        return False
+    return True
+
+
+def _unlock(handle: IO) -> None:
+    if fcntl is not None:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
@@ -16,6 +16,35 @@ class FeedItem:
     published_at: str | None = None
     source_domain: str | None = None
     full_text: str | None = None
+    published_ts: float | None = None  # UTC epoch parsed from published_at
+
+
+@dataclass(frozen=True)
+class FeedCursor:
+    """Newest entry ingested from a feed, used to stop parsing at known content."""
+
+    newest_url: str  # normalized, see feed.urls.canonicalize_url
+    newest_ts: float | None = None
+    ordered: bool = False  # feed was last seen listing entries newest-first
+
+
+@dataclass(frozen=True)
+class FeedFetchResult:
+    """Outcome of fetching and parsing a single feed URL."""
+
+    url: str
+    items: tuple[FeedItem, ...] = ()
+    latency_ms: float = 0.0
+    num_bytes: int = 0
+    wire_bytes: int = 0
+    skipped_published: int = 0
+    parse_engine: str | None = None
+    error: str | None = None
+    not_modified: bool = False
+    etag: str | None = None
+    last_modified: str | None = None
+    body_sha256: str | None = None
+    cursor: FeedCursor | None = None
 
 
 @dataclass(frozen=True)
@@ -32,6 +61,7 @@ class Story:
     source_domain: str | None = None
     source_url: str | None = None
     published_at: str | None = None
+    published_ts: float | None = None  # UTC epoch
 
 
 @dataclass(frozen=True)
@@ -69,6 +69,7 @@ def _build_metadata(
         "source_domain": story.source_domain,
         "source_url": story.source_url,
         "published_at": story.published_at,
+        "published_ts": story.published_ts,
         "tags": list(story.tags),
         "num_cards": len(image_paths),
         "image_files": [p.name for p in image_paths],
@@ -5,22 +5,40 @@ from __future__ import annotations
 import logging
 import os
 import shutil
+import time
 from dataclasses import replace
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 from playwright.sync_api import sync_playwright
 
+from auto_card_news_v2 import transport
 from auto_card_news_v2.caption import compose_caption
 from auto_card_news_v2.config import Settings
 from auto_card_news_v2.feed import (
+    collect_feeds,
     deduplicate,
-    fetch_feed,
     filter_already_published,
-    parse_feed,
     prioritize_items,
 )
-from auto_card_news_v2.feed.history import save_url
+from auto_card_news_v2.feed.cadence import due_feeds, record_polls
+from auto_card_news_v2.feed.health import record_health, split_open_circuits
+from auto_card_news_v2.feed.history import HistoryIndex, filter_expired, open_history
+from auto_card_news_v2.feed.neardup import (
+    NearDupStats,
+    StoryIndex,
+    collapse_near_duplicates,
+    filter_similar_to_published,
+    story_fingerprint,
+)
 from auto_card_news_v2.feed.scraper import scrape_article
+from auto_card_news_v2.feed.state import (
+    load_cached_items,
+    load_feed_state,
+    save_feed_state,
+)
+from auto_card_news_v2.feed.urls import CanonicalStats, canonicalize_url
+from auto_card_news_v2.feed.work_queue import QueueStats, WorkQueue, open_work_queue
 from auto_card_news_v2.models import FeedItem, ThreadsPost
 from auto_card_news_v2.output import package_output
 from auto_card_news_v2.render.carousel import render_carousel_with_browser
@@ -33,20 +51,85 @@ _MAX_OUTPUT_DIRS = 5
 
 def run_pipeline(settings: Settings) -> list[ThreadsPost]:
     """Run the full card news generation pipeline."""
-    items = _fetch_all_feeds(settings)
-    items = deduplicate(items)
-    items = filter_already_published(items)
+    # Read once for the whole run; URLs recorded below are written in one
+    # transaction when the run ends (and journaled until then if enabled).
+    # Items are claimed in the work queue before scraping, so overlapping
+    # runs (on this host, or on all hosts sharing NEWS_WORK_QUEUE) split the
+    # candidates instead of processing the same ones.
+    queue_stats = QueueStats()
+    with open_history(
+        bloom=settings.history_bloom, journal=settings.history_journal,
+    ) as history, open_work_queue(
+        settings.work_queue_path,
+        lease_seconds=settings.work_lease_seconds,
+        stats=queue_stats,
+    ) as queue:
+        if settings.history_retention_days > 0:
+            cutoff = datetime.now(timezone.utc) - timedelta(days=settings.history_retention_days)
+            expired = history.compact(before=cutoff)
+            if expired:
+                logger.info("Archived %d publish history entries past retention", expired)
+            queue.prune(before=cutoff)
+        posts = _run_pipeline(settings, history, queue)
+    logger.info(
+        "Publish history: %d reads, %d rows written", history.reads, history.writes,
+    )
+    logger.info(
+        "Work queue: claimed %d, completed %d, skipped %d done and %d leased "
+        "by other workers, %d leases lost",
+        queue_stats.claimed, queue_stats.completed, queue_stats.already_done,
+        queue_stats.leased_elsewhere, queue_stats.lost,
+    )
+    return posts
+
+
+def _run_pipeline(
+    settings: Settings, history: HistoryIndex, queue: WorkQueue | None = None,
+) -> list[ThreadsPost]:
+    items = _fetch_all_feeds(settings, history)
+    url_stats = CanonicalStats()
+    items = deduplicate(items, stats=url_stats)
+    if settings.history_retention_days > 0:
+        cutoff = datetime.now(timezone.utc) - timedelta(days=settings.history_retention_days)
+        items = filter_expired(items, before=cutoff)
+    items = filter_already_published(items, history=history, stats=url_stats)
+    dup_stats = NearDupStats()
+    items = collapse_near_duplicates(
+        items,
+        priority_domains=settings.priority_domains,
+        threshold=settings.near_dup_threshold,
+        stats=dup_stats,
+    )
+    if settings.near_dup_window_hours > 0:
+        since = datetime.now(timezone.utc) - timedelta(hours=settings.near_dup_window_hours)
+        published = StoryIndex(history.story_fingerprints(since=since))
+        items = filter_similar_to_published(
+            items, published, threshold=settings.near_dup_threshold, stats=dup_stats,
+        )
+    if dup_stats.collapsed or dup_stats.already_published:
+        logger.info(
+            "Near-duplicate stories: collapsed %d items into %d clusters, "
+            "%d already published (%d comparisons)",
+            dup_stats.collapsed, dup_stats.clusters, dup_stats.already_published,
+            dup_stats.comparisons,
+        )
     items = prioritize_items(
         items,
         priority_domains=settings.priority_domains,
         priority_ratio=settings.priority_ratio,
         daily_total=settings.daily_total,
         tz_name=settings.timezone,
+        history=history,
+    )
+    cache = canonicalize_url.cache_info()
+    logger.info(
+        "URL canonicalization: %d duplicates caught (%d beyond the old normalization), "
+        "cache %d hits / %d misses",
+        url_stats.duplicates, url_stats.extra_duplicates, cache.hits, cache.misses,
     )
-    items = items[: settings.max_items]
 
     if settings.dry_run:
-        _print_dry_run(items)
+        _print_dry_run(items[: settings.max_items])
         return []
 
     posts: list[ThreadsPost] = []
@@ -55,41 +138,132 @@ def run_pipeline(settings: Settings) -> list[ThreadsPost]:
         executable = os.environ.get("PLAYWRIGHT_CHROMIUM_EXECUTABLE_PATH")
         browser = pw.chromium.launch(executable_path=executable) if executable else pw.chromium.launch()
 
+        # Walk the whole prioritized list: items another run or worker has
+        # already taken do not count towards max_items.
+        claimed = from_feed = 0
         for item in items:
+            if claimed >= settings.max_items:
+                break
+            if history.is_committed(item.url):
+                logger.info("Skipping, published by another run meanwhile: %s", item.url)
+                continue
+            # With a shared work queue, other workers skip this item while
+            # our lease is live.
+            if queue is not None and not queue.claim(item.url):
+                logger.info("Skipping, claimed by another worker: %s", item.url)
+                continue
+            claimed += 1
+            if item.full_text:
+                from_feed += 1
             try:
-                # Scrape full article body
-                full_text = scrape_article(item.url, browser=browser)
-                if full_text:
-                    item = replace(item, full_text=full_text)
+                # Scrape full article body unless the feed already carried it
+                if not item.full_text:
+                    full_text = scrape_article(item.url, browser=browser)
+                    if full_text:
+                        item = replace(item, full_text=full_text)
+                    if queue is not None:
+                        queue.renew(item.url)
 
                 post = _process_item(item, settings, browser)
+                if queue is not None and not queue.complete(item.url):
+                    print(f"Warning: Discarding '{item.title}', another worker took it over")
+                    continue
                 posts.append(post)
-                save_url(item.url)
+                history.add(item.url, fingerprint=story_fingerprint(item))
             except Exception as exc:
+                if queue is not None:
+                    queue.release(item.url)
                 print(f"Warning: Failed to process '{item.title}': {exc}")
 
+        if claimed:
+            logger.info(
+                "Feed-supplied full text for %d/%d items (%.0f%%), skipped browser scraping",
+                from_feed, claimed, 100 * from_feed / claimed,
+            )
         browser.close()
 
     _cleanup_old_outputs(settings.output_dir)
     return posts
 
 
-def _fetch_all_feeds(settings: Settings) -> list[FeedItem]:
-    """Fetch and parse all configured RSS feeds."""
+def _fetch_all_feeds(settings: Settings, history: HistoryIndex) -> list[FeedItem]:
+    """Fetch and parse all configured RSS feeds concurrently.
+
+    With adaptive polling, only feeds whose learned interval has elapsed are
+    fetched, and feeds whose circuit breaker is open are skipped until their
+    cool-down ends; skipped feeds contribute the items cached from their last
+    successful fetch.
+    """
+    state = load_feed_state()
+    now = time.time()
+    urls = settings.rss_feeds
+    if settings.adaptive_polling:
+        urls = tuple(due_feeds(urls, state, now=now))
+        if len(urls) < len(settings.rss_feeds):
+            logger.info(
+                "Adaptive polling: %d/%d feeds due this run",
+                len(urls), len(settings.rss_feeds),
+            )
+    urls, cooling = split_open_circuits(urls, state, now=now)
+    for url in cooling:
+        logger.info("Circuit open, skipping feed: %s", url)
+
+    # Already-published entries are dropped while parsing, before any
+    # FeedItem is built; filter_already_published() later still catches
+    # items reused from the cache.
+    published = history.membership()
+    results = collect_feeds(
+        urls,
+        max_workers=settings.fetch_concurrency,
+        per_host=settings.fetch_per_host,
+        state=state,
+        streaming=settings.streaming_parse,
+        item_limit=settings.max_items if settings.streaming_parse else None,
+        published=published,
+        parse_processes=settings.parse_processes,
+    )
+    record_health(state, results, now=now)
+    if settings.adaptive_polling:
+        record_polls(
+            state,
+            results,
+            now=now,
+            min_interval=settings.feed_min_interval_minutes * 60,
+            max_interval=settings.feed_max_interval_minutes * 60,
+        )
+    save_feed_state(state)
+
+    by_url = {r.url: r for r in results}
     all_items: list[FeedItem] = []
     for url in settings.rss_feeds:
-        try:
-            data = fetch_feed(url)
-            items = parse_feed(data, feed_url=url)
-            all_items.extend(items)
-        except Exception as exc:
-            print(f"Warning: Failed to fetch '{url}': {exc}")
+        result = by_url.get(url)
+        if result is None:
+            all_items.extend(load_cached_items(url) or [])
+            continue
+        if result.error is not None:
+            print(f"Warning: Failed to fetch '{result.url}': {result.error}")
+            continue
+        all_items.extend(result.items)
+
+    fetched = [r for r in results if r.error is None]
+    logger.info(
+        "Fetched %d/%d feeds (%d not modified, %d published entries skipped at parse): "
+        "%d bytes decoded from %d on the wire, slowest %.0f ms",
+        len(fetched),
+        len(results),
+        sum(1 for r in fetched if r.not_modified),
+        sum(r.skipped_published for r in fetched),
+        sum(r.num_bytes for r in results),
+        sum(r.wire_bytes for r in results),
+        max((r.latency_ms for r in results), default=0.0),
+    )
+    transport.log_host_stats()
     return all_items
 
 
 def _process_item(item: FeedItem, settings: Settings, browser) -> ThreadsPost:
     """Process a single feed item through the full pipeline."""
-    story = build_story(item)
+    story = build_story(item, tz_name=settings.timezone)
     story = sanitize_story(story, enabled=settings.safety_enabled)
 
     temp_dir = settings.output_dir / "_temp_render"
@@ -2,28 +2,25 @@
 
 from __future__ import annotations
 
-from email.utils import parsedate_to_datetime
+from datetime import datetime
 
-from auto_card_news_v2.config import Settings
+from auto_card_news_v2.config import Settings, local_timezone
 from auto_card_news_v2.models import CardContent, Story
 
 
-def _format_published_date(published_at: str | None) -> str:
-    """Format RSS published_at string to 'Feb 6, 2026' style."""
-    if not published_at:
-        return ""
-    try:
-        dt = parsedate_to_datetime(published_at)
-        return dt.strftime("%b %-d, %Y")
-    except (ValueError, TypeError):
+def _format_published_date(published_ts: float | None, tz_name: str) -> str:
+    """Format an epoch publication time to 'Feb 6, 2026' style in *tz_name*."""
+    if published_ts is None:
         return ""
+    dt = datetime.fromtimestamp(published_ts, tz=local_timezone(tz_name))
+    return dt.strftime("%b %-d, %Y")
 
 
 def build_cards(story: Story, settings: Settings) -> list[CardContent]:
     """Build a list of CardContent from a Story. Last card is CTA."""
     cards: list[CardContent] = []
 
-    date_str = _format_published_date(story.published_at)
+    date_str = _format_published_date(story.published_ts, settings.timezone)
 
     # Card 1: Hook / Cover
     cards.append(CardContent(
@@ -5,6 +5,7 @@ from __future__ import annotations
 import logging
 import signal
 import sys
+from dataclasses import replace
 from types import FrameType
 
 from apscheduler.schedulers.blocking import BlockingScheduler
@@ -34,23 +35,7 @@ def run_job(*, auto_publish: bool = True, limit: int | None = None) -> None:
     try:
         settings = load_settings()
         if limit is not None:
-            settings = Settings(
-                rss_feeds=settings.rss_feeds,
-                output_dir=settings.output_dir,
-                safety_enabled=settings.safety_enabled,
-                max_items=limit,
-                num_cards=settings.num_cards,
-                brand_name=settings.brand_name,
-                brand_handle=settings.brand_handle,
-                dry_run=settings.dry_run,
-                threads_user_id=settings.threads_user_id,
-                cloudinary_cloud_name=settings.cloudinary_cloud_name,
-                cloudinary_api_key=settings.cloudinary_api_key,
-                cloudinary_api_secret=settings.cloudinary_api_secret,
-                schedule_interval_minutes=settings.schedule_interval_minutes,
-                auto_publish=settings.auto_publish,
-                timezone=settings.timezone,
-            )
+            settings = replace(settings, max_items=limit)
 
         posts = run_pipeline(settings)
         logger.info("Generated %d card news post(s)", len(posts))
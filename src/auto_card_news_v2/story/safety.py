@@ -51,6 +51,7 @@ def sanitize_story(story: Story, *, enabled: bool = True) -> Story:
         source_domain=story.source_domain,
         source_url=story.source_url,
         published_at=story.published_at,
+        published_ts=story.published_ts,
     )
 
 
@@ -5,7 +5,9 @@ from __future__ import annotations
 import html
 import re
 from collections import Counter
+from datetime import datetime
 
+from auto_card_news_v2.config import local_timezone
 from auto_card_news_v2.models import FeedItem, Story
 
 _STOPWORDS_EN = frozenset({
@@ -68,14 +70,17 @@ _FUTURE_KEYWORDS = frozenset({
 })
 
 
-def build_story(item: FeedItem) -> Story:
-    """Transform a FeedItem into a structured Story using heuristics."""
+def build_story(item: FeedItem, *, tz_name: str = "Asia/Seoul") -> Story:
+    """Transform a FeedItem into a structured Story using heuristics.
+
+    The publication time on the where/when line is shown in *tz_name*.
+    """
     text = _combined_text(item)
     sentences = _split_sentences(text)
 
     hook_title = _shorten(_decode_html(_strip_wire_prefixes(item.title)), max_len=120)
     what_happened = _build_what_happened(sentences, item.title)
-    where_when = _extract_where_when(sentences, item)
+    where_when = _extract_where_when(sentences, item, tz_name)
     impact = _build_impact(sentences)
     what_next = _build_what_next(sentences)
     key_details = _build_key_details(sentences)
@@ -92,6 +97,7 @@ def build_story(item: FeedItem) -> Story:
         source_domain=item.source_domain,
         source_url=item.url,
         published_at=item.published_at,
+        published_ts=item.published_ts,
     )
 
 
@@ -348,9 +354,12 @@ def _find_by_keywords(
     return results
 
 
-def _extract_where_when(sentences: list[str], item: FeedItem) -> str:
+def _extract_where_when(sentences: list[str], item: FeedItem, tz_name: str) -> str:
     parts: list[str] = []
-    if item.published_at:
+    if item.published_ts is not None:
+        dt = datetime.fromtimestamp(item.published_ts, tz=local_timezone(tz_name))
+        parts.append(dt.strftime("%b %-d, %Y %H:%M %Z"))
+    elif item.published_at:
         parts.append(item.published_at)
     if item.source_domain:
         parts.append(item.source_domain)
@@ -1,21 +1,13 @@
-"""Low-level Threads Graph API client using urllib."""
+"""Low-level Threads Graph API client over the shared pooled transport."""
 
 from __future__ import annotations
 
 import json
 import logging
-import ssl
 import time
-import urllib.error
 import urllib.parse
-import urllib.request
 
-try:
-    import certifi
-
-    _SSL_CONTEXT = ssl.create_default_context(cafile=certifi.where())
-except ImportError:
-    _SSL_CONTEXT = ssl.create_default_context()
+from auto_card_news_v2 import transport
 
 logger = logging.getLogger(__name__)
 
@@ -45,40 +37,34 @@ class ThreadsPublishError(ThreadsAPIError):
 def _post(url: str, data: dict) -> dict:
     """Send a POST request to the Threads API and return parsed JSON."""
     encoded = urllib.parse.urlencode(data).encode("utf-8")
-    req = urllib.request.Request(url, data=encoded, method="POST")
+    headers = {"Content-Type": "application/x-www-form-urlencoded"}
     try:
-        with urllib.request.urlopen(
-            req, timeout=_TIMEOUT_SECONDS, context=_SSL_CONTEXT
-        ) as resp:
-            return json.loads(resp.read())
-    except urllib.error.HTTPError as exc:
-        body = exc.read().decode("utf-8", errors="replace")
-        if exc.code == 429:
-            raise ThreadsRateLimitError(
-                "Rate limit exceeded", status_code=exc.code, body=body
-            ) from exc
-        raise ThreadsAPIError(
-            f"HTTP {exc.code}: {body}", status_code=exc.code, body=body
-        ) from exc
+        resp = transport.request(
+            "POST", url, body=encoded, headers=headers, timeout=_TIMEOUT_SECONDS,
+        )
+    except transport.HTTPStatusError as exc:
+        raise _api_error(exc) from exc
+    return json.loads(resp.body)
 
 
 def _get(url: str) -> dict:
     """Send a GET request to the Threads API and return parsed JSON."""
-    req = urllib.request.Request(url)
     try:
-        with urllib.request.urlopen(
-            req, timeout=_TIMEOUT_SECONDS, context=_SSL_CONTEXT
-        ) as resp:
-            return json.loads(resp.read())
-    except urllib.error.HTTPError as exc:
-        body = exc.read().decode("utf-8", errors="replace")
-        if exc.code == 429:
-            raise ThreadsRateLimitError(
-                "Rate limit exceeded", status_code=exc.code, body=body
-            ) from exc
-        raise ThreadsAPIError(
-            f"HTTP {exc.code}: {body}", status_code=exc.code, body=body
-        ) from exc
+        resp = transport.request("GET", url, timeout=_TIMEOUT_SECONDS)
+    except transport.HTTPStatusError as exc:
+        raise _api_error(exc) from exc
+    return json.loads(resp.body)
+
+
+def _api_error(exc: transport.HTTPStatusError) -> ThreadsAPIError:
+    body = exc.body.decode("utf-8", errors="replace")
+    if exc.status == 429:
+        return ThreadsRateLimitError(
+            "Rate limit exceeded", status_code=exc.status, body=body
+        )
+    return ThreadsAPIError(
+        f"HTTP {exc.status}: {body}", status_code=exc.status, body=body
+    )
 
 
 def create_image_container(
@@ -5,6 +5,7 @@ from __future__ import annotations
 import logging
 from datetime import datetime, timezone
 
+from auto_card_news_v2 import transport
 from auto_card_news_v2.config import Settings
 from auto_card_news_v2.models import ImageUpload, ThreadsPost, ThreadsPublishResult
 from auto_card_news_v2.threads.client import (
@@ -90,6 +91,7 @@ def publish_post(
 
         published_at = datetime.now(timezone.utc).isoformat()
         logger.info("Published to Threads: %s", permalink)
+        transport.log_host_stats()
 
         return ThreadsPublishResult(
             post=post,
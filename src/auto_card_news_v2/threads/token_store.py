@@ -1,20 +1,19 @@
-"""Manage Threads long-lived access token stored on disk."""
+"""Manage Threads long-lived access token stored on disk.
+
+Several instances may share the token file. A refresh holds the file's
+advisory lock and picks up a token another instance refreshed meanwhile
+instead of refreshing again, and writes replace the file atomically.
+"""
 
 from __future__ import annotations
 
 import json
 import logging
-import ssl
-import urllib.request
 from datetime import datetime, timezone
 from pathlib import Path
 
-try:
-    import certifi
-
-    _SSL_CONTEXT = ssl.create_default_context(cafile=certifi.where())
-except ImportError:
-    _SSL_CONTEXT = ssl.create_default_context()
+from auto_card_news_v2 import transport
+from auto_card_news_v2.locking import file_lock, write_atomic
 
 logger = logging.getLogger(__name__)
 
@@ -102,8 +101,7 @@ def save_token(
         "expires_in": expires_in,
         "expires_at": expires_at,
     }
-    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
-    path.chmod(0o600)
+    write_atomic(path, json.dumps(data, indent=2), mode=0o600)
     logger.info("Token saved to %s", path)
 
 
@@ -155,16 +153,26 @@ def refresh_if_needed(
 
 def _do_refresh(access_token: str, *, token_path: Path) -> str:
     """Call the Threads token refresh endpoint."""
+    try:
+        with file_lock(token_path):
+            current, expired = _load_token_with_status(token_path=token_path)
+            if current and current != access_token and not expired:
+                logger.info("Token already refreshed by another run")
+                return current
+            return _request_refresh(access_token, token_path=token_path)
+    except TimeoutError:
+        logger.warning("Token refresh lock busy, keeping current token")
+        return access_token
+
+
+def _request_refresh(access_token: str, *, token_path: Path) -> str:
     url = (
         f"{_GRAPH_API_BASE}/refresh_access_token"
         f"?grant_type=th_refresh_token&access_token={access_token}"
     )
-    req = urllib.request.Request(url)
     try:
-        with urllib.request.urlopen(
-            req, timeout=_TIMEOUT_SECONDS, context=_SSL_CONTEXT
-        ) as resp:
-            body = json.loads(resp.read())
+        resp = transport.request("GET", url, timeout=_TIMEOUT_SECONDS)
+        body = json.loads(resp.body)
     except Exception:
         logger.warning("Token refresh failed, keeping current token")
         return access_token
@@ -0,0 +1,389 @@
+"""Shared keep-alive HTTP transport with per-host connection pooling.
+
+Every outbound HTTP call (feeds, Threads Graph API, token refresh) goes
+through this module so connections and TLS sessions are reused across
+requests to the same host, and timeouts/retries behave the same everywhere.
+"""
+
+from __future__ import annotations
+
+import http.client
+import logging
+import select
+import ssl
+import threading
+import time
+import urllib.request
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from dataclasses import dataclass
+from urllib.parse import urljoin, urlsplit
+
+try:
+    import certifi
+
+    _SSL_CONTEXT = ssl.create_default_context(cafile=certifi.where())
+except ImportError:
+    _SSL_CONTEXT = ssl.create_default_context()
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT_SECONDS = 15
+_USER_AGENT = "auto-card-news-v2/0.1 (+https://github.com/auto-card-news)"
+_MAX_IDLE_PER_HOST = 4
+_MAX_IDLE_SECONDS = 30.0
+_MAX_REDIRECTS = 5
+_DEFAULT_RETRIES = 1
+_BACKOFF_SECONDS = 0.5
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD"})
+_REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+_RETRY_STATUSES = frozenset({502, 503, 504})
+
+# Errors raised when a pooled connection was closed by the server while idle.
+_STALE_ERRORS = (
+    http.client.RemoteDisconnected,
+    ConnectionResetError,
+    ConnectionAbortedError,
+    BrokenPipeError,
+)
+
+
+class HTTPStatusError(Exception):
+    """Server answered with a 4xx/5xx status."""
+
+    def __init__(
+        self,
+        status: int,
+        body: bytes = b"",
+        headers: Mapping[str, str] | None = None,
+        url: str = "",
+    ) -> None:
+        super().__init__(f"HTTP {status} for {url}")
+        self.status = status
+        self.body = body
+        self.headers = headers or {}
+        self.url = url
+
+
+@dataclass(frozen=True)
+class Response:
+    """Fully-read HTTP response."""
+
+    status: int
+    headers: Mapping[str, str]
+    body: bytes
+
+
+class _PooledHTTPSConnection(http.client.HTTPSConnection):
+    """HTTPS connection that resumes the pool's last TLS session."""
+
+    def __init__(self, host: str, port: int | None, *, pool: _HostPool, timeout: float) -> None:
+        super().__init__(host, port, timeout=timeout, context=_SSL_CONTEXT)
+        self._pool = pool
+
+    def connect(self) -> None:
+        # TCP connect (and CONNECT tunnel through a proxy, if configured).
+        http.client.HTTPConnection.connect(self)
+        server_hostname = self._tunnel_host or self.host
+        session = self._pool.tls_session
+        try:
+            self.sock = self._context.wrap_socket(
+                self.sock, server_hostname=server_hostname, session=session,
+            )
+        except ValueError:
+            # Session no longer usable with this context; do a full handshake.
+            self.sock = self._context.wrap_socket(self.sock, server_hostname=server_hostname)
+        if self.sock.session_reused:
+            self._pool.count("tls_resumed")
+
+
+class _HostPool:
+    """Idle keep-alive connections and counters for one scheme/host/port."""
+
+    def __init__(self, scheme: str, host: str, port: int) -> None:
+        self.scheme = scheme
+        self.host = host
+        self.port = port
+        self.tls_session: ssl.SSLSession | None = None
+        self.stats = {"opened": 0, "reused": 0, "tls_resumed": 0}
+        self._idle: list[tuple[http.client.HTTPConnection, float]] = []
+        self._lock = threading.Lock()
+        self._proxy = _proxy_for(scheme, host)
+
+    @property
+    def absolute_target(self) -> bool:
+        """Plain-HTTP requests through a proxy use the absolute URL as target."""
+        return self._proxy is not None and self.scheme == "http"
+
+    def count(self, key: str) -> None:
+        with self._lock:
+            self.stats[key] += 1
+
+    def acquire(
+        self, timeout: float, *, check_alive: bool = False,
+    ) -> tuple[http.client.HTTPConnection, bool]:
+        """Return (connection, reused).
+
+        With *check_alive*, idle connections the server has already closed
+        are skipped rather than handed out.
+        """
+        now = time.monotonic()
+        with self._lock:
+            while self._idle:
+                conn, idle_since = self._idle.pop()
+                if now - idle_since > _MAX_IDLE_SECONDS or (check_alive and _is_dropped(conn)):
+                    conn.close()
+                    continue
+                conn.timeout = timeout
+                try:
+                    if conn.sock is not None:
+                        conn.sock.settimeout(timeout)
+                except OSError:
+                    conn.close()
+                    continue
+                self.stats["reused"] += 1
+                return conn, True
+            self.stats["opened"] += 1
+        return self._new_connection(timeout), False
+
+    def release(self, conn: http.client.HTTPConnection) -> None:
+        sock = conn.sock
+        if isinstance(sock, ssl.SSLSocket) and sock.session is not None:
+            self.tls_session = sock.session
+        with self._lock:
+            if len(self._idle) < _MAX_IDLE_PER_HOST:
+                self._idle.append((conn, time.monotonic()))
+                return
+        conn.close()
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn, _ in idle:
+            conn.close()
+
+    def _new_connection(self, timeout: float) -> http.client.HTTPConnection:
+        host, port = self.host, self.port
+        if self._proxy is not None:
+            host, port = self._proxy
+        if self.scheme == "https":
+            conn: http.client.HTTPConnection = _PooledHTTPSConnection(
+                host, port, pool=self, timeout=timeout,
+            )
+            if self._proxy is not None:
+                conn.set_tunnel(self.host, self.port)
+            return conn
+        return http.client.HTTPConnection(host, port, timeout=timeout)
+
+
+def _is_dropped(conn: http.client.HTTPConnection) -> bool:
+    """True if an idle connection is readable, i.e. the server closed it."""
+    sock = conn.sock
+    if sock is None:
+        return True
+    try:
+        readable, _, _ = select.select([sock], [], [], 0)
+    except (OSError, ValueError):
+        return True
+    return bool(readable)
+
+
+_POOLS: dict[tuple[str, str, int], _HostPool] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def _pool_for(scheme: str, host: str, port: int) -> _HostPool:
+    key = (scheme, host, port)
+    with _POOLS_LOCK:
+        pool = _POOLS.get(key)
+        if pool is None:
+            pool = _POOLS[key] = _HostPool(scheme, host, port)
+        return pool
+
+
+def host_stats() -> dict[str, dict[str, int]]:
+    """Return per-host connection counters: opened, reused, tls_resumed."""
+    with _POOLS_LOCK:
+        pools = list(_POOLS.values())
+    stats: dict[str, dict[str, int]] = {}
+    for pool in pools:
+        default_port = 443 if pool.scheme == "https" else 80
+        name = pool.host if pool.port == default_port else f"{pool.host}:{pool.port}"
+        entry = stats.setdefault(name, {"opened": 0, "reused": 0, "tls_resumed": 0})
+        for key, value in pool.stats.items():
+            entry[key] += value
+    return stats
+
+
+def log_host_stats() -> None:
+    """Log the per-host connection counters at INFO level."""
+    for host, stats in sorted(host_stats().items()):
+        logger.info(
+            "HTTP %s: %d connection(s) opened, %d reused, %d TLS session(s) resumed",
+            host, stats["opened"], stats["reused"], stats["tls_resumed"],
+        )
+
+
+def close_all() -> None:
+    """Close every idle pooled connection and forget all pools and counters."""
+    with _POOLS_LOCK:
+        pools = list(_POOLS.values())
+        _POOLS.clear()
+    for pool in pools:
+        pool.close()
+
+
+def request(
+    method: str,
+    url: str,
+    *,
+    body: bytes | None = None,
+    headers: Mapping[str, str] | None = None,
+    timeout: float = DEFAULT_TIMEOUT_SECONDS,
+    retries: int | None = None,
+) -> Response:
+    """Send a request and read the whole body.
+
+    Raises ``HTTPStatusError`` for 4xx/5xx answers.
+    """
+    with stream(method, url, body=body, headers=headers, timeout=timeout, retries=retries) as resp:
+        data = resp.read()
+        if resp.status >= 400:
+            raise HTTPStatusError(resp.status, data, resp.headers, url)
+        return Response(status=resp.status, headers=resp.headers, body=data)
+
+
+@contextmanager
+def stream(
+    method: str,
+    url: str,
+    *,
+    body: bytes | None = None,
+    headers: Mapping[str, str] | None = None,
+    timeout: float = DEFAULT_TIMEOUT_SECONDS,
+    retries: int | None = None,
+) -> Iterator[http.client.HTTPResponse]:
+    """Send a request and yield the unread response for incremental reads.
+
+    Redirects are followed for GET/HEAD. Idempotent requests are retried on
+    connection errors and 502/503/504 (*retries* times, default 1, with
+    exponential backoff). Non-idempotent requests are only retried when a
+    reused keep-alive connection fails while the request is being written,
+    never once it was sent, so the server cannot act on it twice.
+    The connection goes back to the pool if the body was fully read.
+    """
+    method = method.upper()
+    resp, conn, pool = _send(method, url, body, headers, timeout, retries)
+    try:
+        yield resp
+    finally:
+        _finish(pool, conn, resp)
+
+
+def _send(
+    method: str,
+    url: str,
+    body: bytes | None,
+    headers: Mapping[str, str] | None,
+    timeout: float,
+    retries: int | None,
+) -> tuple[http.client.HTTPResponse, http.client.HTTPConnection, _HostPool]:
+    idempotent = method in _IDEMPOTENT_METHODS
+    if retries is None:
+        retries = _DEFAULT_RETRIES if idempotent else 0
+
+    all_headers = {"User-Agent": _USER_AGENT}
+    all_headers.update(headers or {})
+
+    attempt = 0
+    redirects = 0
+    while True:
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        if scheme not in ("http", "https") or not parts.hostname:
+            raise ValueError(f"Unsupported URL: {url}")
+        port = parts.port or (443 if scheme == "https" else 80)
+        pool = _pool_for(scheme, parts.hostname.lower(), port)
+        target = url if pool.absolute_target else (parts.path or "/") + (
+            f"?{parts.query}" if parts.query else ""
+        )
+
+        conn, reused = pool.acquire(timeout, check_alive=not idempotent)
+        sent = False
+        try:
+            conn.request(method, target, body=body, headers=all_headers)
+            sent = True
+            resp = conn.getresponse()
+        except Exception as exc:
+            conn.close()
+            # Once a POST is written the server may have acted on it even if
+            # the connection then drops, so only a failed write is retried.
+            if reused and isinstance(exc, _STALE_ERRORS) and (idempotent or not sent):
+                logger.debug("Stale pooled connection to %s, reconnecting", pool.host)
+                continue
+            if idempotent and attempt < retries and _is_retryable_error(exc):
+                attempt += 1
+                _backoff(attempt, url, exc)
+                continue
+            raise
+
+        location = resp.getheader("Location")
+        if (
+            resp.status in _REDIRECT_STATUSES
+            and idempotent
+            and location
+            and redirects < _MAX_REDIRECTS
+        ):
+            resp.read()
+            _finish(pool, conn, resp)
+            url = urljoin(url, location)
+            redirects += 1
+            continue
+
+        if resp.status in _RETRY_STATUSES and idempotent and attempt < retries:
+            resp.read()
+            _finish(pool, conn, resp)
+            attempt += 1
+            _backoff(attempt, url, f"HTTP {resp.status}")
+            continue
+
+        return resp, conn, pool
+
+
+def _finish(
+    pool: _HostPool,
+    conn: http.client.HTTPConnection,
+    resp: http.client.HTTPResponse,
+) -> None:
+    """Return *conn* to the pool if *resp* was fully consumed, else close it."""
+    if not resp.isclosed() and resp.length == 0:
+        resp.read()  # bodiless responses (304, HEAD) have nothing left to drain
+    if resp.isclosed() and not resp.will_close:
+        pool.release(conn)
+    else:
+        resp.close()
+        conn.close()
+
+
+def _is_retryable_error(exc: Exception) -> bool:
+    # A timeout means the host is slow, not flaky; retrying only doubles the wait.
+    if isinstance(exc, TimeoutError):
+        return False
+    return isinstance(exc, (ConnectionError, http.client.HTTPException))
+
+
+def _backoff(attempt: int, url: str, reason: object) -> None:
+    delay = _BACKOFF_SECONDS * (2 ** (attempt - 1))
+    logger.info("Retrying %s in %.1fs (%s)", url, delay, reason)
+    time.sleep(delay)
+
+
+def _proxy_for(scheme: str, host: str) -> tuple[str, int] | None:
+    """Return the (host, port) of the proxy configured for *scheme*, if any."""
+    proxy_url = urllib.request.getproxies().get(scheme)
+    if not proxy_url or urllib.request.proxy_bypass(host):
+        return None
+    parts = urlsplit(proxy_url if "://" in proxy_url else f"http://{proxy_url}")
+    if not parts.hostname:
+        return None
+    return parts.hostname, parts.port or 80
@@ -0,0 +1,64 @@
+"""Tests for the memory-mapped Bloom filter."""
+
+from __future__ import annotations
+
+import pickle
+
+from auto_card_news_v2.feed.bloom import BloomFilter
+
+
+def _urls(prefix: str, n: int) -> list[str]:
+    return [f"https://example.com/{prefix}/{i}" for i in range(n)]
+
+
+def test_no_false_negatives_and_bounded_false_positives():
+    bloom = BloomFilter.for_capacity(5000, fp_rate=0.01)
+    for url in _urls("in", 5000):
+        bloom.add(url)
+
+    assert all(url in bloom for url in _urls("in", 5000))
+    false_positives = sum(url in bloom for url in _urls("out", 20000))
+    assert false_positives / 20000 < 0.02
+    assert 0.005 < bloom.false_positive_rate < 0.015
+    assert len(bloom) == 5000
+
+
+def test_save_and_mmap_load_round_trip(tmp_path):
+    path = tmp_path / "history.bloom"
+    bloom = BloomFilter.for_capacity(100)
+    bloom.add("https://example.com/a")
+    bloom.generation = 7
+    bloom.save(path)
+
+    loaded = BloomFilter.load(path)
+    assert loaded is not None
+    assert "https://example.com/a" in loaded
+    assert "https://example.com/b" not in loaded
+    assert (loaded.count, loaded.generation, loaded.nbytes) == (1, 7, bloom.nbytes)
+
+    # Adding to the mapped copy does not touch the file until it is saved.
+    loaded.add("https://example.com/b")
+    assert "https://example.com/b" not in BloomFilter.load(path)
+
+
+def test_load_rejects_missing_or_damaged_file(tmp_path):
+    path = tmp_path / "history.bloom"
+    assert BloomFilter.load(path) is None
+    path.write_bytes(b"not a filter")
+    assert BloomFilter.load(path) is None
+
+    BloomFilter.for_capacity(100).save(path)
+    path.write_bytes(path.read_bytes()[:-1])
+    assert BloomFilter.load(path) is None
+
+
+def test_pickles_mapped_filter(tmp_path):
+    path = tmp_path / "history.bloom"
+    bloom = BloomFilter.for_capacity(100)
+    bloom.add("https://example.com/a")
+    bloom.save(path)
+
+    copy = pickle.loads(pickle.dumps(BloomFilter.load(path)))
+    assert "https://example.com/a" in copy
+    copy.add("https://example.com/b")
+    assert "https://example.com/b" in copy
@@ -0,0 +1,93 @@
+"""Tests for adaptive per-feed polling."""
+
+from __future__ import annotations
+
+from auto_card_news_v2.feed.cadence import (
+    due_feeds,
+    format_cadence_status,
+    item_timestamp,
+    record_polls,
+)
+from auto_card_news_v2.models import FeedFetchResult, FeedItem
+
+_NOW = 1_800_000_000.0
+_MIN = 15 * 60
+_MAX = 6 * 60 * 60
+
+
+def _item(ts: float) -> FeedItem:
+    from email.utils import formatdate
+
+    return FeedItem(title="t", url=f"https://a.com/{ts}", published_at=formatdate(ts, usegmt=True))
+
+
+def test_item_timestamp_rfc822_and_iso():
+    assert item_timestamp(FeedItem(title="t", url="u", published_at="Thu, 30 Jan 2026 08:00:00 GMT")) == 1769760000.0
+    assert item_timestamp(FeedItem(title="t", url="u", published_at="2026-01-30T08:00:00Z")) == 1769760000.0
+    assert item_timestamp(FeedItem(title="t", url="u", published_at="garbage")) is None
+    assert item_timestamp(FeedItem(title="t", url="u")) is None
+
+
+def test_item_timestamp_prefers_parsed_value():
+    item = FeedItem(title="t", url="u", published_at="garbage", published_ts=123.0)
+    assert item_timestamp(item) == 123.0
+
+
+def test_due_feeds_unknown_feed_is_due():
+    assert due_feeds(["https://a.com/rss"], {}, now=_NOW) == ["https://a.com/rss"]
+
+
+def test_due_feeds_skips_not_yet_due():
+    state = {
+        "https://a.com/rss": {"next_due": _NOW + 3600},
+        "https://b.com/rss": {"next_due": _NOW - 10},
+        "https://c.com/rss": {"next_due": _NOW + 60},  # within slack
+    }
+    assert due_feeds(list(state), state, now=_NOW) == ["https://b.com/rss", "https://c.com/rss"]
+
+
+def test_record_polls_learns_median_gap():
+    items = tuple(_item(_NOW - i * 3600) for i in range(6))  # hourly
+    state: dict[str, dict] = {}
+
+    record_polls(state, [FeedFetchResult(url="f", items=items)], now=_NOW, min_interval=_MIN, max_interval=_MAX)
+
+    assert state["f"]["interval_seconds"] == 3600
+    assert state["f"]["next_due"] == _NOW + 3600
+
+
+def test_record_polls_clamps_to_bounds():
+    fast = tuple(_item(_NOW - i * 60) for i in range(6))
+    slow = tuple(_item(_NOW - i * 86400) for i in range(6))
+    state: dict[str, dict] = {}
+
+    record_polls(
+        state,
+        [FeedFetchResult(url="fast", items=fast), FeedFetchResult(url="slow", items=slow)],
+        now=_NOW, min_interval=_MIN, max_interval=_MAX,
+    )
+
+    assert state["fast"]["interval_seconds"] == _MIN
+    assert state["slow"]["interval_seconds"] == _MAX
+
+
+def test_record_polls_backs_off_when_nothing_new():
+    state = {"f": {"interval_seconds": 3600, "newest_item_ts": _NOW}}
+
+    record_polls(state, [FeedFetchResult(url="f", not_modified=True)], now=_NOW, min_interval=_MIN, max_interval=_MAX)
+
+    assert state["f"]["interval_seconds"] == 5400
+
+
+def test_record_polls_ignores_failures():
+    state: dict[str, dict] = {}
+    record_polls(state, [FeedFetchResult(url="f", error="boom")], now=_NOW)
+    assert state == {}
+
+
+def test_format_cadence_status():
+    state = {"https://a.com/rss": {"interval_seconds": 5400, "next_due": _NOW + 1800}}
+    text = format_cadence_status(["https://a.com/rss", "https://b.com/rss"], state, now=_NOW)
+
+    assert "every 1h30m, due in 30m" in text
+    assert "not polled yet" in text
@@ -0,0 +1,401 @@
+"""Tests for the concurrent feed collection stage."""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from contextlib import contextmanager
+from email.utils import formatdate
+from io import BytesIO
+from functools import partial
+from unittest.mock import patch
+
+from auto_card_news_v2.feed import collector
+from auto_card_news_v2.feed.collector import _interleave_by_host, collect_feeds
+from auto_card_news_v2.feed.fetcher import FeedStream, FetchResponse
+from auto_card_news_v2.feed.parallel import parse_pool
+from auto_card_news_v2.feed.state import save_cached_items
+from auto_card_news_v2.models import FeedItem
+
+_FETCH = "auto_card_news_v2.feed.collector.fetch_feed_conditional"
+_OPEN_STREAM = "auto_card_news_v2.feed.collector.open_feed_stream"
+
+
+def _streamed(body: bytes, reads: list[BytesIO] | None = None):
+    """Stand-in for ``open_feed_stream`` serving *body*."""
+
+    @contextmanager
+    def open_stream(url: str, **kwargs):
+        raw = BytesIO(body)
+        if reads is not None:
+            reads.append(raw)
+        yield FeedStream(200, resp=raw)
+
+    return open_stream
+
+_RSS = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel>
+  <item><title>Story</title><link>https://example.com/story</link></item>
+</channel></rss>
+"""
+
+
+def test_collect_feeds_preserves_input_order():
+    delays = {
+        "https://a.com/rss": 0.05,
+        "https://b.com/rss": 0.0,
+        "https://c.com/rss": 0.02,
+    }
+
+    def fake_fetch(url: str, **kwargs) -> FetchResponse:
+        time.sleep(delays[url])
+        return FetchResponse(status=200, body=_RSS)
+
+    with patch(_FETCH, side_effect=fake_fetch):
+        results = collect_feeds(list(delays), max_workers=3)
+
+    assert [r.url for r in results] == list(delays)
+    assert all(len(r.items) == 1 for r in results)
+
+
+def test_collect_feeds_records_latency_and_bytes():
+    with patch(_FETCH, return_value=FetchResponse(status=200, body=_RSS)):
+        [result] = collect_feeds(["https://a.com/rss"])
+
+    assert result.error is None
+    assert result.num_bytes == len(_RSS)
+    assert result.latency_ms >= 0
+
+
+def test_collect_feeds_captures_errors():
+    def fake_fetch(url: str, **kwargs) -> FetchResponse:
+        if "bad" in url:
+            raise OSError("connection refused")
+        return FetchResponse(status=200, body=_RSS)
+
+    with patch(_FETCH, side_effect=fake_fetch):
+        results = collect_feeds(["https://bad.com/rss", "https://good.com/rss"])
+
+    assert results[0].error == "connection refused"
+    assert results[0].items == ()
+    assert results[1].error is None
+
+
+def test_collect_feeds_respects_per_host_limit():
+    lock = threading.Lock()
+    active = {"now": 0, "peak": 0}
+
+    def fake_fetch(url: str, **kwargs) -> FetchResponse:
+        with lock:
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+        time.sleep(0.02)
+        with lock:
+            active["now"] -= 1
+        return FetchResponse(status=200, body=_RSS)
+
+    urls = [f"https://same.com/rss/{i}" for i in range(6)]
+    with patch(_FETCH, side_effect=fake_fetch):
+        results = collect_feeds(urls, max_workers=6, per_host=2)
+
+    assert len(results) == 6
+    assert active["peak"] <= 2
+
+
+def test_collect_feeds_sends_stored_validators(tmp_path):
+    state = {"https://a.com/rss": {"etag": '"v1"', "last_modified": "Mon, 01 Jan 2026 00:00:00 GMT"}}
+    response = FetchResponse(status=200, body=_RSS, etag='"v2"')
+
+    with patch(_FETCH, return_value=response) as mock_fetch:
+        collect_feeds(["https://a.com/rss"], state=state, cache_dir=tmp_path)
+
+    kwargs = mock_fetch.call_args.kwargs
+    assert kwargs["etag"] == '"v1"'
+    assert kwargs["last_modified"] == "Mon, 01 Jan 2026 00:00:00 GMT"
+    entry = state["https://a.com/rss"]
+    assert entry["etag"] == '"v2"'
+    assert "last_modified" not in entry
+    assert entry["parse_engine"] == "fast"
+    assert entry["body_sha256"] == hashlib.sha256(_RSS).hexdigest()
+
+
+def test_collect_feeds_not_modified_reuses_cache_without_parsing(tmp_path):
+    url = "https://a.com/rss"
+    cached = [FeedItem(title="Cached", url="https://a.com/cached")]
+    save_cached_items(url, cached, cache_dir=tmp_path)
+    state = {url: {"etag": '"v1"'}}
+
+    with (
+        patch(_FETCH, return_value=FetchResponse(status=304, etag='"v1"')),
+        patch("auto_card_news_v2.feed.collector.parse_feed") as mock_parse,
+    ):
+        [result] = collect_feeds([url], state=state, cache_dir=tmp_path)
+
+    mock_parse.assert_not_called()
+    assert result.not_modified is True
+    assert result.items == tuple(cached)
+    assert state[url]["etag"] == '"v1"'
+
+
+def test_collect_feeds_not_modified_without_cache_refetches(tmp_path):
+    url = "https://a.com/rss"
+    responses = [
+        FetchResponse(status=304, etag='"v1"'),
+        FetchResponse(status=200, body=_RSS, etag='"v1"'),
+    ]
+
+    with patch(_FETCH, side_effect=responses) as mock_fetch:
+        [result] = collect_feeds([url], state={url: {"etag": '"v1"'}}, cache_dir=tmp_path)
+
+    assert mock_fetch.call_count == 2
+    assert result.not_modified is False
+    assert len(result.items) == 1
+
+
+def test_collect_feeds_streaming_limits_and_skips_published():
+    rss = b"""<?xml version="1.0"?><rss version="2.0"><channel>
+      <item><title>Old</title><link>https://example.com/old</link></item>
+      <item><title>New 1</title><link>https://example.com/new-1</link></item>
+      <item><title>New 2</title><link>https://example.com/new-2</link></item>
+    </channel></rss>"""
+
+    with patch(_OPEN_STREAM, _streamed(rss)):
+        [result] = collect_feeds(
+            ["https://example.com/rss"],
+            streaming=True,
+            item_limit=1,
+            published={"https://example.com/old"},
+        )
+
+    assert [i.url for i in result.items] == ["https://example.com/new-1"]
+    assert result.skipped_published == 1
+
+
+def test_collect_feeds_streaming_falls_back_on_malformed_xml():
+    with (
+        patch(_OPEN_STREAM, _streamed(b"<rss><broken>")),
+        patch("auto_card_news_v2.feed.collector.parse_feed", return_value=[FeedItem(title="x", url="u")]),
+    ):
+        [result] = collect_feeds(["https://example.com/rss"], streaming=True)
+
+    assert result.error is None
+    assert len(result.items) == 1
+
+
+def test_collect_feeds_streaming_stops_downloading_at_limit():
+    entries = "".join(
+        f"<item><title>Story {i}</title><link>https://example.com/{i}</link>"
+        f"<description>{'x' * 200}</description></item>"
+        for i in range(2000)
+    )
+    rss = f'<?xml version="1.0"?><rss version="2.0"><channel>{entries}</channel></rss>'.encode()
+    reads: list[BytesIO] = []
+
+    with patch(_OPEN_STREAM, _streamed(rss, reads)):
+        [result] = collect_feeds(["https://example.com/rss"], streaming=True, item_limit=2)
+
+    assert [i.url for i in result.items] == ["https://example.com/0", "https://example.com/1"]
+    # Only the first chunk was read off the connection.
+    assert reads[0].tell() < len(rss) // 2
+    assert result.num_bytes == reads[0].tell()
+
+
+def _dated_rss(*numbers: int) -> bytes:
+    items = "".join(
+        f"<item><title>S{n}</title><link>https://a.com/{n}</link>"
+        f"<pubDate>{formatdate(1_769_760_000 + n * 60, usegmt=True)}</pubDate></item>"
+        for n in numbers
+    )
+    return f'<?xml version="1.0"?><rss version="2.0"><channel>{items}</channel></rss>'.encode()
+
+
+def test_collect_feeds_streaming_cut_window_ignores_cursor(tmp_path):
+    url = "https://a.com/rss"
+    state: dict = {}
+
+    with patch(_OPEN_STREAM, _streamed(_dated_rss(5, 4, 3, 2, 1))):
+        collect_feeds([url], state=state, cache_dir=tmp_path, streaming=True, item_limit=2)
+
+    # 3, 2 and 1 were never ingested, so the cursor at 5 must not hide them.
+    with patch(_OPEN_STREAM, _streamed(_dated_rss(6, 5, 4, 3, 2, 1))):
+        [result] = collect_feeds(
+            [url], state=state, cache_dir=tmp_path, streaming=True, item_limit=2,
+            published={"https://a.com/5", "https://a.com/4"},
+        )
+
+    assert [i.url for i in result.items] == ["https://a.com/6", "https://a.com/3"]
+
+
+def test_collect_feeds_streaming_cursor_keeps_cached_items(tmp_path):
+    url = "https://a.com/rss"
+    state: dict = {}
+
+    with patch(_OPEN_STREAM, _streamed(_dated_rss(2, 1))):
+        collect_feeds([url], state=state, cache_dir=tmp_path, streaming=True, item_limit=5)
+
+    with patch(_OPEN_STREAM, _streamed(_dated_rss(4, 3, 2, 1))):
+        [result] = collect_feeds(
+            [url], state=state, cache_dir=tmp_path, streaming=True, item_limit=5,
+        )
+
+    assert [i.url for i in result.items] == [
+        "https://a.com/4", "https://a.com/3", "https://a.com/2", "https://a.com/1",
+    ]
+
+
+def test_interleave_by_host_round_robin():
+    urls = [
+        "https://a.com/1",
+        "https://a.com/2",
+        "https://b.com/1",
+        "https://a.com/3",
+    ]
+    assert _interleave_by_host(urls) == [0, 2, 1, 3]
+
+
+def test_collect_feeds_with_parse_pool():
+    with (
+        patch(_FETCH, return_value=FetchResponse(status=200, body=_RSS)),
+        patch(
+            "auto_card_news_v2.feed.collector.parse_pool",
+            partial(parse_pool, min_pool_bytes=0),
+        ),
+    ):
+        results = collect_feeds(
+            ["https://a.com/rss", "https://b.com/rss"], parse_processes=2,
+        )
+
+    assert [len(r.items) for r in results] == [1, 1]
+    assert all(r.error is None for r in results)
+
+
+def test_collect_feeds_starts_with_remembered_parse_engine(tmp_path):
+    url = "https://a.com/rss"
+    state = {url: {"parse_engine": "feedparser"}}
+
+    with (
+        patch(_FETCH, return_value=FetchResponse(status=200, body=_RSS)),
+        patch("auto_card_news_v2.feed.parser._parse_with_xml") as fast,
+    ):
+        [result] = collect_feeds([url], state=state, cache_dir=tmp_path)
+
+    fast.assert_not_called()
+    assert len(result.items) == 1
+    assert state[url]["parse_engine"] == "feedparser"
+
+
+def _rss_with(build_date: str, *links: str) -> bytes:
+    items = "".join(
+        f"<item><title>Story {link}</title><link>https://a.com/{link}</link></item>"
+        for link in links
+    )
+    return (
+        f'<?xml version="1.0"?><rss version="2.0"><channel><title>A</title>'
+        f"<lastBuildDate>{build_date}</lastBuildDate>{items}</channel></rss>"
+    ).encode()
+
+
+def test_collect_feeds_identical_body_skips_parsing(tmp_path):
+    url = "https://a.com/rss"
+    state: dict = {}
+    body = _rss_with("Mon", "1", "2")
+
+    with patch(_FETCH, return_value=FetchResponse(status=200, body=body)):
+        collect_feeds([url], state=state, cache_dir=tmp_path)
+        with patch("auto_card_news_v2.feed.collector.parse_feed") as mock_parse:
+            [result] = collect_feeds([url], state=state, cache_dir=tmp_path)
+
+    mock_parse.assert_not_called()
+    assert result.not_modified is True
+    assert [i.url for i in result.items] == ["https://a.com/1", "https://a.com/2"]
+
+
+def test_collect_feeds_parses_only_changed_entries(tmp_path):
+    url = "https://a.com/rss"
+    state: dict = {}
+    first = _rss_with("Mon", "1", "2")
+    second = _rss_with("Tue", "3", "1", "2")
+
+    with patch(_FETCH, return_value=FetchResponse(status=200, body=first)):
+        collect_feeds([url], state=state, cache_dir=tmp_path)
+
+    with (
+        patch(_FETCH, return_value=FetchResponse(status=200, body=second)),
+        patch.object(collector, "parse_feed", wraps=collector.parse_feed) as spy,
+    ):
+        [result] = collect_feeds([url], state=state, cache_dir=tmp_path)
+
+    assert spy.call_count == 1
+    assert b"https://a.com/3" in spy.call_args.args[0]
+    assert b"https://a.com/1" not in spy.call_args.args[0]
+    assert [i.url for i in result.items] == [
+        "https://a.com/3", "https://a.com/1", "https://a.com/2",
+    ]
+    assert result.not_modified is False
+
+
+def test_collect_feeds_first_fetch_parses_body_once(tmp_path):
+    url = "https://a.com/rss"
+    state: dict = {}
+
+    with (
+        patch(_FETCH, return_value=FetchResponse(status=200, body=_rss_with("Mon", "1", "2", "3"))),
+        patch.object(collector, "parse_feed", wraps=collector.parse_feed) as spy,
+    ):
+        [result] = collect_feeds([url], state=state, cache_dir=tmp_path)
+
+    assert spy.call_count == 1
+    assert len(result.items) == 3
+
+
+def test_collect_feeds_cursor_parses_only_new_head(tmp_path):
+    url = "https://a.com/rss"
+    state: dict = {}
+
+    def body(*numbers: int) -> bytes:
+        # <ttl> between items keeps the body from being split per entry, so
+        # the cursor (not the entry fingerprints) does the work.
+        items = "<ttl>60</ttl>".join(
+            f"<item><title>S{n}</title><link>https://a.com/{n}</link>"
+            f"<pubDate>{formatdate(1_769_760_000 + n * 60, usegmt=True)}</pubDate></item>"
+            for n in numbers
+        )
+        return f'<?xml version="1.0"?><rss version="2.0"><channel>{items}</channel></rss>'.encode()
+
+    with patch(_FETCH, return_value=FetchResponse(status=200, body=body(3, 2, 1))):
+        collect_feeds([url], state=state, cache_dir=tmp_path)
+    assert state[url]["cursor"]["newest_url"] == "https://a.com/3"
+    assert state[url]["cursor"]["ordered"] is True
+
+    with patch(_FETCH, return_value=FetchResponse(status=200, body=body(5, 4, 3, 2))):
+        [result] = collect_feeds([url], state=state, cache_dir=tmp_path)
+
+    # 1 is no longer listed; 3 and 2 still are and come from the cache.
+    assert [i.url for i in result.items] == [
+        "https://a.com/5", "https://a.com/4", "https://a.com/3", "https://a.com/2",
+    ]
+    assert state[url]["cursor"]["newest_url"] == "https://a.com/5"
+
+
+def test_collect_feeds_cursor_keeps_unpublished_items_still_listed(tmp_path):
+    url = "https://a.com/rss"
+    state: dict = {}
+    published = {f"https://a.com/{n}" for n in (6, 5, 4, 3)}
+
+    def body(*numbers: int) -> bytes:
+        items = "<ttl>60</ttl>".join(
+            f"<item><title>S{n}</title><link>https://a.com/{n}</link>"
+            f"<pubDate>{formatdate(1_769_760_000 + n * 60, usegmt=True)}</pubDate></item>"
+            for n in numbers
+        )
+        return f'<?xml version="1.0"?><rss version="2.0"><channel>{items}</channel></rss>'.encode()
+
+    with patch(_FETCH, return_value=FetchResponse(status=200, body=body(6, 5, 4, 3, 2, 1))):
+        collect_feeds([url], state=state, cache_dir=tmp_path, published=published)
+    with patch(_FETCH, return_value=FetchResponse(status=200, body=body(8, 7, 6, 5, 4, 3, 2, 1))):
+        [result] = collect_feeds([url], state=state, cache_dir=tmp_path, published=published)
+
+    assert [i.url for i in result.items] == [
+        "https://a.com/8", "https://a.com/7", "https://a.com/2", "https://a.com/1",
+    ]
@@ -0,0 +1,89 @@
+"""Tests for the per-feed ingest cursor."""
+
+from __future__ import annotations
+
+from email.utils import formatdate
+
+from auto_card_news_v2.feed.cursor import (
+    advance_cursor,
+    cursor_from_state,
+    cursor_to_state,
+    reached_cursor,
+)
+from auto_card_news_v2.feed.parser import ParseStats, parse_feed, stream_feed
+from auto_card_news_v2.models import FeedCursor, FeedItem
+
+_T0 = 1_769_760_000.0
+
+
+def _rss(*entries: tuple[int, float]) -> bytes:
+    items = "".join(
+        f"<item><title>S{n}</title><link>https://a.com/{n}</link>"
+        f"<pubDate>{formatdate(ts, usegmt=True)}</pubDate></item>"
+        for n, ts in entries
+    )
+    return f'<?xml version="1.0"?><rss version="2.0"><channel>{items}</channel></rss>'.encode()
+
+
+def _item(n: int, ts: float | None) -> FeedItem:
+    return FeedItem(title=f"S{n}", url=f"https://a.com/{n}", published_ts=ts)
+
+
+def test_advance_cursor_newest_first():
+    cursor = advance_cursor([_item(3, _T0 + 20), _item(2, _T0 + 10), _item(1, _T0)])
+    assert cursor == FeedCursor("https://a.com/3", _T0 + 20, ordered=True)
+
+
+def test_advance_cursor_out_of_order():
+    cursor = advance_cursor([_item(1, _T0), _item(3, _T0 + 20), _item(2, _T0 + 10)])
+    assert cursor == FeedCursor("https://a.com/3", _T0 + 20, ordered=False)
+
+
+def test_cursor_state_round_trip():
+    cursor = FeedCursor("https://a.com/3", _T0, ordered=True)
+    assert cursor_from_state({"cursor": cursor_to_state(cursor)}) == cursor
+    assert cursor_from_state({}) is None
+
+
+def test_unordered_cursor_never_stops():
+    cursor = FeedCursor("https://a.com/1", _T0, ordered=False)
+    assert not reached_cursor(cursor, "https://a.com/1", _T0 - 10)
+
+
+def test_parse_stops_at_cursor():
+    data = _rss((4, _T0 + 30), (3, _T0 + 20), (2, _T0 + 10), (1, _T0))
+    stats = ParseStats()
+    items = parse_feed(
+        data, stats=stats, cursor=FeedCursor("https://a.com/2", _T0 + 10, ordered=True),
+    )
+    assert [i.url for i in items] == ["https://a.com/4", "https://a.com/3"]
+    assert stats.stopped_at_cursor
+    assert stats.entries == 2
+
+
+def test_parse_stops_at_older_entry_when_cursor_entry_is_gone():
+    data = _rss((4, _T0 + 30), (1, _T0))
+    items = parse_feed(
+        data, cursor=FeedCursor("https://a.com/2", _T0 + 10, ordered=True),
+    )
+    assert [i.url for i in items] == ["https://a.com/4"]
+
+
+def test_parse_ignores_cursor_for_out_of_order_feed():
+    data = _rss((1, _T0), (4, _T0 + 30), (2, _T0 + 10))
+    stats = ParseStats()
+    items = parse_feed(
+        data, stats=stats, cursor=FeedCursor("https://a.com/2", _T0 + 10, ordered=False),
+    )
+    assert len(items) == 3
+    assert not stats.stopped_at_cursor
+
+
+def test_stream_feed_stops_at_cursor():
+    data = _rss((3, _T0 + 20), (2, _T0 + 10), (1, _T0))
+    stats = ParseStats()
+    items = list(stream_feed(
+        data, stats=stats, cursor=FeedCursor("https://a.com/2", _T0 + 10, ordered=True),
+    ))
+    assert [i.url for i in items] == ["https://a.com/3"]
+    assert stats.stopped_at_cursor
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from auto_card_news_v2.feed.dedup import deduplicate
+from auto_card_news_v2.feed.urls import CanonicalStats
 from auto_card_news_v2.models import FeedItem
 
 
@@ -25,3 +26,19 @@ def test_deduplicate_normalizes_trailing_slash():
     ]
     result = deduplicate(items)
     assert len(result) == 1
+
+
+def test_deduplicate_counts_duplicates_only_canonical_urls_catch():
+    stats = CanonicalStats()
+    items = [
+        FeedItem(title="A", url="https://example.com/a?utm_source=rss"),
+        FeedItem(title="A2", url="https://m.example.com/a#top"),
+        FeedItem(title="A3", url="https://example.com/a?utm_source=rss/"),
+        FeedItem(title="B", url="https://example.com/b"),
+    ]
+    result = deduplicate(items, stats=stats)
+
+    assert [i.title for i in result] == ["A", "B"]
+    assert stats.duplicates == 2
+    assert stats.legacy_duplicates == 1
+    assert stats.extra_duplicates == 1
@@ -0,0 +1,125 @@
+"""Tests for feed HTTP fetching."""
+
+from __future__ import annotations
+
+import gzip
+import zlib
+from contextlib import contextmanager
+from email.message import Message
+from io import BytesIO
+from unittest.mock import patch
+
+import pytest
+
+from auto_card_news_v2.feed.fetcher import (
+    FeedTooLargeError,
+    fetch_feed,
+    fetch_feed_conditional,
+)
+from auto_card_news_v2.transport import HTTPStatusError
+
+
+class _FakeStream:
+    """Stand-in for the unread response yielded by ``transport.stream``."""
+
+    def __init__(self, body: bytes, headers: dict[str, str] | None = None, status: int = 200):
+        self.status = status
+        self.headers = Message()
+        for key, value in (headers or {}).items():
+            self.headers[key] = value
+        self.read = BytesIO(body).read
+
+
+def _mock_stream(body: bytes = b"", headers: dict[str, str] | None = None, status: int = 200):
+    fake = _FakeStream(body, headers, status)
+    calls: list[dict] = []
+
+    @contextmanager
+    def stream(method, url, **kwargs):
+        calls.append({"method": method, "url": url, **kwargs})
+        yield fake
+
+    stream.calls = calls  # type: ignore[attr-defined]
+    return stream
+
+
+_STREAM = "auto_card_news_v2.feed.fetcher.transport.stream"
+
+
+def test_fetch_feed_returns_body():
+    with patch(_STREAM, _mock_stream(b"<rss/>")):
+        assert fetch_feed("https://a.com/rss") == b"<rss/>"
+
+
+def test_fetch_conditional_sends_validators():
+    stream = _mock_stream(
+        b"<rss/>", {"ETag": '"v2"', "Last-Modified": "Tue, 02 Jan 2026 00:00:00 GMT"},
+    )
+    with patch(_STREAM, stream):
+        resp = fetch_feed_conditional(
+            "https://a.com/rss", etag='"v1"', last_modified="Mon, 01 Jan 2026 00:00:00 GMT",
+        )
+
+    headers = stream.calls[0]["headers"]
+    assert headers["If-None-Match"] == '"v1"'
+    assert headers["If-Modified-Since"] == "Mon, 01 Jan 2026 00:00:00 GMT"
+    assert resp.etag == '"v2"'
+    assert resp.last_modified == "Tue, 02 Jan 2026 00:00:00 GMT"
+
+
+def test_fetch_conditional_not_modified():
+    with patch(_STREAM, _mock_stream(status=304)):
+        resp = fetch_feed_conditional("https://a.com/rss", etag='"v1"')
+
+    assert resp.not_modified is True
+    assert resp.body == b""
+    assert resp.etag == '"v1"'
+
+
+def test_fetch_conditional_raises_other_errors():
+    with patch(_STREAM, _mock_stream(b"missing", status=404)):
+        with pytest.raises(HTTPStatusError) as exc_info:
+            fetch_feed_conditional("https://a.com/rss")
+
+    assert exc_info.value.status == 404
+
+
+def test_fetch_requests_compression():
+    stream = _mock_stream(b"<rss/>")
+    with patch(_STREAM, stream):
+        fetch_feed("https://a.com/rss")
+
+    assert "gzip" in stream.calls[0]["headers"]["Accept-Encoding"]
+
+
+def test_fetch_decodes_gzip():
+    body = b"<rss>" + b"<item>x</item>" * 5000 + b"</rss>"
+    compressed = gzip.compress(body)
+    with patch(_STREAM, _mock_stream(compressed, {"Content-Encoding": "gzip"})):
+        resp = fetch_feed_conditional("https://a.com/rss")
+
+    assert resp.body == body
+    assert resp.wire_bytes == len(compressed)
+    assert resp.wire_bytes < len(body)
+
+
+@pytest.mark.parametrize("wbits", [zlib.MAX_WBITS, -zlib.MAX_WBITS])
+def test_fetch_decodes_zlib_and_raw_deflate(wbits):
+    body = b"<rss>" + b"<item>y</item>" * 100 + b"</rss>"
+    compressor = zlib.compressobj(wbits=wbits)
+    compressed = compressor.compress(body) + compressor.flush()
+    with patch(_STREAM, _mock_stream(compressed, {"Content-Encoding": "deflate"})):
+        assert fetch_feed("https://a.com/rss") == body
+
+
+def test_fetch_rejects_oversized_decompressed_body():
+    bomb = gzip.compress(b"\0" * 1_000_000)
+    with patch(_STREAM, _mock_stream(bomb, {"Content-Encoding": "gzip"})):
+        with pytest.raises(FeedTooLargeError):
+            fetch_feed_conditional("https://a.com/rss", max_bytes=10_000)
+
+
+def test_fetch_rejects_oversized_plain_body():
+    with patch(_STREAM, _mock_stream(b"x" * 20_000)):
+        with pytest.raises(FeedTooLargeError):
+            fetch_feed_conditional("https://a.com/rss", max_bytes=10_000)
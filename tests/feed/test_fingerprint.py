@@ -0,0 +1,95 @@
+"""Tests for raw feed body fingerprinting."""
+
+from __future__ import annotations
+
+from auto_card_news_v2.feed.fingerprint import parse_changed_entries, split_entries
+from auto_card_news_v2.feed.parser import ParseStats, parse_feed
+
+_HEAD = b'<?xml version="1.0"?><rss version="2.0"><channel><title>T</title>'
+_TAIL = b"</channel></rss>"
+
+
+def _item(n: int) -> bytes:
+    return f"<item><title>S{n}</title><link>https://a.com/{n}</link></item>".encode()
+
+
+def test_split_entries_round_trip():
+    data = _HEAD + _item(1) + b"\n  " + _item(2) + _TAIL
+    head, entries, tail = split_entries(data)
+    assert head == _HEAD
+    assert entries == [_item(1), _item(2)]
+    assert tail == _TAIL
+
+
+def test_split_entries_rejects_markup_between_entries():
+    data = _HEAD + _item(1) + b"<ttl>60</ttl>" + _item(2) + _TAIL
+    assert split_entries(data) is None
+
+
+def test_split_entries_without_entries():
+    assert split_entries(_HEAD + _TAIL) is None
+
+
+def test_parse_changed_entries_reuses_known_entries():
+    def parse(data, url, stats):
+        return parse_feed(data, feed_url=url, stats=stats)
+
+    first, entry_map = parse_changed_entries(
+        _HEAD + _item(1) + _item(2) + _TAIL, "u", parse, ParseStats(), None,
+    )
+    stats = ParseStats()
+    items, _ = parse_changed_entries(
+        _HEAD + _item(0) + _item(1) + _item(2) + _TAIL, "u", parse, stats, (first, entry_map),
+    )
+
+    assert [i.url for i in items] == ["https://a.com/0", "https://a.com/1", "https://a.com/2"]
+    assert stats.entries == 1
+    assert stats.reused_entries == 2
+
+
+def _counting_parse(calls: list[bytes]):
+    def parse(data, url, stats):
+        calls.append(data)
+        return parse_feed(data, feed_url=url, stats=stats)
+
+    return parse
+
+
+def test_parse_changed_entries_without_previous_parses_once():
+    calls: list[bytes] = []
+    items, entry_map = parse_changed_entries(
+        _HEAD + _item(1) + _item(2) + _item(3) + _TAIL, "u", _counting_parse(calls),
+        ParseStats(), None,
+    )
+
+    assert len(calls) == 1
+    assert [i.url for i in items] == ["https://a.com/1", "https://a.com/2", "https://a.com/3"]
+    assert sorted(entry_map.values()) == [0, 1, 2]
+
+
+def test_parse_changed_entries_parses_new_entries_together():
+    first, entry_map = parse_changed_entries(
+        _HEAD + _item(1) + _item(2) + _item(3) + _TAIL, "u", _counting_parse([]),
+        ParseStats(), None,
+    )
+    calls: list[bytes] = []
+    stats = ParseStats()
+    items, _ = parse_changed_entries(
+        _HEAD + _item(5) + _item(4) + _item(1) + _item(2) + _item(3) + _TAIL, "u",
+        _counting_parse(calls), stats, (first, entry_map),
+    )
+
+    assert calls == [_HEAD + _item(5) + _item(4) + _TAIL]
+    assert [i.url for i in items][:2] == ["https://a.com/5", "https://a.com/4"]
+    assert stats.reused_entries == 3
+
+
+def test_parse_changed_entries_maps_entries_without_items():
+    untitled = b"<item><link>https://a.com/x</link></item>"
+    items, entry_map = parse_changed_entries(
+        _HEAD + _item(1) + untitled + _item(2) + _TAIL, "u", _counting_parse([]),
+        ParseStats(), None,
+    )
+
+    assert [i.url for i in items] == ["https://a.com/1", "https://a.com/2"]
+    assert list(entry_map.values()) == [0, None, 1]
@@ -0,0 +1,80 @@
+"""Tests for feed health tracking and the circuit breaker."""
+
+from __future__ import annotations
+
+from auto_card_news_v2.feed.health import (
+    format_health_report,
+    is_circuit_open,
+    record_health,
+    split_open_circuits,
+)
+from auto_card_news_v2.models import FeedFetchResult
+
+_NOW = 1_800_000_000.0
+
+
+def _fail(url: str = "f") -> FeedFetchResult:
+    return FeedFetchResult(url=url, error="timed out", latency_ms=15000)
+
+
+def _ok(url: str = "f", latency_ms: float = 200) -> FeedFetchResult:
+    return FeedFetchResult(url=url, latency_ms=latency_ms)
+
+
+def test_failure_opens_circuit_with_exponential_backoff():
+    state: dict[str, dict] = {}
+
+    record_health(state, [_fail()], now=_NOW)
+    assert state["f"]["consecutive_failures"] == 1
+    assert state["f"]["open_until"] == _NOW + 300
+
+    record_health(state, [_fail()], now=_NOW)
+    record_health(state, [_fail()], now=_NOW)
+    assert state["f"]["consecutive_failures"] == 3
+    assert state["f"]["open_until"] == _NOW + 1200
+
+
+def test_backoff_is_capped():
+    state = {"f": {"consecutive_failures": 30}}
+    record_health(state, [_fail()], now=_NOW)
+    assert state["f"]["open_until"] == _NOW + 24 * 3600
+
+
+def test_success_closes_circuit_and_tracks_latency():
+    state = {"f": {"consecutive_failures": 4, "open_until": _NOW + 999}}
+
+    record_health(state, [_ok(latency_ms=100)], now=_NOW)
+    record_health(state, [_ok(latency_ms=200)], now=_NOW + 60)
+
+    entry = state["f"]
+    assert entry["consecutive_failures"] == 0
+    assert "open_until" not in entry
+    assert entry["last_success"] == _NOW + 60
+    assert entry["avg_latency_ms"] == 130.0
+    assert entry["latency_samples"] == 2
+
+
+def test_split_open_circuits():
+    state = {
+        "a": {"open_until": _NOW + 60},
+        "b": {"open_until": _NOW - 60},
+    }
+    assert split_open_circuits(["a", "b", "c"], state, now=_NOW) == (["b", "c"], ["a"])
+    assert is_circuit_open(state["a"], now=_NOW) is True
+    assert is_circuit_open(state["b"], now=_NOW) is False
+
+
+def test_health_report_flags_slow_and_open_feeds():
+    state: dict[str, dict] = {}
+    for _ in range(3):
+        record_health(state, [_ok("slow", latency_ms=8000), _ok("fast", latency_ms=100)], now=_NOW)
+    record_health(state, [_fail("down")], now=_NOW)
+
+    report = format_health_report(["slow", "fast", "down", "new"], state, now=_NOW, slow_ms=5000)
+
+    lines = report.splitlines()
+    assert any(line.strip().startswith("slow") and "SLOW" in line for line in lines)
+    assert not any(line.strip().startswith("fast") and "SLOW" in line for line in lines)
+    assert any(line.strip().startswith("down") and "CIRCUIT OPEN" in line for line in lines)
+    assert "last error: timed out" in report
+    assert "no fetches recorded" in report
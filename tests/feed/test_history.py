@@ -3,12 +3,23 @@
 from __future__ import annotations
 
 import json
+import os
+import pickle
+import sqlite3
+import threading
+from datetime import datetime, timedelta, timezone
 
 from auto_card_news_v2.feed.history import (
+    compact_history,
     filter_already_published,
+    filter_expired,
     load_history,
+    load_story_fingerprints,
+    open_history,
     save_url,
 )
+from auto_card_news_v2.feed.urls import CanonicalStats
+from auto_card_news_v2.locking import file_lock, try_lock
 from auto_card_news_v2.models import FeedItem
 
 
@@ -17,36 +28,43 @@ def _make_item(url: str, title: str = "Test") -> FeedItem:
 
 
 def test_load_history_missing_file(tmp_path):
-    path = tmp_path / "history.json"
+    path = tmp_path / "history.db"
     result = load_history(history_path=path)
     assert result == set()
 
 
-def test_load_history_empty_file(tmp_path):
-    path = tmp_path / "history.json"
-    path.write_text('{"urls": {}}', encoding="utf-8")
+def test_load_history_empty_legacy_json(tmp_path):
+    path = tmp_path / "history.db"
+    path.with_suffix(".json").write_text('{"urls": {}}', encoding="utf-8")
     result = load_history(history_path=path)
     assert result == set()
 
 
 def test_load_history_corrupted_json(tmp_path):
-    path = tmp_path / "history.json"
-    path.write_text("not valid json!!!", encoding="utf-8")
+    path = tmp_path / "history.db"
+    path.with_suffix(".json").write_text("not valid json!!!", encoding="utf-8")
     result = load_history(history_path=path)
     assert result == set()
 
 
+def test_load_history_corrupted_database(tmp_path):
+    path = tmp_path / "history.db"
+    path.write_text("not a database", encoding="utf-8")
+    result = load_history(history_path=path)
+    assert result == set()
+    assert (tmp_path / "history.db.corrupt").exists()
+
+
 def test_save_url_creates_file(tmp_path):
-    path = tmp_path / "history.json"
+    path = tmp_path / "history.db"
     save_url("https://example.com/article1", history_path=path)
 
     assert path.exists()
-    data = json.loads(path.read_text(encoding="utf-8"))
-    assert "https://example.com/article1" in data["urls"]
+    assert "https://example.com/article1" in load_history(history_path=path)
 
 
 def test_save_url_appends(tmp_path):
-    path = tmp_path / "history.json"
+    path = tmp_path / "history.db"
     save_url("https://example.com/a", history_path=path)
     save_url("https://example.com/b", history_path=path)
 
@@ -56,7 +74,7 @@ def test_save_url_appends(tmp_path):
 
 
 def test_save_url_normalizes(tmp_path):
-    path = tmp_path / "history.json"
+    path = tmp_path / "history.db"
     save_url("https://Example.COM/Article/", history_path=path)
 
     urls = load_history(history_path=path)
@@ -64,14 +82,14 @@ def test_save_url_normalizes(tmp_path):
 
 
 def test_save_url_creates_parent_dirs(tmp_path):
-    path = tmp_path / "nested" / "dir" / "history.json"
+    path = tmp_path / "nested" / "dir" / "history.db"
     save_url("https://example.com/x", history_path=path)
     assert path.exists()
 
 
 def test_save_url_handles_corrupted_existing(tmp_path):
-    path = tmp_path / "history.json"
-    path.write_text("bad json", encoding="utf-8")
+    path = tmp_path / "history.db"
+    path.write_text("bad database", encoding="utf-8")
     save_url("https://example.com/recover", history_path=path)
 
     urls = load_history(history_path=path)
@@ -79,7 +97,7 @@ def test_save_url_handles_corrupted_existing(tmp_path):
 
 
 def test_load_history_reflects_saved(tmp_path):
-    path = tmp_path / "history.json"
+    path = tmp_path / "history.db"
     save_url("https://example.com/saved", history_path=path)
 
     urls = load_history(history_path=path)
@@ -87,7 +105,7 @@ def test_load_history_reflects_saved(tmp_path):
 
 
 def test_filter_already_published_removes_known(tmp_path):
-    path = tmp_path / "history.json"
+    path = tmp_path / "history.db"
     save_url("https://example.com/old", history_path=path)
 
     items = [
@@ -100,16 +118,336 @@ def test_filter_already_published_removes_known(tmp_path):
 
 
 def test_filter_already_published_empty_history(tmp_path):
-    path = tmp_path / "history.json"
+    path = tmp_path / "history.db"
     items = [_make_item("https://example.com/a")]
     result = filter_already_published(items, history_path=path)
     assert len(result) == 1
 
 
 def test_filter_already_published_normalizes_urls(tmp_path):
-    path = tmp_path / "history.json"
+    path = tmp_path / "history.db"
     save_url("https://example.com/article", history_path=path)
 
     items = [_make_item("https://Example.COM/Article/")]
     result = filter_already_published(items, history_path=path)
     assert len(result) == 0
+
+
+def test_filter_matches_pre_canonical_history_keys(tmp_path):
+    path = tmp_path / "history.db"
+    # Keys written before canonicalization: lowercased, trailing slash stripped.
+    path.with_suffix(".json").write_text(json.dumps({"urls": {
+        "https://www.example.com/old?utm_source=rss": "2026-01-30T00:00:00+00:00",
+        "https://www.example.com/kept": "2026-01-30T00:00:00+00:00",
+    }}), encoding="utf-8")
+    stats = CanonicalStats()
+
+    items = [
+        _make_item("https://m.example.com/old", "Mobile"),
+        _make_item("https://www.example.com/kept/", "Same key"),
+        _make_item("https://example.com/new", "New"),
+    ]
+    result = filter_already_published(items, history_path=path, stats=stats)
+
+    assert [i.title for i in result] == ["New"]
+    assert stats.duplicates == 2
+    assert stats.legacy_duplicates == 1
+
+
+def test_story_fingerprints_saved_and_loaded_within_window(tmp_path):
+    path = tmp_path / "history.db"
+    save_url("https://example.com/a", fingerprint={"bok", "rate"}, history_path=path)
+    save_url("https://example.com/b", history_path=path)
+
+    assert load_history(history_path=path) == {"https://example.com/a", "https://example.com/b"}
+
+    since = datetime.now(timezone.utc) - timedelta(hours=1)
+    assert load_story_fingerprints(since=since, history_path=path) == [
+        ("https://example.com/a", frozenset({"bok", "rate"})),
+    ]
+    later = datetime.now(timezone.utc) + timedelta(hours=1)
+    assert load_story_fingerprints(since=later, history_path=path) == []
+
+
+def test_legacy_json_migrated_once(tmp_path):
+    path = tmp_path / "history.db"
+    legacy = path.with_suffix(".json")
+    legacy.write_text(json.dumps({
+        "urls": {
+            "https://example.com/a": "2026-01-30T00:00:00+00:00",
+            "https://example.com/b?utm_source=rss": "2026-01-30T01:00:00",
+            "https://example.com/b": "2026-01-30T02:00:00+00:00",
+            "https://example.com/bad-date": "yesterday",
+        },
+        "stories": {"https://example.com/a": ["bok", "rate"]},
+    }), encoding="utf-8")
+
+    assert load_history(history_path=path) == {"https://example.com/a", "https://example.com/b"}
+    since = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    assert load_story_fingerprints(since=since, history_path=path) == [
+        ("https://example.com/a", frozenset({"bok", "rate"})),
+    ]
+
+    # A re-seeded JSON file is not imported again.
+    legacy.write_text(json.dumps({"urls": {"https://example.com/c": "2026-01-30T00:00:00"}}))
+    assert "https://example.com/c" not in load_history(history_path=path)
+
+
+def test_history_uses_wal_and_indexes(tmp_path):
+    path = tmp_path / "history.db"
+    save_url("https://example.com/a", history_path=path)
+
+    conn = sqlite3.connect(path)
+    try:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        plan = " ".join(
+            row[-1] for row in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT host, COUNT(*) FROM published "
+                "WHERE published_at >= 0 GROUP BY host"
+            )
+        )
+        assert "published_at_idx" in plan
+    finally:
+        conn.close()
+
+
+def test_history_index_reads_once_and_batches_writes(tmp_path):
+    path = tmp_path / "history.db"
+    save_url("https://example.com/old", history_path=path)
+
+    with open_history(history_path=path) as history:
+        assert "https://www.example.com/old/" in history
+        assert filter_already_published(
+            [_make_item("https://example.com/old"), _make_item("https://example.com/new")],
+            history=history,
+        ) == [_make_item("https://example.com/new")]
+        history.add("https://example.com/new", fingerprint={"new"})
+        history.add("https://example.com/other")
+        # Updated in place before anything is written.
+        assert "https://example.com/new" in history
+        assert load_history(history_path=path) == {"https://example.com/old"}
+        assert history.reads == 1
+        assert sum(history.count_today_by_host("Asia/Seoul").values()) == 3
+
+    assert history.writes == 2
+    assert load_history(history_path=path) == {
+        "https://example.com/old", "https://example.com/new", "https://example.com/other",
+    }
+
+
+def test_compact_archives_expired_entries(tmp_path):
+    path = tmp_path / "history.db"
+    now = datetime.now(timezone.utc)
+    path.with_suffix(".json").write_text(json.dumps({"urls": {
+        "https://example.com/old": (now - timedelta(days=40)).isoformat(),
+        "https://example.com/recent": (now - timedelta(days=2)).isoformat(),
+    }}), encoding="utf-8")
+
+    assert compact_history(retention_days=30, history_path=path) == 1
+    assert load_history(history_path=path) == {"https://example.com/recent"}
+    conn = sqlite3.connect(path)
+    try:
+        assert conn.execute("SELECT url FROM archived").fetchall() == [("https://example.com/old",)]
+    finally:
+        conn.close()
+
+    assert compact_history(retention_days=1, archive=False, history_path=path) == 1
+    assert load_history(history_path=path) == set()
+
+
+def test_compact_updates_loaded_index(tmp_path):
+    path = tmp_path / "history.db"
+    save_url("https://example.com/a", history_path=path)
+
+    with open_history(history_path=path) as history:
+        assert "https://example.com/a" in history
+        removed = history.compact(before=datetime.now(timezone.utc) + timedelta(seconds=1))
+        assert removed == 1
+        assert "https://example.com/a" not in history
+
+
+def test_bloom_mode_answers_misses_without_queries(tmp_path):
+    path = tmp_path / "history.db"
+    save_url("https://example.com/old", history_path=path)
+
+    with open_history(history_path=path, bloom=True) as history:
+        assert path.with_suffix(".bloom").exists()
+        reads = history.reads
+        assert "https://example.com/new" not in history
+        assert history.reads == reads
+        assert history.stored_url("https://www.example.com/old/") == "https://example.com/old"
+        assert history.reads == reads + 1
+
+        history.add("https://example.com/new")
+        assert "https://example.com/new" in history
+        assert len(history) == 2
+
+    # The filter written on flush is current, so the next run only maps it.
+    with open_history(history_path=path, bloom=True) as history:
+        assert history.reads == 0
+        assert "https://example.com/new" in history
+        membership = pickle.loads(pickle.dumps(history.membership()))
+        assert "https://example.com/new" in membership
+        assert "https://example.com/other" not in membership
+
+
+def test_bloom_mode_rebuilds_stale_filter(tmp_path):
+    path = tmp_path / "history.db"
+    save_url("https://example.com/a", history_path=path)
+    with open_history(history_path=path, bloom=True):
+        pass
+    # Written by a run without bloom mode: the filter's generation is behind.
+    save_url("https://example.com/b", history_path=path)
+
+    with open_history(history_path=path, bloom=True) as history:
+        assert history.reads > 0
+        assert "https://example.com/b" in history
+        assert filter_already_published(
+            [_make_item("https://example.com/b"), _make_item("https://example.com/c")],
+            history=history,
+        ) == [_make_item("https://example.com/c")]
+
+
+def test_bloom_mode_rebuilds_stale_filter_under_history_lock(tmp_path):
+    path = tmp_path / "history.db"
+    save_url("https://example.com/a", history_path=path)
+    opened = threading.Event()
+
+    def open_bloom() -> None:
+        with open_history(history_path=path, bloom=True) as history:
+            assert "https://example.com/a" in history
+            opened.set()
+
+    with file_lock(path):
+        worker = threading.Thread(target=open_bloom)
+        worker.start()
+        # No filter on disk yet, so the open waits for the lock to build it.
+        assert not opened.wait(0.3)
+    worker.join(timeout=10)
+    assert opened.is_set()
+
+
+def test_journal_names_do_not_collide_across_instances(tmp_path):
+    # Same host and PID, as for containers that all run as PID 1.
+    path = tmp_path / "history.db"
+    with (
+        open_history(history_path=path, journal=True) as first,
+        open_history(history_path=path, journal=True) as second,
+    ):
+        first.add("https://example.com/a")
+        second.add("https://example.com/b")
+        journals = sorted(tmp_path.glob("history.*.journal"))
+        assert len(journals) == 2
+        assert all(j.read_text(encoding="utf-8").count("\n") == 1 for j in journals)
+
+
+def test_journal_recovers_entries_from_unfinished_run(tmp_path):
+    crashed = tmp_path / "crashed.db"
+    with open_history(history_path=tmp_path / "history.db", journal=True) as history:
+        [own_journal] = tmp_path.glob("history.*.journal")
+        assert f"-{os.getpid()}-" in own_journal.name
+        history.add("https://example.com/a", fingerprint={"alpha"})
+        history.add("https://example.com/b")
+        journal = own_journal.read_text(encoding="utf-8")
+        assert journal.count("\n") == 2
+    # Committed on exit, so the journal is gone.
+    assert not own_journal.exists()
+
+    # A run killed before its commit leaves only its journal, possibly
+    # ending in a half-written line.
+    dead = tmp_path / "crashed.999999.journal"
+    dead.write_text(journal + '["https://exa', encoding="utf-8")
+    # A journal still locked by a live run is left alone.
+    live = try_lock(tmp_path / "crashed.1.journal")
+    live.write('["https://example.com/live", 0, null]\n')
+    live.flush()
+    try:
+        with open_history(history_path=crashed, journal=True) as history:
+            assert history.writes == 2
+            assert "https://example.com/b" in history
+            assert "https://example.com/live" not in history
+    finally:
+        live.close()
+    assert not dead.exists()
+    assert load_history(history_path=crashed) == {"https://example.com/a", "https://example.com/b"}
+    assert load_story_fingerprints(
+        since=datetime(2020, 1, 1, tzinfo=timezone.utc), history_path=crashed,
+    ) == [("https://example.com/a", frozenset({"alpha"}))]
+
+
+def test_concurrent_instances_keep_bloom_filter_complete(tmp_path):
+    path = tmp_path / "history.db"
+    with open_history(history_path=path, bloom=True) as first, \
+            open_history(history_path=path, bloom=True) as second:
+        first.add("https://example.com/a")
+        first.flush()
+        assert second.is_committed("https://example.com/a")
+        second.add("https://example.com/b")
+        # second's filter predates first's commit, so it is rebuilt
+        # rather than saved without "a".
+        second.flush()
+
+    with open_history(history_path=path, bloom=True) as history:
+        assert history.reads == 0
+        assert "https://example.com/a" in history
+        assert "https://example.com/b" in history
+
+
+def test_daily_counts_maintained_on_flush(tmp_path):
+    path = tmp_path / "history.db"
+    save_url("https://example.com/a", history_path=path)
+
+    with open_history(history_path=path) as history:
+        # First use seeds the counters from today's entries.
+        assert history.count_today_by_host("Asia/Seoul") == {"example.com": 1}
+        history.add("https://other.com/b")
+        history.add("https://example.com/a")  # already counted today
+        assert history.count_today_by_host("Asia/Seoul") == {"example.com": 2, "other.com": 1}
+
+    with open_history(history_path=path) as history:
+        assert history.count_today_by_host("Asia/Seoul") == {"example.com": 1, "other.com": 1}
+        assert history.count_today_by_host("UTC") == {"example.com": 1, "other.com": 1}
+
+    # Later counts come from the counters, not from scanning entries: a row
+    # written behind the history's back is not seen.
+    conn = sqlite3.connect(path)
+    with conn:
+        conn.execute(
+            "INSERT INTO published VALUES ('https://third.com/c', 'https://third.com/c', ?, "
+            "'third.com', NULL)",
+            (datetime.now(timezone.utc).timestamp(),),
+        )
+        conn.execute("INSERT INTO daily_counts VALUES ('Asia/Seoul', '2020-01-01', 'old.com', 3)")
+    conn.close()
+    with open_history(history_path=path) as history:
+        assert "third.com" not in history.count_today_by_host("Asia/Seoul")
+        # Compaction keeps the counters (nothing is reseeded from what is
+        # left) and only drops days before the cutoff.
+        history.compact(before=datetime.now(timezone.utc) + timedelta(seconds=1))
+        assert history.count_today_by_host("Asia/Seoul") == {"example.com": 1, "other.com": 1}
+    conn = sqlite3.connect(path)
+    try:
+        days = {day for (day,) in conn.execute("SELECT day FROM daily_counts")}
+        zones = conn.execute("SELECT COUNT(*) FROM counter_zones").fetchone()[0]
+    finally:
+        conn.close()
+    assert "2020-01-01" not in days
+    assert zones == 2
+
+
+def test_filter_expired_drops_items_older_than_retention(tmp_path):
+    path = tmp_path / "history.db"
+    with open_history(history_path=path) as history:
+        history.add("https://example.com/old")
+    # Archived: runs no longer see the URL as published.
+    compact_history(retention_days=0, history_path=path)
+    cutoff = datetime.now(timezone.utc) - timedelta(days=30)
+    old = FeedItem(title="Old", url="https://example.com/old",
+                   published_ts=(cutoff - timedelta(days=1)).timestamp())
+    new = FeedItem(title="New", url="https://example.com/new",
+                   published_ts=(cutoff + timedelta(days=1)).timestamp())
+    undated = _make_item("https://example.com/undated")
+
+    candidates = filter_already_published([old, new, undated], history_path=path)
+    assert old in candidates
+    assert filter_expired(candidates, before=cutoff) == [new, undated]
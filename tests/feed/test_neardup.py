@@ -0,0 +1,132 @@
+"""Tests for near-duplicate story clustering."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+
+from auto_card_news_v2.feed.neardup import (
+    NearDupStats,
+    StoryIndex,
+    collapse_near_duplicates,
+    filter_similar_to_published,
+    jaccard,
+    minhash,
+    story_fingerprint,
+    story_tokens,
+)
+from auto_card_news_v2.models import FeedItem
+from auto_card_news_v2.story.summarizer import build_story
+
+_YONHAP = FeedItem(
+    title="(LEAD) BOK holds key rate at 2.5 pct amid household debt concerns",
+    url="https://en.yna.co.kr/view/AEN20260130001",
+    summary="The Bank of Korea kept its benchmark interest rate unchanged at 2.5 percent "
+    "on Thursday amid concerns over household debt.",
+    source_domain="en.yna.co.kr",
+)
+_HERALD = FeedItem(
+    title="BOK holds key rate at 2.5% amid household debt concerns",
+    url="https://www.koreaherald.com/view.php?ud=20260130000123",
+    summary="The Bank of Korea kept its benchmark interest rate unchanged at 2.5 percent "
+    "on Thursday, citing household debt.",
+    source_domain="koreaherald.com",
+)
+_JOONGANG = FeedItem(
+    title="Bank of Korea holds key rate at 2.5 percent amid debt concerns",
+    url="https://koreajoongangdaily.joins.com/news/2026-01-30/business/bok/1",
+    summary="The Bank of Korea kept its benchmark rate unchanged at 2.5 percent Thursday.",
+    source_domain="koreajoongangdaily.joins.com",
+)
+_OTHER = [
+    FeedItem(title="BOK to hold rate decision meeting next week", url="https://a.com/1",
+             summary="The Bank of Korea will hold its rate-setting meeting next week."),
+    FeedItem(title="Seoul stocks open higher on chip gains", url="https://a.com/2",
+             summary="Seoul shares opened higher Thursday led by chip gains."),
+    FeedItem(title="KOSPI closes lower on foreign selling", url="https://a.com/3",
+             summary="Seoul shares closed lower Thursday as foreigners sold."),
+]
+
+
+def test_wire_tags_and_stopwords_ignored():
+    assert story_tokens("(2nd LD) The BOK holds rate") == {"bok", "holds", "rate"}
+
+
+def test_minhash_is_stable_and_tracks_similarity():
+    a = story_tokens(_YONHAP.title, _YONHAP.summary)
+    b = story_tokens(_HERALD.title, _HERALD.summary)
+    assert minhash(a) == minhash(set(a))
+    agree = sum(x == y for x, y in zip(minhash(a), minhash(b))) / len(minhash(a))
+    assert abs(agree - jaccard(a, b)) < 0.3
+
+
+def test_collapses_same_story_from_three_outlets():
+    stats = NearDupStats()
+    items = [_YONHAP, _OTHER[0], _HERALD, _OTHER[1], _JOONGANG, _OTHER[2]]
+    result = collapse_near_duplicates(items, stats=stats)
+
+    assert result == [_YONHAP, *_OTHER]
+    assert (stats.clusters, stats.collapsed) == (1, 2)
+
+
+def test_representative_prefers_priority_domain_then_full_text():
+    with_text = FeedItem(**{**_JOONGANG.__dict__, "full_text": "Body"})
+    items = [_YONHAP, _HERALD, with_text]
+
+    assert collapse_near_duplicates(items) == [with_text]
+    assert collapse_near_duplicates(items, priority_domains=("koreaherald.com",)) == [_HERALD]
+
+
+def test_threshold_zero_disables():
+    items = [_YONHAP, _HERALD]
+    assert collapse_near_duplicates(items, threshold=0) == items
+
+
+def test_lsh_avoids_all_pairs_comparison():
+    items = [
+        FeedItem(title=f"Report: topic{i} subject{i} update{i}", url=f"https://a.com/{i}",
+                 summary=f"Event{i} in city{i} with group{i} and team{i}.")
+        for i in range(200)
+    ]
+    stats = NearDupStats()
+    assert collapse_near_duplicates(items, stats=stats) == items
+    # Unrelated items rarely share a bucket: far fewer than all 19,900 pairs.
+    assert stats.comparisons < 2000
+
+
+_HERALD_BODY = (
+    "The Bank of Korea on Thursday left its policy rate at 2.50 percent for a third "
+    "straight meeting, as policymakers weighed a slowing economy against a renewed "
+    "surge in household borrowing. Governor Rhee Chang-yong told reporters that six "
+    "of the seven board members saw room for a cut within three months. Household "
+    "loans rose by 5.2 trillion won in December, the largest monthly gain since "
+    "July, driven by mortgages in Seoul. The central bank lowered its 2026 growth "
+    "forecast to 1.8 percent from 1.9 percent. Inflation stood at 2.1 percent in "
+    "December. The next rate decision is scheduled for Feb. 26."
+)
+
+
+def test_rejects_other_outlets_coverage_of_published_story():
+    item = replace(_HERALD, full_text=_HERALD_BODY)
+    # As in the pipeline: the story is generated from the scraped body, and
+    # the recorded fingerprint comes from the published item.
+    story = build_story(item)
+    published = StoryIndex([(story.source_url, story_fingerprint(item))])
+    stats = NearDupStats()
+
+    result = filter_similar_to_published([_YONHAP, *_OTHER, _JOONGANG], published, stats=stats)
+
+    assert result == _OTHER
+    assert stats.already_published == 2
+
+
+def test_published_index_lookup_cost_independent_of_size():
+    entries = [
+        (f"https://a.com/{i}", story_tokens(f"Report on topic{i} subject{i}", f"Event{i} city{i}"))
+        for i in range(3000)
+    ]
+    published = StoryIndex(entries)
+    stats = NearDupStats()
+
+    assert published.match(story_tokens(_YONHAP.title, _YONHAP.summary), stats=stats) is None
+    assert published.match(entries[1234][1]) == "https://a.com/1234"
+    assert stats.comparisons < 100
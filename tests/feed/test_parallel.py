@@ -0,0 +1,51 @@
+"""Tests for process-pool feed parsing."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from auto_card_news_v2.feed.parallel import pack_items, parse_pool, unpack_items
+from auto_card_news_v2.feed.parser import ParseStats, parse_feed
+from auto_card_news_v2.models import FeedItem
+
+
+def _rss(count: int) -> bytes:
+    items = "".join(
+        f"<item><title>Story {i}</title><link>https://example.com/{i}</link>"
+        f"<description>&lt;b&gt;Body&lt;/b&gt; {i}</description>"
+        f"<pubDate>Thu, 30 Jan 2026 08:00:00 GMT</pubDate></item>"
+        for i in range(count)
+    )
+    return f'<?xml version="1.0"?><rss version="2.0"><channel>{items}</channel></rss>'.encode()
+
+
+def test_pack_round_trip():
+    items = [
+        FeedItem(title="a", url="https://a.com/1", published_ts=1.5),
+        FeedItem(title="b", url="https://b.com/2", summary="s", source_domain="b.com"),
+    ]
+    assert unpack_items(pack_items(items)) == items
+
+
+def test_pool_matches_in_process_parse():
+    data = _rss(30)
+    published = {"https://example.com/3", "https://example.com/7"}
+    expected_stats = ParseStats()
+    expected = parse_feed(data, feed_url="u", published=published, stats=expected_stats)
+
+    stats = ParseStats()
+    with parse_pool(2, published=published, min_pool_bytes=0) as parse:
+        items = parse(data, "u", stats)
+
+    assert items == expected
+    assert stats == expected_stats
+    assert stats.skipped_published == 2
+
+
+def test_small_bodies_never_start_pool():
+    with patch("auto_card_news_v2.feed.parallel.ProcessPoolExecutor") as executor:
+        with parse_pool(4, min_pool_bytes=1 << 20) as parse:
+            items = parse(_rss(3), "u", ParseStats())
+
+    assert len(items) == 3
+    executor.assert_not_called()
@@ -2,7 +2,21 @@
 
 from __future__ import annotations
 
-from auto_card_news_v2.feed.parser import parse_feed
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from auto_card_news_v2.feed import parser
+from auto_card_news_v2.feed.parser import (
+    ENGINE_FAST,
+    ENGINE_FEEDPARSER,
+    ParseStats,
+    parse_feed,
+    parse_timestamp,
+    stream_feed,
+)
 
 _RSS_XML = b"""<?xml version="1.0" encoding="UTF-8"?>
 <rss version="2.0">
@@ -32,6 +46,49 @@ def test_parse_rss_xml():
     assert items[0].source_domain == "example.com"
 
 
+def test_parse_rss_sets_epoch_timestamp():
+    items = parse_feed(_RSS_XML, feed_url="https://example.com/rss")
+    assert items[0].published_ts == 1769760000.0
+    assert items[1].published_ts is None
+
+
+def test_parse_timestamp_formats():
+    assert parse_timestamp("Thu, 30 Jan 2026 17:00:00 +0900") == 1769760000.0
+    assert parse_timestamp("2026-01-30T08:00:00Z") == 1769760000.0
+    assert parse_timestamp("2026-01-30T08:00:00") == 1769760000.0
+    assert parse_timestamp("not a date") is None
+    assert parse_timestamp(None) is None
+
+
+def test_parse_skips_published_before_building_items():
+    stats = ParseStats()
+    with patch.object(parser, "_clean_html", wraps=parser._clean_html) as clean:
+        items = parse_feed(
+            _RSS_XML,
+            feed_url="https://example.com/rss",
+            published={"https://example.com/article-1"},
+            stats=stats,
+        )
+
+    assert [i.url for i in items] == ["https://example.com/article-2"]
+    assert stats.entries == 2
+    assert stats.skipped_published == 1
+    # Only the surviving entry's title and summary were cleaned.
+    assert clean.call_count == 2
+
+
+def test_parse_published_lookup_uses_normalized_urls():
+    xml = _RSS_XML.replace(b"https://example.com/article-2", b"HTTPS://Example.com/Article-2/")
+    stats = ParseStats()
+    items = parse_feed(
+        xml,
+        published={"https://example.com/article-1", "https://example.com/article-2"},
+        stats=stats,
+    )
+    assert items == []
+    assert stats.skipped_published == 2
+
+
 def test_parse_rss_cleans_html():
     xml = b"""<?xml version="1.0"?>
     <rss version="2.0"><channel>
@@ -45,3 +102,125 @@ def test_parse_rss_cleans_html():
     items = parse_feed(xml)
     assert "<" not in items[0].title
     assert "<" not in (items[0].summary or "")
+
+
+_ATOM_XML = b"""<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title>Atom Feed</title>
+  <entry>
+    <title>Atom story</title>
+    <link rel="alternate" href="https://example.org/atom-1"/>
+    <summary>An atom summary.</summary>
+    <updated>2026-01-30T08:00:00Z</updated>
+  </entry>
+</feed>
+"""
+
+
+def _big_rss(count: int) -> bytes:
+    items = "".join(
+        f"<item><title>Story {i}</title><link>https://example.com/{i}</link>"
+        f"<description>Body {i}</description></item>"
+        for i in range(count)
+    )
+    return f'<?xml version="1.0"?><rss version="2.0"><channel>{items}</channel></rss>'.encode()
+
+
+def test_stream_feed_matches_xml_parse():
+    streamed = list(stream_feed(_RSS_XML, feed_url="https://example.com/rss"))
+    assert [i.url for i in streamed] == [
+        "https://example.com/article-1",
+        "https://example.com/article-2",
+    ]
+    assert streamed[0].summary == "Something important happened today."
+    assert streamed[0].published_at == "Thu, 30 Jan 2026 08:00:00 GMT"
+
+
+def test_stream_feed_atom():
+    [item] = stream_feed(_ATOM_XML)
+    assert item.title == "Atom story"
+    assert item.url == "https://example.org/atom-1"
+    assert item.source_domain == "example.org"
+    assert item.published_ts == 1769760000.0
+
+
+def test_stream_feed_accepts_chunks():
+    data = _big_rss(50)
+    chunks = [data[i:i + 97] for i in range(0, len(data), 97)]
+    assert len(list(stream_feed(chunks))) == 50
+
+
+def test_stream_feed_stops_after_limit_of_new_items():
+    published = {"https://example.com/0", "https://example.com/1"}
+    consumed: list[int] = []
+    data = _big_rss(1000)
+
+    def chunks():
+        for i in range(0, len(data), 1024):
+            consumed.append(i)
+            yield data[i:i + 1024]
+
+    items = list(stream_feed(chunks(), limit=3, published=published))
+
+    assert [i.url for i in items] == [f"https://example.com/{n}" for n in (2, 3, 4)]
+    assert len(consumed) < len(data) // 1024 // 10
+
+
+def test_stream_feed_raises_on_malformed_xml():
+    with pytest.raises(ET.ParseError):
+        list(stream_feed(b"<rss><channel><item><title>x</title></channel>"))
+
+
+_FIXTURES = Path(__file__).parent / "fixtures"
+
+
+@pytest.mark.parametrize(
+    "name", ["news_rss2.xml", "daily_content_encoded.xml", "blog_atom.xml", "full_content.xml"],
+)
+def test_fast_engine_matches_feedparser(name):
+    data = (_FIXTURES / name).read_bytes()
+    stats = ParseStats()
+    items = parse_feed(data, feed_url="https://feed.example.kr/rss", stats=stats)
+
+    assert stats.engine == ENGINE_FAST
+    assert items
+    assert items == parser._parse_with_feedparser(data, "https://feed.example.kr/rss")
+
+
+def test_feed_full_content_becomes_full_text():
+    full, teaser = parse_feed((_FIXTURES / "full_content.xml").read_bytes())
+
+    assert full.summary == "The central bank kept rates unchanged for a third straight meeting."
+    paragraphs = full.full_text.split("\n")
+    assert paragraphs[0].startswith("The Bank of Korea kept its benchmark")
+    assert "household debt & housing prices" in paragraphs[0]
+    assert "Markets reacted calmly, with the won little changed against the dollar." in paragraphs
+    assert "trackView" not in full.full_text
+    assert "Subscribe" not in full.full_text
+    # Too short to be the article: left for the scraper.
+    assert teaser.full_text is None
+    assert teaser.summary == "Hyundai Motor opened its new EV plant in Georgia."
+
+
+@pytest.mark.parametrize("name", ["legacy_rdf.xml", "guid_only.xml"])
+def test_falls_back_to_feedparser(name):
+    stats = ParseStats()
+    [item] = parse_feed((_FIXTURES / name).read_bytes(), stats=stats)
+    assert stats.engine == ENGINE_FEEDPARSER
+    assert item.url.startswith("https://")
+
+
+def test_falls_back_on_malformed_xml():
+    stats = ParseStats()
+    items = parse_feed(
+        b"<rss><channel><item><title>A &nbsp; B</title><link>https://a.com/1</link></item>",
+        stats=stats,
+    )
+    assert stats.engine == ENGINE_FEEDPARSER
+    assert [i.url for i in items] == ["https://a.com/1"]
+
+
+def test_remembered_feedparser_engine_skips_fast_path():
+    with patch.object(parser, "_parse_with_xml") as fast:
+        parse_feed(_RSS_XML, stats=ParseStats(engine=ENGINE_FEEDPARSER))
+    fast.assert_not_called()
@@ -0,0 +1,41 @@
+"""Tests for persistent per-feed state."""
+
+from __future__ import annotations
+
+from auto_card_news_v2.feed.state import (
+    load_cached_items,
+    load_feed_state,
+    save_cached_items,
+    save_feed_state,
+)
+from auto_card_news_v2.models import FeedItem
+
+
+def test_load_feed_state_missing_file(tmp_path):
+    assert load_feed_state(state_path=tmp_path / "state.json") == {}
+
+
+def test_load_feed_state_corrupted(tmp_path):
+    path = tmp_path / "state.json"
+    path.write_text("not json", encoding="utf-8")
+    assert load_feed_state(state_path=path) == {}
+
+
+def test_feed_state_round_trip(tmp_path):
+    path = tmp_path / "nested" / "state.json"
+    state = {"https://a.com/rss": {"etag": '"abc"'}}
+    save_feed_state(state, state_path=path)
+    assert load_feed_state(state_path=path) == state
+
+
+def test_cached_items_round_trip(tmp_path):
+    items = [
+        FeedItem(title="A", url="https://a.com/1", summary="s", source_domain="a.com"),
+        FeedItem(title="B", url="https://a.com/2"),
+    ]
+    save_cached_items("https://a.com/rss", items, cache_dir=tmp_path)
+    assert load_cached_items("https://a.com/rss", cache_dir=tmp_path) == items
+
+
+def test_cached_items_missing(tmp_path):
+    assert load_cached_items("https://a.com/rss", cache_dir=tmp_path) is None
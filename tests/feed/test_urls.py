@@ -0,0 +1,48 @@
+"""Tests for canonical article URLs."""
+
+from __future__ import annotations
+
+import pytest
+
+from auto_card_news_v2.feed.urls import canonical_host, canonicalize_url, legacy_url_key
+
+
+@pytest.mark.parametrize("variant", [
+    "https://www.yna.co.kr/view/AKR20260130001",
+    "https://www.yna.co.kr/view/AKR20260130001/",
+    "http://www.yna.co.kr/view/AKR20260130001",
+    "https://m.yna.co.kr/view/AKR20260130001",
+    "https://yna.co.kr:443/view/AKR20260130001",
+    "https://www.yna.co.kr/view/AKR20260130001?utm_source=rss&utm_medium=feed",
+    "https://www.yna.co.kr/view/AKR20260130001#comments",
+    "https://www.yna.co.kr/view/AKR20260130001/amp",
+    "https://amp.yna.co.kr/view/AKR20260130001?fbclid=abc",
+])
+def test_variants_share_canonical_url(variant):
+    assert canonicalize_url(variant) == "https://yna.co.kr/view/akr20260130001"
+
+
+def test_query_kept_but_order_independent():
+    a = canonicalize_url("https://example.com/view?id=7&section=tech&utm_campaign=x")
+    b = canonicalize_url("https://example.com/view?section=tech&id=7")
+    assert a == b == "https://example.com/view?id=7&section=tech"
+    assert a != canonicalize_url("https://example.com/view?id=8&section=tech")
+
+
+def test_canonical_of_legacy_key_matches():
+    url = "https://www.Example.com/News/Story-1/?utm_source=rss"
+    assert canonicalize_url(legacy_url_key(url)) == canonicalize_url(url)
+    assert canonicalize_url(canonicalize_url(url)) == canonicalize_url(url)
+
+
+def test_bare_domain_not_stripped_below_registrable_name():
+    assert canonical_host("https://m.com/a") == "m.com"
+    assert canonical_host("https://www.soompi.com/article/1") == "soompi.com"
+
+
+def test_results_are_cached():
+    canonicalize_url.cache_clear()
+    canonicalize_url("https://example.com/cached")
+    canonicalize_url("https://example.com/cached")
+    info = canonicalize_url.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
@@ -0,0 +1,80 @@
+"""Tests for the lease-based work queue."""
+
+from __future__ import annotations
+
+import threading
+from datetime import datetime, timedelta, timezone
+
+from auto_card_news_v2.feed import work_queue
+from auto_card_news_v2.feed.work_queue import QueueStats, open_work_queue
+
+
+def test_lease_excludes_other_workers_until_released(tmp_path):
+    path = tmp_path / "queue.db"
+    with open_work_queue(path, worker="a") as a, open_work_queue(path, worker="b") as b:
+        assert a.claim("https://example.com/1")
+        # Same story under another form of the URL.
+        assert not b.claim("https://www.example.com/1/?utm_source=x")
+        assert b.stats.leased_elsewhere == 1
+
+        a.release("https://example.com/1")
+        assert b.claim("https://example.com/1")
+        assert b.complete("https://example.com/1")
+        assert not a.claim("https://example.com/1")
+        assert a.stats.already_done == 1
+
+
+def test_expired_lease_is_taken_over_and_fenced(tmp_path):
+    path = tmp_path / "queue.db"
+    with open_work_queue(path, worker="dead", lease_seconds=-1) as dead, \
+            open_work_queue(path, worker="b") as b:
+        assert dead.claim("https://example.com/1")
+        # The lease has expired: another worker takes the item over...
+        assert b.claim("https://example.com/1")
+        # ...and the stalled worker can no longer renew or complete it.
+        assert not dead.renew("https://example.com/1")
+        assert not dead.complete("https://example.com/1")
+        assert dead.stats.lost == 1
+        assert b.complete("https://example.com/1")
+
+
+def test_concurrent_workers_claim_each_item_once(tmp_path):
+    path = tmp_path / "queue.db"
+    urls = [f"https://example.com/{i}" for i in range(40)]
+    stats = [QueueStats() for _ in range(4)]
+
+    def work(index: int) -> None:
+        with open_work_queue(path, worker=f"w{index}", stats=stats[index]) as queue:
+            for url in urls:
+                if queue.claim(url):
+                    queue.complete(url)
+
+    threads = [threading.Thread(target=work, args=(i,)) for i in range(len(stats))]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert sum(s.completed for s in stats) == len(urls)
+    assert sum(s.claimed for s in stats) == len(urls)
+
+
+def test_prune_forgets_old_done_items(tmp_path):
+    path = tmp_path / "queue.db"
+    with open_work_queue(path, worker="a") as queue:
+        queue.claim("https://example.com/1")
+        queue.complete("https://example.com/1")
+        queue.claim("https://example.com/2")
+        assert queue.prune(before=datetime.now(timezone.utc) - timedelta(days=1)) == 0
+        assert queue.prune(before=datetime.now(timezone.utc) + timedelta(seconds=1)) == 1
+        assert queue.claim("https://example.com/1")
+
+
+def test_default_queue_is_shared_by_runs_on_this_host(tmp_path, monkeypatch):
+    monkeypatch.setattr(work_queue, "_queue_path", lambda: tmp_path / "work_queue.db")
+
+    with open_work_queue(worker="run-1") as first, open_work_queue(worker="run-2") as second:
+        assert first.claim("https://a.com/1")
+        assert not second.claim("https://a.com/1")
+
+    assert (tmp_path / "work_queue.db").exists()
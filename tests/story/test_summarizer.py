@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from dataclasses import replace
+
 from auto_card_news_v2.story.summarizer import build_story
 
 
@@ -18,6 +20,19 @@ def test_build_story_hook_title_length(sample_feed_item):
     assert len(story.hook_title) <= 120
 
 
+def test_build_story_carries_timestamp(sample_feed_item):
+    story = build_story(replace(sample_feed_item, published_ts=1769760000.0))
+    assert story.published_ts == 1769760000.0
+    assert story.where_when.startswith("Jan 30, 2026 17:00 KST")
+
+
+def test_build_story_where_when_uses_local_day(sample_feed_item):
+    # Fri, 06 Feb 2026 08:30:00 +0900 is still Feb 5 in UTC.
+    item = replace(sample_feed_item, published_ts=1770334200.0)
+    assert build_story(item).where_when.startswith("Feb 6, 2026 08:30 KST")
+    assert build_story(item, tz_name="UTC").where_when.startswith("Feb 5, 2026 23:30 UTC")
+
+
 def test_build_story_preserves_source(sample_feed_item):
     story = build_story(sample_feed_item)
     assert story.source_domain == "example.com"
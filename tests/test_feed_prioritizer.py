@@ -48,7 +48,7 @@ class TestIsPriority:
 
 class TestCountTodayByCategory:
     def test_empty_history(self, tmp_path: Path) -> None:
-        history = tmp_path / "history.json"
+        history = tmp_path / "history.db"
         p, n = _count_today_by_category(
             PRIORITY_DOMAINS, history_path=history,
         )
@@ -56,7 +56,7 @@ class TestCountTodayByCategory:
         assert n == 0
 
     def test_counts_today_only(self, tmp_path: Path) -> None:
-        history = tmp_path / "history.json"
+        history = tmp_path / "history.db"
         now = datetime.now(timezone.utc).isoformat()
         old = "2020-01-01T00:00:00+00:00"
         data = {
@@ -67,16 +67,34 @@ class TestCountTodayByCategory:
                 "https://www.soompi.com/article/old": old,  # yesterday
             },
         }
-        history.write_text(json.dumps(data))
+        history.with_suffix(".json").write_text(json.dumps(data))
         p, n = _count_today_by_category(
             PRIORITY_DOMAINS, history_path=history,
         )
         assert p == 2
         assert n == 1
 
+    def test_same_article_under_two_keys_counted_once(self, tmp_path: Path) -> None:
+        # Keys from the legacy JSON history merge on import.
+        history = tmp_path / "history.db"
+        now = datetime.now(timezone.utc).isoformat()
+        data = {
+            "urls": {
+                "https://www.soompi.com/article/1?utm_source=rss": now,
+                "https://soompi.com/article/1": now,
+                "https://m.koreaboo.com/stories/1": now,
+            },
+        }
+        history.with_suffix(".json").write_text(json.dumps(data))
+        p, n = _count_today_by_category(
+            PRIORITY_DOMAINS, history_path=history,
+        )
+        assert p == 2
+        assert n == 0
+
     def test_corrupted_history(self, tmp_path: Path) -> None:
-        history = tmp_path / "history.json"
-        history.write_text("not json")
+        history = tmp_path / "history.db"
+        history.write_text("not a database")
         p, n = _count_today_by_category(
             PRIORITY_DOMAINS, history_path=history,
         )
@@ -104,7 +122,7 @@ class TestPrioritizeItems:
             priority_domains=PRIORITY_DOMAINS,
             priority_ratio=8,
             daily_total=12,
-            history_path=tmp_path / "history.json",
+            history_path=tmp_path / "history.db",
         )
         # Priority items should be first
         assert result[0].source_domain in ("soompi.com", "koreaboo.com")
@@ -112,13 +130,13 @@ class TestPrioritizeItems:
 
     def test_normal_first_when_priority_ahead(self, tmp_path: Path) -> None:
         """When priority quota is more filled, normal items should come first."""
-        history = tmp_path / "history.json"
+        history = tmp_path / "history.db"
         now = datetime.now(timezone.utc).isoformat()
         # 7 priority published, 0 normal → priority fill 87%, normal fill 0%
         urls = {}
         for i in range(7):
             urls[f"https://www.soompi.com/article/{i}"] = now
-        history.write_text(json.dumps({"urls": urls}))
+        history.with_suffix(".json").write_text(json.dumps({"urls": urls}))
 
         items = [KPOP_3, NEWS_1, NEWS_2]
         result = prioritize_items(
@@ -133,13 +151,13 @@ class TestPrioritizeItems:
 
     def test_priority_first_when_normal_ahead(self, tmp_path: Path) -> None:
         """When normal quota is more filled, priority items should come first."""
-        history = tmp_path / "history.json"
+        history = tmp_path / "history.db"
         now = datetime.now(timezone.utc).isoformat()
         # 0 priority, 3 normal → normal fill 75%, priority fill 0%
         urls = {
             f"https://en.yna.co.kr/view/{i}": now for i in range(3)
         }
-        history.write_text(json.dumps({"urls": urls}))
+        history.with_suffix(".json").write_text(json.dumps({"urls": urls}))
 
         items = [NEWS_3, KPOP_1, KPOP_2]
         result = prioritize_items(
@@ -156,7 +174,7 @@ class TestPrioritizeItems:
         result = prioritize_items(
             items,
             priority_domains=PRIORITY_DOMAINS,
-            history_path=tmp_path / "history.json",
+            history_path=tmp_path / "history.db",
         )
         assert len(result) == 2
         assert all(_is_priority(i, PRIORITY_DOMAINS) for i in result)
@@ -166,7 +184,7 @@ class TestPrioritizeItems:
         result = prioritize_items(
             items,
             priority_domains=PRIORITY_DOMAINS,
-            history_path=tmp_path / "history.json",
+            history_path=tmp_path / "history.db",
         )
         assert len(result) == 2
         assert all(not _is_priority(i, PRIORITY_DOMAINS) for i in result)
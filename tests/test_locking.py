@@ -0,0 +1,32 @@
+"""Tests for cross-process file locking."""
+
+from __future__ import annotations
+
+import pytest
+
+from auto_card_news_v2.locking import file_lock, lock_path, try_lock, write_atomic
+
+
+def test_file_lock_excludes_other_holders(tmp_path):
+    target = tmp_path / "state.json"
+    with file_lock(target):
+        # flock locks belong to the open file, so a second open conflicts
+        # just as another process would.
+        assert try_lock(lock_path(target)) is None
+        with pytest.raises(TimeoutError):
+            with file_lock(target, timeout=0.1):
+                pass
+
+    handle = try_lock(lock_path(target))
+    assert handle is not None
+    handle.close()
+
+
+def test_write_atomic_replaces_with_mode(tmp_path):
+    target = tmp_path / "nested" / "token.json"
+    write_atomic(target, "one")
+    write_atomic(target, "two", mode=0o600)
+
+    assert target.read_text(encoding="utf-8") == "two"
+    assert target.stat().st_mode & 0o777 == 0o600
+    assert [p.name for p in target.parent.iterdir()] == ["token.json"]
@@ -2,6 +2,12 @@
 
 from __future__ import annotations
 
+from dataclasses import replace
+from unittest.mock import MagicMock, patch
+
+from auto_card_news_v2 import pipeline
+from auto_card_news_v2.feed.history import open_history
+from auto_card_news_v2.feed.work_queue import open_work_queue
 from auto_card_news_v2.models import FeedItem
 from auto_card_news_v2.story import build_story, sanitize_story
 from auto_card_news_v2.caption import compose_caption
@@ -17,3 +23,41 @@ def test_full_story_to_caption_flow(sample_feed_item):
     assert len(caption) > 0
     assert "#" in caption  # has hashtags
     assert story.hook_title in caption
+
+
+def test_run_pipeline_fills_max_items_past_claimed_items(tmp_path):
+    settings = replace(
+        load_settings(feeds_override="https://example.com/rss", output_override=str(tmp_path / "out")),
+        max_items=2,
+        near_dup_window_hours=0,
+    )
+    titles = [
+        "Central bank holds interest rates steady",
+        "Typhoon forces ferry cancellations on southern coast",
+        "Film festival announces opening night lineup",
+        "Chipmaker reports record quarterly exports",
+    ]
+    items = [
+        FeedItem(title=title, url=f"https://example.com/{n}", full_text="Body text.")
+        for n, title in enumerate(titles)
+    ]
+    processed: list[str] = []
+
+    def process(item, settings, browser):
+        processed.append(item.url)
+        return MagicMock()
+
+    with (
+        open_history(history_path=tmp_path / "history.db") as history,
+        open_work_queue(tmp_path / "queue.db", worker="other") as other,
+        open_work_queue(tmp_path / "queue.db", worker="me") as queue,
+        patch.object(pipeline, "_fetch_all_feeds", return_value=items),
+        patch.object(pipeline, "sync_playwright"),
+        patch.object(pipeline, "_process_item", side_effect=process),
+    ):
+        other.claim("https://example.com/0")
+        other.claim("https://example.com/1")
+        posts = pipeline._run_pipeline(settings, history, queue)
+
+    assert processed == ["https://example.com/2", "https://example.com/3"]
+    assert len(posts) == 2
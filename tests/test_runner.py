@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from unittest.mock import MagicMock, patch
 
+from auto_card_news_v2.config import load_settings
 from auto_card_news_v2.runner import run_job
 
 
@@ -58,6 +59,7 @@ def test_run_job_catches_exceptions(mock_load, mock_pipeline):
 @patch("auto_card_news_v2.runner.load_settings")
 def test_run_job_with_limit(mock_load, mock_pipeline):
     """run_job with limit should create a new Settings with the limit applied."""
+    mock_load.return_value = load_settings(feeds_override="https://example.com/rss")
     mock_pipeline.return_value = []
 
     run_job(auto_publish=False, limit=3)
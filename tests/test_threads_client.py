@@ -3,9 +3,7 @@
 from __future__ import annotations
 
 import json
-import urllib.error
-from io import BytesIO
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 
@@ -20,40 +18,29 @@ from auto_card_news_v2.threads.client import (
     publish_container,
     wait_for_container,
 )
+from auto_card_news_v2.transport import HTTPStatusError, Response
 
 
-def _mock_response(data: dict) -> MagicMock:
-    """Create a mock urllib response."""
-    body = json.dumps(data).encode()
-    resp = MagicMock()
-    resp.read.return_value = body
-    resp.__enter__ = lambda self: self
-    resp.__exit__ = MagicMock(return_value=False)
-    return resp
+def _mock_response(data: dict) -> Response:
+    """Create a transport response carrying a JSON body."""
+    return Response(status=200, headers={}, body=json.dumps(data).encode())
 
 
-def _mock_http_error(code: int, body: str = "error") -> urllib.error.HTTPError:
-    err = urllib.error.HTTPError(
-        url="https://graph.threads.net/test",
-        code=code,
-        msg="Error",
-        hdrs={},
-        fp=BytesIO(body.encode()),
-    )
-    return err
+def _mock_http_error(code: int, body: str = "error") -> HTTPStatusError:
+    return HTTPStatusError(code, body.encode(), url="https://graph.threads.net/test")
 
 
-@patch("auto_card_news_v2.threads.client.urllib.request.urlopen")
-def test_create_image_container(mock_urlopen):
-    mock_urlopen.return_value = _mock_response({"id": "container_123"})
+@patch("auto_card_news_v2.threads.client.transport.request")
+def test_create_image_container(mock_request):
+    mock_request.return_value = _mock_response({"id": "container_123"})
 
     result = create_image_container("user_1", "https://cdn.example.com/img.png", "tok_abc")
     assert result == "container_123"
 
 
-@patch("auto_card_news_v2.threads.client.urllib.request.urlopen")
-def test_create_carousel_container(mock_urlopen):
-    mock_urlopen.return_value = _mock_response({"id": "carousel_456"})
+@patch("auto_card_news_v2.threads.client.transport.request")
+def test_create_carousel_container(mock_request):
+    mock_request.return_value = _mock_response({"id": "carousel_456"})
 
     result = create_carousel_container(
         "user_1", ["c1", "c2", "c3"], "My caption", "tok_abc"
@@ -61,25 +48,25 @@ def test_create_carousel_container(mock_urlopen):
     assert result == "carousel_456"
 
 
-@patch("auto_card_news_v2.threads.client.urllib.request.urlopen")
-def test_check_container_status(mock_urlopen):
-    mock_urlopen.return_value = _mock_response({"status": "FINISHED"})
+@patch("auto_card_news_v2.threads.client.transport.request")
+def test_check_container_status(mock_request):
+    mock_request.return_value = _mock_response({"status": "FINISHED"})
 
     result = check_container_status("container_123", "tok_abc")
     assert result == "FINISHED"
 
 
-@patch("auto_card_news_v2.threads.client.urllib.request.urlopen")
-def test_publish_container(mock_urlopen):
-    mock_urlopen.return_value = _mock_response({"id": "post_789"})
+@patch("auto_card_news_v2.threads.client.transport.request")
+def test_publish_container(mock_request):
+    mock_request.return_value = _mock_response({"id": "post_789"})
 
     result = publish_container("user_1", "carousel_456", "tok_abc")
     assert result == "post_789"
 
 
-@patch("auto_card_news_v2.threads.client.urllib.request.urlopen")
-def test_get_post_permalink(mock_urlopen):
-    mock_urlopen.return_value = _mock_response(
+@patch("auto_card_news_v2.threads.client.transport.request")
+def test_get_post_permalink(mock_request):
+    mock_request.return_value = _mock_response(
         {"permalink": "https://www.threads.net/@user/post/abc123"}
     )
 
@@ -87,9 +74,9 @@ def test_get_post_permalink(mock_urlopen):
     assert result == "https://www.threads.net/@user/post/abc123"
 
 
-@patch("auto_card_news_v2.threads.client.urllib.request.urlopen")
-def test_api_error_raised_on_http_error(mock_urlopen):
-    mock_urlopen.side_effect = _mock_http_error(400, '{"error": "bad request"}')
+@patch("auto_card_news_v2.threads.client.transport.request")
+def test_api_error_raised_on_http_error(mock_request):
+    mock_request.side_effect = _mock_http_error(400, '{"error": "bad request"}')
 
     with pytest.raises(ThreadsAPIError) as exc_info:
         create_image_container("user_1", "https://example.com/img.png", "tok")
@@ -97,9 +84,9 @@ def test_api_error_raised_on_http_error(mock_urlopen):
     assert exc_info.value.status_code == 400
 
 
-@patch("auto_card_news_v2.threads.client.urllib.request.urlopen")
-def test_rate_limit_error_on_429(mock_urlopen):
-    mock_urlopen.side_effect = _mock_http_error(429, "rate limited")
+@patch("auto_card_news_v2.threads.client.transport.request")
+def test_rate_limit_error_on_429(mock_request):
+    mock_request.side_effect = _mock_http_error(429, "rate limited")
 
     with pytest.raises(ThreadsRateLimitError):
         create_image_container("user_1", "https://example.com/img.png", "tok")
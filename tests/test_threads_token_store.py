@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
 
 from auto_card_news_v2.threads.token_store import (
@@ -133,3 +134,30 @@ def test_refresh_if_needed_force(tmp_path, monkeypatch):
 
     result = refresh_if_needed("expired_tok", token_path=path, force=True)
     assert result == "refreshed_tok"
+
+
+def test_refresh_reuses_token_refreshed_by_another_run(tmp_path, monkeypatch):
+    path = tmp_path / "token.json"
+    save_token("new_tok", 5_184_000, token_path=path)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("refreshed twice")
+
+    monkeypatch.setattr("auto_card_news_v2.threads.token_store._request_refresh", fail)
+
+    # This run still holds the token it loaded before the other refreshed it.
+    assert refresh_if_needed("old_tok", token_path=path, force=True) == "new_tok"
+
+
+def test_refresh_keeps_current_token_when_lock_times_out(tmp_path, monkeypatch):
+    path = tmp_path / "token.json"
+    save_token("old_tok", 0, token_path=path)
+
+    @contextmanager
+    def busy(path, **kwargs):
+        raise TimeoutError("lock held")
+        yield
+
+    monkeypatch.setattr("auto_card_news_v2.threads.token_store.file_lock", busy)
+
+    assert refresh_if_needed("old_tok", token_path=path, force=True) == "old_tok"
@@ -0,0 +1,148 @@
+"""Tests for the shared pooled HTTP transport."""
+
+from __future__ import annotations
+
+import select
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from auto_card_news_v2 import transport
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    flaky_remaining = 0
+    dropped_posts = 0
+
+    def do_GET(self) -> None:  # noqa: N802
+        if self.path == "/redirect":
+            self._reply(302, b"", {"Location": "/ok"})
+        elif self.path == "/bye":
+            # Close without announcing it, like a server idle-timeout would.
+            self._reply(200, b"bye")
+            self.close_connection = True
+        elif self.path == "/missing":
+            self._reply(404, b"not here")
+        elif self.path == "/flaky":
+            if _Handler.flaky_remaining > 0:
+                _Handler.flaky_remaining -= 1
+                self._reply(503, b"busy")
+            else:
+                self._reply(200, b"recovered")
+        else:
+            self._reply(200, f"GET {self.path}".encode())
+
+    def do_POST(self) -> None:  # noqa: N802
+        length = int(self.headers.get("Content-Length", "0"))
+        body = self.rfile.read(length)
+        if self.path == "/drop":
+            # Act on the request, then lose the connection before replying.
+            _Handler.dropped_posts += 1
+            self.close_connection = True
+            return
+        self._reply(200, body)
+
+    def _reply(self, status: int, body: bytes, headers: dict[str, str] | None = None) -> None:
+        self.send_response(status)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    transport.close_all()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    transport.close_all()
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _stats(base_url: str) -> dict[str, int]:
+    return transport.host_stats()[base_url.removeprefix("http://")]
+
+
+def _wait_for_server_close() -> None:
+    """Block until the server's close of idle pooled connections has arrived."""
+    for pool in list(transport._POOLS.values()):
+        for conn, _ in list(pool._idle):
+            select.select([conn.sock], [], [], 1.0)
+
+
+def test_request_reuses_keep_alive_connection(server):
+    for i in range(5):
+        resp = transport.request("GET", f"{server}/item/{i}")
+        assert resp.body == f"GET /item/{i}".encode()
+
+    stats = _stats(server)
+    assert stats["opened"] == 1
+    assert stats["reused"] == 4
+
+
+def test_post_sends_body(server):
+    resp = transport.request("POST", f"{server}/echo", body=b"a=1&b=2")
+    assert resp.status == 200
+    assert resp.body == b"a=1&b=2"
+
+
+def test_redirect_followed_for_get(server):
+    resp = transport.request("GET", f"{server}/redirect")
+    assert resp.body == b"GET /ok"
+
+
+def test_error_status_raises(server):
+    with pytest.raises(transport.HTTPStatusError) as exc_info:
+        transport.request("GET", f"{server}/missing")
+
+    assert exc_info.value.status == 404
+    assert exc_info.value.body == b"not here"
+
+
+def test_get_retries_on_503(server, monkeypatch):
+    monkeypatch.setattr(transport.time, "sleep", lambda _: None)
+    _Handler.flaky_remaining = 1
+
+    resp = transport.request("GET", f"{server}/flaky")
+    assert resp.body == b"recovered"
+
+
+def test_stream_partial_read_closes_connection(server):
+    with transport.stream("GET", f"{server}/item/1") as resp:
+        resp.read(1)
+
+    transport.request("GET", f"{server}/item/2")
+    assert _stats(server)["opened"] == 2
+
+
+def test_stale_pooled_connection_is_replaced(server):
+    transport.request("GET", f"{server}/bye")
+    # As after an idle timeout: the close has reached us before the reuse.
+    _wait_for_server_close()
+
+    resp = transport.request("POST", f"{server}/echo", body=b"payload")
+    assert resp.body == b"payload"
+    assert _stats(server)["opened"] == 2
+
+
+def test_post_not_resent_after_connection_drops(server):
+    _Handler.dropped_posts = 0
+    transport.request("GET", f"{server}/item/1")
+
+    with pytest.raises(ConnectionError):
+        transport.request("POST", f"{server}/drop", body=b"publish")
+    assert _Handler.dropped_posts == 1
+
+
+def test_unsupported_scheme():
+    with pytest.raises(ValueError):
+        transport.request("GET", "ftp://example.com/file")